@@ -0,0 +1,309 @@
+"""
+Representação vetorizada da população do GGA.
+
+Em vez de cada indivíduo ser uma lista de objetos `Container`, a população
+inteira vive em dois arrays NumPy:
+
+- `assignment` (população x itens): índice do bin de cada item.
+- `loads` (população x bins): carga acumulada de cada bin.
+
+O fitness, a seleção e os operadores de mutação trabalham diretamente sobre
+esses arrays, evitando a cópia de contêineres a cada geração. O custo de cada
+operador é O(n log n) no número de itens (o cruzamento reinsere os itens com o
+núcleo de empacotamento), e a memória é O(população x itens), o que permite usar
+esta representação no modo de instâncias grandes do GGA.
+"""
+
+import numpy as np
+from models.container import Container
+from algorithms.fitness import batch_fitness
+from algorithms.packing import pack
+
+
+class ArrayPopulation:
+
+    def __init__(self, weights, capacity, population_size):
+        """
+        Inicializa uma população vazia (todos os itens no bin 0).
+
+        Args:
+            weights (list): Lista de pesos dos itens.
+            capacity (int): Capacidade de cada bin.
+            population_size (int): Número de indivíduos da população.
+        """
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.capacity = int(capacity)
+        self.num_items = len(self.weights)
+        # Nunca são necessários mais bins do que itens
+        self.max_bins = max(self.num_items, 1)
+        self.assignment = np.zeros((population_size, self.num_items), dtype=np.int32)
+        # Cargas em 32 bits sempre que a capacidade permitir (metade da memória)
+        load_dtype = np.int32 if self.capacity < 2 ** 31 else np.int64
+        self.loads = np.zeros((population_size, self.max_bins), dtype=load_dtype)
+        # Itens ordenados por peso, calculados uma única vez (ver `encode`)
+        self._weight_order = None
+
+    @property
+    def size(self):
+        return self.assignment.shape[0]
+
+    @classmethod
+    def from_solutions(cls, solutions, weights, capacity):
+        """
+        Cria uma população a partir de soluções representadas como listas de contêineres.
+
+        Args:
+            solutions (list): Lista de soluções (listas de `Container`).
+            weights (list): Lista de pesos dos itens da instância.
+            capacity (int): Capacidade de cada bin.
+
+        Returns:
+            ArrayPopulation: A população codificada em arrays.
+        """
+        population = cls(weights, capacity, len(solutions))
+        for row, solution in enumerate(solutions):
+            population.encode(row, solution)
+        return population
+
+    @classmethod
+    def from_assignment(cls, weights, capacity, assignment, population_size):
+        """
+        Cria uma população em que todos os indivíduos têm a mesma atribuição de itens a bins,
+        sem passar por objetos `Container`.
+
+        Args:
+            weights (list): Lista de pesos dos itens da instância.
+            capacity (int): Capacidade de cada bin.
+            assignment (np.ndarray): Índice do bin de cada item (ex.: o resultado de `pack`).
+            population_size (int): Número de indivíduos.
+
+        Returns:
+            ArrayPopulation: A população codificada em arrays.
+        """
+        population = cls(weights, capacity, population_size)
+        population.assignment[:] = assignment
+        population.loads[:] = np.bincount(assignment, weights=population.weights,
+                                          minlength=population.max_bins).astype(population.loads.dtype)
+        return population
+
+    def encode(self, row, solution):
+        """
+        Codifica uma solução (lista de contêineres) na linha `row` da população.
+
+        Como os contêineres armazenam apenas tamanhos, os itens de cada peso são associados
+        aos elementos desse peso na ordem dos índices: os elementos da solução e os itens da
+        instância são ordenados por peso e pareados, em O(n log n) sem laço por item.
+        """
+        lengths = [len(container.counts) for container in solution]
+        sizes = np.fromiter((size for container in solution for size in container.counts),
+                            dtype=np.int64, count=sum(lengths))
+        counts = np.fromiter((count for container in solution for count in container.counts.values()),
+                             dtype=np.int64, count=len(sizes))
+        item_sizes = np.repeat(sizes, counts)
+        item_bins = np.repeat(np.repeat(np.arange(len(solution), dtype=np.int32), lengths), counts)
+
+        by_size = np.argsort(item_sizes, kind='stable')
+        order = self.weight_order()
+        if not np.array_equal(item_sizes[by_size], self.weights[order]):
+            raise ValueError("A solução não contém exatamente os itens da instância")
+        self.assignment[row, order] = item_bins[by_size]
+        self.loads[row].fill(0)
+        self.loads[row, :len(solution)] = [container.used for container in solution]
+
+    def weight_order(self):
+        """
+        Índices dos itens ordenados por peso, calculados uma vez por instância.
+
+        As populações derivadas por `take` compartilham o mesmo array; `encode` apenas o lê.
+        """
+        if self._weight_order is None:
+            self._weight_order = np.argsort(self.weights, kind='stable')
+        return self._weight_order
+
+    def decode(self, row):
+        """
+        Converte a linha `row` da população em uma lista de contêineres não vazios.
+
+        Returns:
+            list: Lista de `Container` na ordem dos índices de bin.
+        """
+        assignment = self.assignment[row]
+        order = np.lexsort((self.weights, assignment))
+        bins = assignment[order]
+        sizes = self.weights[order]
+        if not len(bins):
+            return []
+
+        # Um bloco por par (bin, tamanho): os itens entram nos contêineres por tipo
+        bin_starts = np.flatnonzero(np.diff(bins)) + 1
+        starts = np.concatenate(([0], np.flatnonzero((np.diff(bins) != 0) | (np.diff(sizes) != 0)) + 1))
+        counts = np.diff(np.append(starts, len(bins)))
+        containers = np.searchsorted(bin_starts, starts, side='right')
+
+        solution = [Container(self.capacity) for _ in range(len(bin_starts) + 1)]
+        for index, size, count in zip(containers.tolist(), sizes[starts].tolist(), counts.tolist()):
+            solution[index].add_elements(size, count)
+        return solution
+
+    def take(self, rows):
+        """
+        Retorna uma nova população formada pelas linhas selecionadas (copiadas).
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        population = ArrayPopulation.__new__(ArrayPopulation)
+        population.weights = self.weights
+        population.capacity = self.capacity
+        population.num_items = self.num_items
+        population.max_bins = self.max_bins
+        population.assignment = self.assignment[rows]
+        population.loads = self.loads[rows]
+        population._weight_order = self._weight_order
+        return population
+
+    def recompute_loads(self):
+        """
+        Recalcula as cargas de todos os bins de todos os indivíduos em uma única chamada.
+        """
+        pop_size = self.size
+        offsets = (np.arange(pop_size, dtype=np.int64) * self.max_bins)[:, None]
+        flat = (self.assignment + offsets).ravel()
+        self.loads = np.bincount(flat, weights=np.tile(self.weights, pop_size),
+                                 minlength=pop_size * self.max_bins
+                                 ).astype(self.loads.dtype).reshape(pop_size, self.max_bins)
+
+    def num_bins(self):
+        return np.count_nonzero(self.loads, axis=1)
+
+    def load_profile_diversity(self):
+        """
+        Estima a diversidade da população sem decodificar os indivíduos: fração de perfis de
+        carga (multiconjunto das cargas dos bins) distintos.
+
+        Indivíduos com o mesmo empacotamento têm sempre o mesmo perfil, mas empacotamentos
+        diferentes podem coincidir, então o valor é um limite inferior de `GGA.population_diversity`.
+        """
+        profiles = np.sort(self.loads, axis=1)
+        return len({profile.tobytes() for profile in profiles}) / self.size
+
+    def fitness(self):
+        """
+        Calcula o fitness de todos os indivíduos, equivalente a `GGA.fitness`.
+
+        Returns:
+            np.ndarray: Array com o fitness de cada indivíduo (menor é melhor).
+        """
+        return batch_fitness(self.loads, self.capacity)
+
+# -------------------------------- Seleção -------------------------------- #
+
+    def stoic_tournament_selection(self, fitnesses, count, rng, tournament_size=3):
+        """
+        Seleção por torneio estoico vetorizada: retorna `count` índices de indivíduos.
+
+        Em 75% dos torneios vence o melhor competidor; nos demais, um competidor aleatório.
+        """
+        contenders = rng.integers(0, self.size, size=(count, tournament_size))
+        rows = np.arange(count)
+        best = contenders[rows, np.argmin(fitnesses[contenders], axis=1)]
+        random_pick = contenders[rows, rng.integers(0, tournament_size, size=count)]
+        return np.where(rng.random(count) < 0.75, best, random_pick)
+
+# -------------------------------- Cruzamento -------------------------------- #
+
+    def crossover(self, parent1, parent2, rng):
+        """
+        Gera um filho herdando metade dos bins de `parent1` e reinserindo os itens
+        restantes (em ordem decrescente) com first-fit, na ordem dos bins de `parent2`.
+        A reinserção usa o núcleo de empacotamento (`pack` com os bins herdados já abertos),
+        em O(n log n).
+
+        Args:
+            parent1 (int): Índice do primeiro pai.
+            parent2 (int): Índice do segundo pai.
+            rng (np.random.Generator): Gerador de números aleatórios.
+
+        Returns:
+            tuple: (assignment, loads) do filho.
+        """
+        used_bins = np.flatnonzero(self.loads[parent1])
+        inherited = rng.choice(used_bins, size=(len(used_bins) + 1) // 2, replace=False)
+
+        keep = np.isin(self.assignment[parent1], inherited)
+        assignment = np.full(self.num_items, -1, dtype=np.int32)
+        loads = np.zeros(self.max_bins, dtype=self.loads.dtype)
+
+        # Renumera os bins herdados para 0..k-1
+        inherited.sort()
+        assignment[keep] = np.searchsorted(inherited, self.assignment[parent1][keep])
+
+        free = np.flatnonzero(~keep)
+        free = free[np.lexsort((self.assignment[parent2][free], -self.weights[free]))]
+        bins, child_loads = pack(self.weights[free], self.capacity, 'ffd', presorted=True,
+                                 loads=self.loads[parent1][inherited])
+        assignment[free] = bins
+        loads[:len(child_loads)] = child_loads
+        return assignment, loads
+
+# -------------------------------- Mutação -------------------------------- #
+
+    def mutate_move(self, row, rng):
+        """
+        Mutação de movimentação (equivalente ao bit-flip do GGA): move um item aleatório
+        para outro bin em uso; se não couber, o item vai para um bin vazio.
+        """
+        item = rng.integers(self.num_items)
+        weight = self.weights[item]
+        source = self.assignment[row, item]
+        loads = self.loads[row]
+
+        used_bins = np.flatnonzero(loads)
+        if len(used_bins) < 2:
+            return
+        target = used_bins[rng.integers(len(used_bins))]
+        if target == source:
+            return
+        if loads[target] + weight > self.capacity:
+            if loads[source] == weight:
+                # O item já está sozinho; abrir outro bin não muda nada
+                return
+            target = np.argmin(loads)
+            if loads[target]:
+                # Todos os bins disponíveis estão em uso
+                return
+
+        self._move(row, item, source, target)
+
+    def mutate_swap(self, row, rng):
+        """
+        Mutação de troca: troca dois itens de bins diferentes se ambos os bins comportarem a troca.
+        """
+        item1, item2 = rng.integers(self.num_items, size=2)
+        bin1 = self.assignment[row, item1]
+        bin2 = self.assignment[row, item2]
+        if bin1 == bin2:
+            return
+
+        delta = self.weights[item2] - self.weights[item1]
+        loads = self.loads[row]
+        if loads[bin1] + delta <= self.capacity and loads[bin2] - delta <= self.capacity:
+            self._move(row, item1, bin1, bin2)
+            self._move(row, item2, bin2, bin1)
+
+    def mutate(self, rows, mutation_rate, rng, swap_rate=0.5):
+        """
+        Muta as linhas indicadas com probabilidade `mutation_rate`: cada linha mutada recebe
+        a mutação de troca com probabilidade `swap_rate` e a de movimentação nos demais casos.
+        """
+        rows = np.asarray(rows)[rng.random(len(rows)) < mutation_rate]
+        swaps = rng.random(len(rows)) < swap_rate
+        for row, swap in zip(rows.tolist(), swaps.tolist()):
+            if swap:
+                self.mutate_swap(row, rng)
+            else:
+                self.mutate_move(row, rng)
+
+    def _move(self, row, item, source, target):
+        weight = self.weights[item]
+        self.assignment[row, item] = target
+        self.loads[row, source] -= weight
+        self.loads[row, target] += weight
@@ -0,0 +1,111 @@
+"""
+Cache de soluções para o GGA.
+
+Fornece uma chave canônica para empacotamentos (independente da ordem dos bins
+e dos itens dentro de cada bin) e um cache LRU limitado, usado pelo GGA para
+não reavaliar nem melhorar novamente com a Busca Tabu indivíduos repetidos.
+
+A chave guarda o próprio empacotamento canônico, e não apenas o seu hash: duas
+soluções diferentes com o mesmo hash de 64 bits nunca são confundidas.
+"""
+
+from collections import OrderedDict
+
+
+class PackingKey:
+    """
+    Chave de um empacotamento canônico, com o hash calculado uma única vez.
+
+    A igualdade compara o hash e, se ele coincidir, o empacotamento completo.
+    """
+    __slots__ = ('packing', '_hash')
+
+    def __init__(self, packing):
+        self.packing = packing
+        self._hash = hash(packing)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, PackingKey):
+            return NotImplemented
+        return self._hash == other._hash and self.packing == other.packing
+
+    def __repr__(self):
+        return f"PackingKey({self._hash})"
+
+
+def canonical_key(solution):
+    """
+    Calcula a chave canônica de um empacotamento.
+
+    Cada bin é tratado como um multiconjunto de tamanhos e a solução como um
+    multiconjunto de bins, de modo que permutar bins ou itens não altera a chave.
+
+    Args:
+        solution (list): Lista de contêineres.
+
+    Returns:
+        PackingKey: A chave do empacotamento.
+    """
+    return PackingKey(tuple(sorted(tuple(sorted(container.counts.items())) for container in solution)))
+
+
+def canonical_hash(solution):
+    """
+    Calcula o hash canônico de um empacotamento (o hash de `canonical_key`).
+
+    Args:
+        solution (list): Lista de contêineres.
+
+    Returns:
+        int: O hash do empacotamento.
+    """
+    return hash(canonical_key(solution))
+
+
+class LRUCache:
+    """
+    Cache com política LRU (menos recentemente usado) e contadores de acertos/falhas.
+
+    Com `maxsize` menor ou igual a zero o cache fica desabilitado: nada é armazenado e
+    todas as consultas contam como falha.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default=None):
+        """Retorna o valor associado a `key` (marcando-o como recente) ou `default`."""
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Armazena `value`, descartando a entrada menos recentemente usada se necessário."""
+        if self.maxsize <= 0:
+            return
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,181 @@
+from bisect import bisect_right, insort
+from collections import Counter
+import numpy as np
+from models.container import Container
+
+
+class DominanceLocalSearch:
+    def __init__(self, gga, removed_bins=3, max_rounds=10):
+        """
+        Inicializa a busca local por dominância (substituição de Martello–Toth / Falkenauer).
+
+        Cada rodada esvazia os `removed_bins` contêineres menos cheios, cujos itens passam a
+        ser itens livres, e tenta encher melhor cada um dos demais contêineres trocando itens
+        do contêiner por itens livres maiores: dois por dois, dois por um e um por um. Pela
+        regra de dominância, um contêiner com itens maiores (e no máximo o mesmo número deles)
+        é sempre pelo menos tão útil quanto o original, e os itens devolvidos ao conjunto livre
+        são menores e mais fáceis de reinserir. Ao final da rodada os itens livres restantes são
+        reinseridos com First-Fit Decreasing.
+
+        Args:
+            gga (object): O objeto do algoritmo genético (capacidade, fitness e limitante inferior).
+            removed_bins (int, opcional): Contêineres esvaziados a cada rodada. Padrão é 3.
+            max_rounds (int, opcional): Número máximo de rodadas. Padrão é 10.
+        """
+        self.gga = gga
+        self.capacity = gga.container_capacity
+        self.removed_bins = removed_bins
+        self.max_rounds = max_rounds
+        # Total de trocas realizadas (usado pelo benchmark)
+        self.exchanges = 0
+
+    def search(self, solution):
+        """
+        Aplica rodadas de substituição enquanto a solução melhora.
+
+        Uma rodada é aceita quando usa menos contêineres ou, com o mesmo número, deixa os
+        contêineres mais cheios (maior soma dos quadrados das cargas, o critério de Falkenauer).
+        A busca para quando uma rodada não é aceita, o número máximo de rodadas é atingido
+        ou a solução atinge o limitante inferior do GGA.
+
+        Args:
+            solution (list): A solução inicial.
+
+        Returns:
+            list: A melhor solução encontrada (a própria `solution` se nenhuma rodada for aceita).
+        """
+        best_solution = solution
+        best_key = self._quality(solution)
+        for _ in range(self.max_rounds):
+            if self.gga.reached_lower_bound(self.gga.fitness(best_solution)):
+                break
+            candidate = self.replacement_round(best_solution)
+            key = self._quality(candidate)
+            if key <= best_key:
+                break
+            best_solution, best_key = candidate, key
+        return best_solution
+
+    def replacement_round(self, solution):
+        """
+        Executa uma rodada: esvazia os contêineres menos cheios, aplica as trocas por dominância
+        em cada contêiner restante e reinsere os itens livres.
+
+        Args:
+            solution (list): A solução atual (não é alterada).
+
+        Returns:
+            list: A nova solução. Os contêineres sem trocas são compartilhados com `solution`.
+        """
+        order = sorted(range(len(solution)), key=lambda index: solution[index].used)
+        removed = set(order[:self.removed_bins])
+        free = sorted(size for index in removed
+                      for size, count in solution[index].counts.items() for _ in range(count))
+        bins = [container for index, container in enumerate(solution) if index not in removed]
+
+        for index, container in enumerate(bins):
+            if not free:
+                break
+            improved = self._improve_container(container, free)
+            if improved is not None:
+                bins[index] = improved
+
+        return self.gga.reinsert_items(bins, np.array(free[::-1], dtype=np.int64))
+
+    def _improve_container(self, container, free):
+        """
+        Troca itens do contêiner por itens livres maiores enquanto houver troca possível.
+
+        `free` (lista ordenada de tamanhos) é atualizada no lugar.
+
+        Returns:
+            Container: O novo contêiner, ou None se nenhuma troca foi feita.
+        """
+        items = sorted(container.elements)
+        used = container.used
+        changed = False
+        while True:
+            exchange = self._find_exchange(items, self.capacity - used, free)
+            if exchange is None:
+                break
+            taken, given = exchange
+            for size in taken:
+                items.remove(size)
+                insort(free, size)
+            for size in given:
+                free.pop(bisect_right(free, size) - 1)
+                insort(items, size)
+            used += sum(given) - sum(taken)
+            self.exchanges += 1
+            changed = True
+
+        if not changed:
+            return None
+        improved = Container(self.capacity)
+        for size, count in Counter(items).items():
+            improved.add_elements(size, count)
+        return improved
+
+    def _find_exchange(self, items, residual, free):
+        """
+        Procura a troca que mais enche o contêiner, na ordem dois por dois, dois por um e um por um.
+
+        Args:
+            items (list): Tamanhos dos itens do contêiner, em ordem crescente.
+            residual (int): Espaço restante no contêiner.
+            free (list): Tamanhos dos itens livres, em ordem crescente.
+
+        Returns:
+            tuple: (itens retirados do contêiner, itens livres colocados), ou None.
+        """
+        pairs = {(items[i], items[j]) for i in range(len(items)) for j in range(i + 1, len(items))}
+
+        best = None
+        for pair in pairs:
+            total = pair[0] + pair[1]
+            given = _best_pair(free, total, total + residual)
+            if given is not None and (best is None or sum(given) - total > best[0]):
+                best = (sum(given) - total, pair, given)
+        if best is not None:
+            return best[1], best[2]
+
+        for pair in pairs:
+            total = pair[0] + pair[1]
+            size = _largest_at_most(free, total + residual)
+            if size is not None and size > total and (best is None or size - total > best[0]):
+                best = (size - total, pair, (size,))
+        if best is not None:
+            return best[1], best[2]
+
+        for item in set(items):
+            size = _largest_at_most(free, item + residual)
+            if size is not None and size > item and (best is None or size - item > best[0]):
+                best = (size - item, (item,), (size,))
+        if best is not None:
+            return best[1], best[2]
+        return None
+
+    def _quality(self, solution):
+        # Menos contêineres e, em caso de empate, contêineres mais cheios
+        return (-len(solution), sum(container.used ** 2 for container in solution))
+
+
+def _largest_at_most(free, limit):
+    # Maior tamanho livre <= limit (busca binária na lista ordenada)
+    position = bisect_right(free, limit)
+    return free[position - 1] if position else None
+
+
+def _best_pair(free, low, high):
+    # Dois itens livres com soma em (low, high], a maior possível (dois ponteiros em O(len(free)))
+    best = None
+    i, j = 0, len(free) - 1
+    while i < j:
+        total = free[i] + free[j]
+        if total > high:
+            j -= 1
+        else:
+            if total > low and (best is None or total > best[0] + best[1]):
+                best = (free[i], free[j])
+            i += 1
+    return best
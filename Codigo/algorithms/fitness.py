@@ -0,0 +1,57 @@
+"""
+Avaliação vetorizada de fitness para o problema de Bin Packing.
+
+O fitness de uma solução é o número de bins usados somado ao espaço
+desperdiçado normalizado pela capacidade (menor é melhor). As funções deste
+módulo avaliam uma população inteira (ou um lote de vizinhos da Busca Tabu)
+em uma única chamada sobre uma matriz de cargas por bin.
+"""
+
+import numpy as np
+
+
+def batch_fitness(loads, capacity, num_bins=None):
+    """
+    Calcula o fitness de várias soluções de uma só vez.
+
+    Args:
+        loads (np.ndarray): Matriz (soluções x bins) com a carga de cada bin,
+            preenchida com zeros à direita quando as soluções têm tamanhos diferentes.
+        capacity (int): Capacidade de cada bin.
+        num_bins (np.ndarray, opcional): Número de bins de cada solução. Se None,
+            conta os bins com carga diferente de zero.
+
+    Returns:
+        np.ndarray: Array com o fitness de cada solução.
+    """
+    loads = np.asarray(loads)
+    if num_bins is None:
+        num_bins = np.count_nonzero(loads, axis=1)
+    total_waste = num_bins * capacity - loads.sum(axis=1)
+    return num_bins + total_waste / capacity
+
+
+def solutions_to_loads(solutions):
+    """
+    Converte uma lista de soluções (listas de `Container`) em uma matriz de cargas.
+
+    Args:
+        solutions (list): Lista de soluções.
+
+    Returns:
+        tuple: (loads, num_bins), onde `loads` é a matriz (soluções x bins) preenchida
+            com zeros e `num_bins` é o número de contêineres de cada solução.
+    """
+    num_bins = np.fromiter((len(solution) for solution in solutions),
+                           dtype=np.int64, count=len(solutions))
+    total = int(num_bins.sum())
+    used = np.fromiter((container.used for solution in solutions for container in solution),
+                       dtype=np.int64, count=total)
+
+    rows = np.repeat(np.arange(len(solutions)), num_bins)
+    starts = np.cumsum(num_bins) - num_bins
+    cols = np.arange(total) - np.repeat(starts, num_bins)
+
+    loads = np.zeros((len(solutions), int(num_bins.max(initial=0))), dtype=np.int64)
+    loads[rows, cols] = used
+    return loads, num_bins
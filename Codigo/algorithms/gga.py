@@ -1,10 +1,22 @@
 import random
+import time
 import numpy as np
-from copy import deepcopy
 from collections import Counter
-import bisect
 from models.container import Container
+from models.solution import Solution
 from algorithms.tabu_search import Tabu_Search
+from algorithms.dominance_search import DominanceLocalSearch
+from algorithms.array_population import ArrayPopulation
+from algorithms.fitness import batch_fitness, solutions_to_loads
+from algorithms.packing import pack
+from algorithms.item_types import (solution_runs, type_counts, runs_length, slice_runs, take_runs,
+                                   replace_surplus, expand_runs)
+from algorithms.cache import LRUCache, canonical_key
+from algorithms.lower_bounds import l2_bound
+from algorithms.parallel_tabu import TabuWorkerPool
+from algorithms.operator_selection import AdaptiveOperatorSelector
+from utils.rng import derive_seed, make_rng
+from utils.instrumentation import PhaseTimers
 import sys
 import os
 
@@ -15,6 +27,20 @@ from config import GGA_CONFIG, TABU_CONFIG
 
 class GGA:
 
+    # Operadores disponíveis para a seleção adaptativa (nome -> método)
+    CROSSOVER_OPERATORS = {
+        'multi_point': 'multi_point_crossover',
+        'single_point': 'single_point_crossover',
+        'pmx': 'pmx_crossover',
+        'bpcx': 'bpcx_crossover',
+    }
+    MUTATION_OPERATORS = {
+        'bitflip': '_bitflip_Mutation',
+        'swap': '_swap_Mutation',
+        'insertion': '_insertion_Mutation',
+        'gaussian': '_gausian_Mutation',
+    }
+
     def __init__(self, elements):
         """
         Inicializa o algoritmo genético para o problema de bin packing.
@@ -23,6 +49,9 @@ class GGA:
             elements (dict): Um dicionário contendo os seguintes campos:
                 - 'weights' (list): Lista de pesos dos itens.
                 - 'bin_capacity' (int): Capacidade de cada bin.
+                - 'seed' (int, opcional): Semente dos geradores aleatórios. Com a mesma semente,
+                  duas execuções produzem a mesma solução e o mesmo histórico. Se None, usa o
+                  módulo `random` global e um gerador NumPy com entropia do sistema.
 
         O algoritmo utiliza os parâmetros definidos no módulo de configuração (config.py),
         mas permite que sejam especificados valores personalizados durante a inicialização.
@@ -37,53 +66,161 @@ class GGA:
         self.tournament_size = elements.get('tournament_size', GGA_CONFIG['selection_tournament_size'])
         self.mutation_rate = elements.get('mutation_rate', GGA_CONFIG['mutation_rate'])
         self.elite_rating = elements.get('elite_rating', GGA_CONFIG['elite_size'] / GGA_CONFIG['population_size'])
+        self.population_engine = elements.get('population_engine', GGA_CONFIG['population_engine'])
+        self.packing_heuristic = elements.get('packing_heuristic', GGA_CONFIG['packing_heuristic'])
+        self.decoder = elements.get('decoder', GGA_CONFIG['decoder'])
+        self.decoder_size_classes = elements.get('decoder_size_classes', GGA_CONFIG['decoder_size_classes'])
+
+        # Limitante inferior (L2) e fitness de uma solução que o atinge: como o desperdício total
+        # só depende do número de bins, essa solução é ótima e a busca pode parar nela
+        self.stop_at_lower_bound = elements.get('stop_at_lower_bound', GGA_CONFIG['stop_at_lower_bound'])
+        self.lower_bound = l2_bound(self.elements, self.container_capacity) if self.container_capacity else 0
+        if self.stop_at_lower_bound and len(self.elements):
+            self.target_fitness = 2 * self.lower_bound - int(np.sum(self.elements)) / self.container_capacity
+        else:
+            self.target_fitness = float('-inf')
+
+        # Geradores aleatórios: `random` para os operadores sobre listas e `rng` (NumPy) para os
+        # operadores vetorizados, derivados de fluxos independentes da mesma semente
+        self.seed = elements.get('seed', GGA_CONFIG['seed'])
+        self.random = random if self.seed is None else random.Random(derive_seed(self.seed, 0))
+        self.rng = make_rng(self.seed, 1)
+
+        # Seleção adaptativa dos operadores de cruzamento e mutação. O crédito de cada aplicação
+        # é a melhoria por segundo de CPU; com semente, cada aplicação custa uma unidade, para
+        # que a escolha dos operadores (e portanto a execução) continue reprodutível
+        self.adaptive_operators = elements.get('adaptive_operators', GGA_CONFIG['adaptive_operators'])
+        crossovers = elements.get('crossover_operators', GGA_CONFIG['crossover_operators'])
+        mutations = elements.get('mutation_operators', GGA_CONFIG['mutation_operators'])
+        for name in crossovers:
+            if name not in self.CROSSOVER_OPERATORS:
+                raise ValueError(f"Operador de cruzamento desconhecido: {name}")
+        for name in mutations:
+            if name not in self.MUTATION_OPERATORS:
+                raise ValueError(f"Operador de mutação desconhecido: {name}")
+        window = elements.get('operator_window', GGA_CONFIG['operator_window'])
+        exploration = elements.get('operator_exploration', GGA_CONFIG['operator_exploration'])
+        self.crossover_selector = AdaptiveOperatorSelector(crossovers, window, exploration)
+        self.mutation_selector = AdaptiveOperatorSelector(mutations, window, exploration)
+        credit = elements.get('operator_credit', GGA_CONFIG['operator_credit'])
+        if credit is None:
+            credit = 'cpu_time' if self.seed is None else 'applications'
+        if credit not in ('cpu_time', 'applications'):
+            raise ValueError(f"Crédito de operadores desconhecido: {credit}")
+        self.operator_clock = time.process_time if credit == 'cpu_time' else None
 
         # Parâmetros da Tabu Search usando a configuração
         self.tabu_max_iterations = elements.get('tabu_max_iterations', TABU_CONFIG['max_iterations'])
         self.tabu_tenure = elements.get('tabu_tenure', TABU_CONFIG['tabu_list_size'])
         self.tabu_max_neighbors = elements.get('tabu_max_neighbors', TABU_CONFIG['neighborhood_size'])
+        self.tabu_workers = elements.get('tabu_workers', TABU_CONFIG['workers'])
+        self.elite_tabu = True
+
+        # Melhoria da elite: Busca Tabu, busca local por dominância ou a dominância seguida da Tabu
+        self.elite_search = elements.get('elite_search', GGA_CONFIG['elite_search'])
+        if self.elite_search not in ('tabu', 'dominance', 'dominance_tabu'):
+            raise ValueError(f"Busca da elite desconhecida: {self.elite_search}")
+        self.dominance_removed_bins = elements.get('dominance_removed_bins', GGA_CONFIG['dominance_removed_bins'])
+        self.dominance_max_rounds = elements.get('dominance_max_rounds', GGA_CONFIG['dominance_max_rounds'])
+        # Total de trocas feitas pela busca por dominância
+        self.dominance_exchanges = 0
+
+        # Orçamento de tempo (segundos de relógio): para a execução inteira e para cada Busca Tabu
+        self.time_limit = elements.get('time_limit', GGA_CONFIG['time_limit'])
+        self.tabu_time_limit = elements.get('tabu_time_limit', TABU_CONFIG['time_limit'])
+        self.start_time = None
+        # População e índice da melhor solução da última geração avaliada (ver `current_best`)
+        self._best = None
+        # Chave canônica de cada indivíduo da população, quando já calculada (ver `create_new_population`)
+        self.population_keys = None
+        self._tabu_pool = None
+
+        # Modo de instâncias grandes: apenas a população vetorizada (sem objetos por item), com
+        # população limitada (memória O(população x itens)) e sem a Busca Tabu da elite, cujo
+        # custo por iteração é proporcional ao número de bins
+        threshold = elements.get('large_instance_threshold', GGA_CONFIG['large_instance_threshold'])
+        self.large_instance = len(self.elements) >= threshold
+        if self.large_instance:
+            self.population_engine = 'array'
+            self.population_size = min(self.population_size, elements.get(
+                'large_instance_population_size', GGA_CONFIG['large_instance_population_size']))
+            self.elite_tabu = elements.get('large_instance_tabu', GGA_CONFIG['large_instance_tabu'])
+        # A população vetorizada usa o array da instância diretamente (sem cópia quando ele já é
+        # int64, como o .npy mapeado em memória de `create_data(as_array=True)`); a população de
+        # objetos trabalha com uma lista de inteiros
+        if self.population_engine == 'array':
+            self.elements = np.asarray(self.elements, dtype=np.int64)
+        elif isinstance(self.elements, np.ndarray):
+            self.elements = self.elements.tolist()
+        # Quantidade de itens de cada tamanho, calculada uma vez (usada pelos cruzamentos por tipo)
+        sizes, counts = np.unique(np.asarray(self.elements, dtype=np.int64), return_counts=True)
+        self.item_counts = dict(zip(sizes.tolist(), counts.tolist()))
+        # Total de vizinhos avaliados pela Busca Tabu da elite (sequencial ou no pool)
+        self.tabu_neighbors_evaluated = 0
+
+        # Canal de migração do modelo de ilhas (ver algorithms/island.py); None fora dele
+        self.migration = None
+
+        # Caches indexados pela chave canônica do empacotamento
+        cache_size = elements.get('cache_size', GGA_CONFIG['cache_size'])
+        self.fitness_cache = LRUCache(cache_size)
+        self.tabu_cache = LRUCache(cache_size)
 
         # Histórico de evolução para visualização
         self.history = {
             'best_fitness': [],
             'avg_fitness': [],
-            'generation': []
+            'generation': [],
+            'diversity': [],
+            'cache_hits': [],
+            'cache_misses': [],
+            'operator_usage': [],
+            'operator_success_rate': [],
+            'generation_time': [],
+            'phase_times': [],
+            'phase_counts': []
         }
 
-    def generate_initial_solution(self, elements=None):
+        # Instrumentação por fase (tempos e contadores por geração em `history`); desligada,
+        # nenhum método é envolvido e o custo é zero
+        self.instrumentation = None
+        if elements.get('instrumentation', GGA_CONFIG['instrumentation']):
+            self.instrumentation = PhaseTimers()
+            self._instrument_phases()
+
+    def generate_initial_solution(self, elements=None, presorted=False):
+        """
+        Gera uma solução com a heurística construtiva configurada (`packing_heuristic`).
+
+        Args:
+            elements (list, opcional): Elementos a empacotar. Se None, usa os elementos da instância.
+            presorted (bool, opcional): Se True, empacota os elementos na ordem recebida em vez
+                de ordená-los de forma decrescente.
+
+        Returns:
+            list: Lista de contêineres com os elementos empacotados.
+        """
         if elements is None:
             elements = self.elements
-        # Ordenar em ordem decrescente
-        elements = [e for e in elements if e is not None]
-        sorted_elements = sorted(elements, reverse=True)
-        # Listas para armazenar os contêineres e seus espaços restantes
-        containers = []
-        remaining_spaces = []
-        for element in sorted_elements:
-            # Encontrar o índice do primeiro contêiner que pode acomodar o elemento
-            index = bisect.bisect_left(remaining_spaces, element)
-            if index < len(remaining_spaces):
-                # Contêiner encontrado
-                container = containers[index]
-                container.add_element(element)
-                # Atualizar o espaço restante
-                rem_space = container.remaining_space()
-                # Remover o contêiner e seu espaço das listas
-                del remaining_spaces[index]
-                del containers[index]
-                # Inserir novamente na posição correta para manter a lista ordenada
-                insert_index = bisect.bisect_left(remaining_spaces, rem_space)
-                remaining_spaces.insert(insert_index, rem_space)
-                containers.insert(insert_index, container)
-            else:
-                # Nenhum contêiner adequado encontrado, criar um novo
-                new_container = Container(self.container_capacity)
-                new_container.add_element(element)
-                rem_space = new_container.remaining_space()
-                # Inserir o novo contêiner na posição correta
-                insert_index = bisect.bisect_left(remaining_spaces, rem_space)
-                remaining_spaces.insert(insert_index, rem_space)
-                containers.insert(insert_index, new_container)
+        if isinstance(elements, np.ndarray):
+            elements = elements.astype(np.int64, copy=False)
+        else:
+            elements = np.asarray([e for e in elements if e is not None], dtype=np.int64)
+        assignment, loads = pack(elements, self.container_capacity, self.packing_heuristic,
+                                 presorted=presorted)
+
+        containers = [Container(self.container_capacity) for _ in range(len(loads))]
+        if not len(elements):
+            return containers
+        # Os itens são adicionados por tipo: uma chamada por bloco de itens iguais consecutivos
+        # de um mesmo bin (mantendo a ordem de empacotamento dentro de cada bin)
+        order = np.argsort(assignment, kind='stable')
+        bins = assignment[order]
+        sizes = elements[order]
+        starts = np.concatenate(([0], np.flatnonzero((np.diff(bins) != 0) | (np.diff(sizes) != 0)) + 1))
+        counts = np.diff(np.append(starts, len(elements)))
+        for index, size, count in zip(bins[starts].tolist(), sizes[starts].tolist(), counts.tolist()):
+            containers[index].add_elements(size, count)
         return containers
 
     def fitness(self, solution):
@@ -96,6 +233,63 @@ class GGA:
                           for container in solution)
         return len(solution) + (total_waste / self.container_capacity)
 
+    def reached_lower_bound(self, fitness):
+        """Indica se uma solução com este fitness usa o número mínimo de bins (limitante L2)."""
+        return fitness <= self.target_fitness + 1e-6
+
+    def evaluate_population(self, population):
+        """
+        Avalia o fitness de uma população inteira em uma única chamada vetorizada.
+
+        Args:
+            population (list): Lista de soluções (listas de contêineres).
+
+        Returns:
+            np.ndarray: Array com o fitness de cada solução, na mesma ordem da população.
+        """
+        if not population:
+            return np.empty(0)
+        loads, num_bins = solutions_to_loads(population)
+        return batch_fitness(loads, self.container_capacity, num_bins)
+
+    def evaluate_population_cached(self, population, keys):
+        """
+        Avalia a população consultando primeiro o cache de fitness.
+
+        Apenas os empacotamentos ainda não vistos (um por chave, mesmo que repetidos na
+        população) são avaliados, em uma única chamada a `evaluate_population`.
+
+        Args:
+            population (list): Lista de soluções.
+            keys (list): Chave canônica (`canonical_key`) de cada solução.
+
+        Returns:
+            np.ndarray: Array com o fitness de cada solução.
+        """
+        fitnesses = np.empty(len(population))
+        pending = {}
+        for index, key in enumerate(keys):
+            if key in pending:
+                # Repetido dentro da própria população: também não é reavaliado (e conta como
+                # acerto apenas com o cache habilitado)
+                pending[key].append(index)
+                if self.fitness_cache.maxsize > 0:
+                    self.fitness_cache.hits += 1
+                continue
+            cached = self.fitness_cache.get(key)
+            if cached is None:
+                pending.setdefault(key, []).append(index)
+            else:
+                fitnesses[index] = cached
+
+        if pending:
+            first_indices = [indices[0] for indices in pending.values()]
+            values = self.evaluate_population([population[i] for i in first_indices])
+            for (key, indices), value in zip(pending.items(), values.tolist()):
+                fitnesses[indices] = value
+                self.fitness_cache.put(key, value)
+        return fitnesses
+
 
 # -------------------------------- Metodos de Seleção -------------------------------- #
 
@@ -103,20 +297,23 @@ class GGA:
 
 
     def tournament_selection(self, population, fitnesses, tournament_size=3):
-        selected = random.sample(
-            list(zip(population, fitnesses)), tournament_size)
-        selected.sort(key=lambda x: x[1])  # Ordenar em ordem crescente
-        return selected[0][0]
+        # Sorteia apenas índices; o fitness já foi calculado uma vez para a geração
+        selected = self.random.sample(range(len(population)), tournament_size)
+        best_index = min(selected, key=fitnesses.__getitem__)
+        return population[best_index]
 
     def stoic_tournament_selection(self, population, fitnesses, tournament_size=3):
-        selected = random.sample(
-            list(zip(population, fitnesses)), tournament_size)
+        return population[self.stoic_tournament_index(fitnesses, tournament_size)]
+
+    def stoic_tournament_index(self, fitnesses, tournament_size=3):
+        # Índice do selecionado, para que o fitness dele seja lido de `fitnesses`
+        selected = self.random.sample(range(len(fitnesses)), tournament_size)
         # Selecionar o mínimo
-        best_individual = min(selected, key=lambda x: x[1])
-        if random.random() < 0.75:
-            return best_individual[0]
+        best_index = min(selected, key=fitnesses.__getitem__)
+        if self.random.random() < 0.75:
+            return best_index
         else:
-            return random.choice(selected)[0]
+            return self.random.choice(selected)
 
     def roulette_wheel_selection(self, population, fitnesses):
         # Converter fitnesses para um array NumPy
@@ -134,7 +331,7 @@ class GGA:
         cumulative_probabilities = np.cumsum(probabilities)
 
         # Gerar um número aleatório e encontrar o indivíduo correspondente
-        r = np.random.rand()
+        r = self.rng.random()
         index = np.searchsorted(cumulative_probabilities, r)
         return population[index]
 
@@ -159,81 +356,54 @@ class GGA:
         Returns:
             tuple: A tuple containing two offspring solutions, each represented as a list of containers.
         """
-        # Coleta todos os elementos dos dois pais
-        elements1 = [
-            element for container in parent1 for element in container.elements]
-        elements2 = [
-            element for container in parent2 for element in container.elements]
+        # Sequência de itens de cada pai como blocos (tamanho, quantidade), sem um valor por item
+        runs1 = solution_runs(parent1)
+        runs2 = solution_runs(parent2)
 
-        # Divide os elementos em dois grupos para criar dois filhos
-        midpoint = len(elements1) // 2
-        child1_elements = elements1[:midpoint] + elements2[midpoint:]
-        child2_elements = elements2[:midpoint] + elements1[midpoint:]
+        # Cada filho herda a primeira metade de um pai e completa com os itens restantes
+        # na ordem em que aparecem no outro pai (os itens se repetem, então a segunda
+        # metade do outro pai não pode ser copiada diretamente)
+        midpoint = runs_length(runs1) // 2
+        child1_runs = self._complete_with(slice_runs(runs1, 0, midpoint), runs2)
+        child2_runs = self._complete_with(slice_runs(runs2, 0, midpoint), runs1)
 
         # Gera dois filhos redistribuindo os elementos entre os contêineres
-        child1 = self.pack_elements(child1_elements)
-        child2 = self.pack_elements(child2_elements)
+        child1 = self.pack_elements(expand_runs(child1_runs))
+        child2 = self.pack_elements(expand_runs(child2_runs))
 
         return child1, child2
 
     # Função de cruzamento divisão Multi-Pontos
     def multi_point_crossover(self, parent1, parent2):
-        elements1 = [
-            element for container in parent1 for element in container.elements]
-        elements2 = [
-            element for container in parent2 for element in container.elements]
+        runs1 = solution_runs(parent1)
+        runs2 = solution_runs(parent2)
 
-        # Verificar se ambos os pais têm os mesmos elementos (e contagens)
-        if sorted(elements1) != sorted(elements2):
+        # Verificar se ambos os pais têm os mesmos elementos (e contagens), comparando as
+        # contagens por tipo de item com as da instância
+        if type_counts(runs1) != self.item_counts or type_counts(runs2) != self.item_counts:
             raise ValueError("Os pais devem conter os mesmos elementos.")
 
-        length = len(elements1)
+        length = runs_length(runs1)
         if length < 2:
             return parent1, parent2
 
         # Escolher dois pontos de cruzamento
-        point1, point2 = sorted(random.sample(range(length), 2))
-
-        # Iniciar filhos com None
-        child1_elements = [None] * length
-        child2_elements = [None] * length
-
-        # Copiar segmento intermediário dos pais para os filhos
-        child1_elements[point1:point2] = elements1[point1:point2]
-        child2_elements[point1:point2] = elements2[point1:point2]
-
-        # Utilizar Counters para rastrear a contagem de elementos
-        child1_counter = Counter(child1_elements[point1:point2])
-        child2_counter = Counter(child2_elements[point1:point2])
-
-        total_counter = Counter(elements1)  # Contagem total de elementos
-
-        # Função para preencher o filho considerando a contagem de elementos
-        def fill_child(child, other_parent, child_counter):
-            length = len(child)
-            current_pos = point2 % length
-            for element in other_parent:
-                total_count = total_counter[element]
-                current_count = child_counter.get(element, 0)
-                if current_count < total_count:
-                    # Encontrar a próxima posição vazia
-                    while child[current_pos] is not None:
-                        current_pos = (current_pos + 1) % length
-                    child[current_pos] = element
-                    child_counter[element] = current_count + 1
-                    current_pos = (current_pos + 1) % length
-
-        # Preencher os filhos utilizando a função corrigida
-        fill_child(child1_elements, elements2, child1_counter)
-        fill_child(child2_elements, elements1, child2_counter)
-
-        # Verificar se não há None nas listas dos filhos
-        assert None not in child1_elements, "child1_elements contém None após o preenchimento."
-        assert None not in child2_elements, "child2_elements contém None após o preenchimento."
+        point1, point2 = sorted(self.random.sample(range(length), 2))
+
+        # Cada filho copia o segmento intermediário de um pai; os itens que faltam são tomados
+        # na ordem do outro pai e ocupam as posições a partir de point2, voltando ao início
+        def make_child(own, other):
+            segment = slice_runs(own, point1, point2)
+            remaining = dict(self.item_counts)
+            for size, count in segment:
+                remaining[size] -= count
+            filler = take_runs(other, remaining)
+            tail = length - point2
+            return slice_runs(filler, tail, length) + segment + slice_runs(filler, 0, tail)
 
         # Gerar filhos redistribuindo os elementos entre os contêineres
-        child1 = self.pack_elements(child1_elements)
-        child2 = self.pack_elements(child2_elements)
+        child1 = self.pack_elements(expand_runs(make_child(runs1, runs2)))
+        child2 = self.pack_elements(expand_runs(make_child(runs2, runs1)))
 
         return child1, child2
 
@@ -243,45 +413,132 @@ class GGA:
         Realiza o cruzamento entre dois pais e garante que os itens não sejam duplicados nos filhos.
         """
 
-        # Coleta todos os itens dos dois pais
-        elements1 = [
-            element for container in parent1 for element in container.elements]
-        elements2 = [
-            element for container in parent2 for element in container.elements]
+        # Coleta os itens dos dois pais como blocos (tamanho, quantidade)
+        runs1 = solution_runs(parent1)
+        runs2 = solution_runs(parent2)
 
         # Verifica se ambos os pais têm o mesmo número de elementos
-        if len(elements1) != len(elements2):
+        length = runs_length(runs1)
+        if length != runs_length(runs2):
             raise ValueError(
                 "Os pais devem conter o mesmo número de elementos.")
+        if length < 2:
+            return parent1, parent2
 
         # Escolhe dois pontos de cruzamento
-        point1, point2 = sorted(random.sample(range(len(elements1)), 2))
+        point1, point2 = sorted(self.random.sample(range(length), 2))
 
-        # Inicializa os filhos como cópias dos pais
-        child1_elements = elements1[:]
-        child2_elements = elements2[:]
+        # Troca os segmentos entre os dois pais e corrige as colisões em ambos os filhos:
+        # cada filho perdeu o segmento original do seu pai
+        child1_runs = self._pmx_fix_collisions(runs1, runs2, point1, point2)
+        child2_runs = self._pmx_fix_collisions(runs2, runs1, point1, point2)
+
+        # Reorganiza os itens para criar os filhos a partir dos elementos ajustados
+        child1 = self.pack_elements(expand_runs(child1_runs))
+        child2 = self.pack_elements(expand_runs(child2_runs))
 
-        # Troca os segmentos entre os dois pais
-        child1_elements[point1:point2], child2_elements[point1:
-                                                        point2] = elements2[point1:point2], elements1[point1:point2]
+        return child1, child2
 
-        # Mapeamento das trocas entre as subsequências para ambos os filhos
-        mapping_1_to_2 = {elements1[i]: elements2[i]
-                          for i in range(point1, point2)}
-        mapping_2_to_1 = {elements2[i]: elements1[i]
-                          for i in range(point1, point2)}
+    def bpcx_crossover(self, parent1, parent2):
+        """
+        Cruzamento por grupos de Falkenauer (BPCX): bins inteiros de um pai são injetados no outro.
 
-        # Corrige as colisões em ambos os filhos com os mapeamentos
-        self._pmx_fix_collisions(
-            child1_elements, mapping_1_to_2, point1, point2)
-        self._pmx_fix_collisions(
-            child2_elements, mapping_2_to_1, point1, point2)
+        Para cada filho, uma faixa de bins de um pai é inserida em uma posição aleatória do outro;
+        os bins do receptor que contêm itens repetidos pelos bins injetados são removidos, e apenas
+        os itens que eles liberam (e que não vieram com os bins injetados) são reinseridos com
+        First-Fit Decreasing nos bins do filho. Os demais bins são herdados intactos e compartilhados
+        com os pais, sem reempacotar seus itens.
 
-        # Reorganiza os itens para criar os filhos a partir dos elementos ajustados
-        child1 = self.pack_elements(child1_elements)
-        child2 = self.pack_elements(child2_elements)
+        Cada filho ainda percorre todos os bins do receptor (para encontrar os bins com itens
+        repetidos e montar a lista do filho) e todos os bins do filho (para selecionar os que têm
+        espaço para o menor item liberado): o custo é O(B + k log k + m log m), com B bins, k bins
+        candidatos à reinserção e m itens reinseridos.
 
-        return child1, child2
+        Args:
+            parent1 (list): O primeiro pai (lista de contêineres ou `Solution`).
+            parent2 (list): O segundo pai.
+
+        Returns:
+            tuple: Os dois filhos, como listas de contêineres.
+        """
+        if not len(parent1) or not len(parent2):
+            return parent1, parent2
+        return self._inject_bins(parent2, parent1), self._inject_bins(parent1, parent2)
+
+    def _inject_bins(self, receiver, donor):
+        """
+        Gera um filho do BPCX: injeta uma faixa de bins de `donor` em `receiver` e repara o resultado.
+        """
+        start, stop = sorted(self.random.sample(range(len(donor) + 1), 2))
+        injected = list(donor[start:stop])
+        point = self.random.randint(0, len(receiver))
+
+        # Itens trazidos pelos bins injetados, que passam a estar duplicados no receptor
+        duplicated = {}
+        for container in injected:
+            for size, count in container.counts.items():
+                duplicated[size] = duplicated.get(size, 0) + count
+
+        # Remove, em ordem, os bins do receptor que ainda contêm alguma cópia duplicada
+        # (`pending` guarda apenas os tamanhos com cópias ainda não removidas)
+        pending = dict(duplicated)
+        before, after = [], []
+        freed = {}
+        for index, container in enumerate(receiver):
+            if pending and not pending.keys().isdisjoint(container.counts):
+                for size, count in container.counts.items():
+                    freed[size] = freed.get(size, 0) + count
+                    if size in pending:
+                        if pending[size] > count:
+                            pending[size] -= count
+                        else:
+                            del pending[size]
+            else:
+                (before if index < point else after).append(container)
+        child = before + injected + after
+
+        # Reinsere apenas os itens liberados que não vieram com os bins injetados
+        sizes = sorted((size for size in freed if freed[size] > duplicated.get(size, 0)), reverse=True)
+        return self.reinsert_items(child, np.repeat(
+            sizes, [freed[size] - duplicated.get(size, 0) for size in sizes]).astype(np.int64))
+
+    def reinsert_items(self, solution, items):
+        """
+        Reinsere itens nos contêineres de uma solução com First-Fit Decreasing, abrindo novos
+        contêineres quando necessário.
+
+        Apenas os contêineres com espaço para o menor item participam do First-Fit: os demais
+        não receberiam nenhum item, então o resultado é o mesmo de considerar todos os contêineres.
+        Os contêineres que recebem itens são copiados antes de serem alterados (eles podem ser
+        compartilhados com outras soluções); os demais são mantidos.
+
+        Args:
+            solution (list): Lista de contêineres (alterada no lugar).
+            items (np.ndarray): Tamanhos dos itens, em ordem decrescente.
+
+        Returns:
+            list: A própria `solution`, com os itens reinseridos.
+        """
+        if not len(items):
+            return solution
+        smallest = items[-1]
+        candidates = [index for index, container in enumerate(solution)
+                      if container.remaining_space() >= smallest]
+        assignment, _ = pack(items, self.container_capacity, 'ffd', presorted=True,
+                             loads=[solution[index].used for index in candidates])
+        # Os contêineres novos (após os candidatos) vão para o final da solução
+        opened = len(solution) - len(candidates)
+        changed = set()
+        for (slot, size), count in Counter(zip(assignment.tolist(), items.tolist())).items():
+            index = candidates[slot] if slot < len(candidates) else slot + opened
+            if index == len(solution):
+                solution.append(Container(self.container_capacity))
+            elif index not in changed:
+                # Os contêineres podem ser compartilhados: copiar antes de alterar
+                solution[index] = solution[index].copy()
+            changed.add(index)
+            solution[index].add_elements(size, count)
+        return solution
 
     def uniform_crossover(self, parent1, parent2):
         return None
@@ -298,34 +555,86 @@ class GGA:
 
     # Função de mutação
     def mutate(self, solution, mutation_rate):
-        if random.random() < mutation_rate:
+        if self.random.random() < mutation_rate:
+            # Os operadores já descartam os contêineres que eles próprios esvaziam
             solution = self._bitflip_Mutation(solution)
-            solution = self._remove_empty_containers(solution)
         return solution
 
+    def adaptive_offspring(self, parent1, parent2, fitness1, fitness2):
+        """
+        Gera dois filhos com operadores de cruzamento e mutação escolhidos pela seleção adaptativa.
+
+        O crédito do cruzamento é a melhoria dos filhos em relação ao fitness médio dos pais e o
+        de cada mutação é a melhoria do filho mutado, ambos divididos pelo custo da aplicação.
+        O fitness dos pais vem da avaliação da geração, e o de cada filho final é guardado no
+        cache de fitness, de modo que ele não é avaliado de novo na geração seguinte.
+
+        Args:
+            parent1 (list): O primeiro pai.
+            parent2 (list): O segundo pai.
+            fitness1 (float): Fitness do primeiro pai.
+            fitness2 (float): Fitness do segundo pai.
+
+        Returns:
+            tuple: Os dois filhos e a chave canônica (`canonical_key`) de cada um.
+        """
+        operator = self.crossover_selector.select()
+        children, cost = self._timed(getattr(self, self.CROSSOVER_OPERATORS[operator]), parent1, parent2)
+        children = list(children)
+        reference = (fitness1 + fitness2) / 2
+        fitnesses = [self.fitness(child) for child in children]
+        self.crossover_selector.update(
+            operator, sum(max(reference - fitness, 0.0) for fitness in fitnesses), cost)
+
+        for index, child in enumerate(children):
+            if self.random.random() < self.mutation_rate:
+                operator = self.mutation_selector.select()
+                mutated, cost = self._timed(getattr(self, self.MUTATION_OPERATORS[operator]), child)
+                mutated_fitness = self.fitness(mutated)
+                self.mutation_selector.update(operator, fitnesses[index] - mutated_fitness, cost)
+                children[index] = mutated
+                fitnesses[index] = mutated_fitness
+
+        keys = [canonical_key(child) for child in children]
+        for key, fitness in zip(keys, fitnesses):
+            self.fitness_cache.put(key, fitness)
+        return tuple(children), tuple(keys)
+
+    def _timed(self, operator, *args):
+        # Aplica o operador e mede o custo (segundos de CPU, ou uma unidade por aplicação)
+        if self.operator_clock is None:
+            return operator(*args), 1.0
+        start = self.operator_clock()
+        result = operator(*args)
+        return result, max(self.operator_clock() - start, 1e-6)
+
     # Funções para as Mutações
+    #
+    # Todas as mutações trabalham sobre soluções persistentes (`Solution`): a solução mutada
+    # compartilha com a original todos os contêineres não tocados, e apenas os contêineres
+    # modificados são copiados (copy-on-write).
 
     def _swap_Mutation(self, solution):
         """
         Realiza a mutação de troca entre dois elementos de contêineres diferentes.
         """
         # Evitar modificar a solução original
-        mutated_solution = solution.copy()
+        mutated_solution = Solution.wrap(solution)
 
         # Filtra os índices dos contêineres que possuem pelo menos um elemento
         eligible_indices = [i for i, c in enumerate(
-            mutated_solution) if c.elements]
+            mutated_solution) if len(c)]
         if len(eligible_indices) < 2:
             return mutated_solution
 
         # Seleciona aleatoriamente dois índices de contêineres distintos
-        idx1, idx2 = random.sample(eligible_indices, 2)
+        idx1, idx2 = self.random.sample(eligible_indices, 2)
         container1 = mutated_solution[idx1]
         container2 = mutated_solution[idx2]
 
         # Seleciona um elemento aleatório de cada contêiner
-        element1 = random.choice(container1.elements)
-        element2 = random.choice(container2.elements)
+        element1 = container1.random_element(self.random)
+        element2 = container2.random_element(self.random)
 
         # Verifica se a troca é viável para ambos os contêineres
         if (container1.remaining_space() + element1 - element2 >= 0 and
@@ -334,8 +643,6 @@ class GGA:
             # Fazer cópias dos contêineres para evitar modificar os originais
             container1 = container1.copy()
             container2 = container2.copy()
-            mutated_solution[idx1] = container1
-            mutated_solution[idx2] = container2
 
             # Realiza a troca de elementos entre os contêineres
             container1.remove_element(element1)
@@ -343,34 +650,7 @@ class GGA:
             container1.add_element(element2)
             container2.add_element(element1)
 
-        return mutated_solution
-
-    def _inversion_Mutation(self, solution):
-        """
-        Realiza a mutação de inversão em uma solução.
-        """
-        # Evitar modificar a solução original
-        mutated_solution = solution.copy()
-
-        # Filtra índices de contêineres que possuem pelo menos dois itens
-        eligible_indices = [i for i, c in enumerate(
-            mutated_solution) if len(c.elements) >= 2]
-        if not eligible_indices:
-            return mutated_solution
-
-        # Seleciona aleatoriamente um índice de contêiner elegível
-        idx = random.choice(eligible_indices)
-        container = mutated_solution[idx]
-
-        # Fazer uma cópia do contêiner para evitar modificar o original
-        container = container.copy()
-        mutated_solution[idx] = container
-
-        # Seleciona dois índices para definir a subsequência a ser invertida
-        idx1, idx2 = sorted(random.sample(range(len(container.elements)), 2))
-
-        # Inverte a subsequência de itens entre idx1 e idx2
-        container.elements[idx1:idx2] = reversed(container.elements[idx1:idx2])
+            mutated_solution = mutated_solution.replace(idx1, container1).replace(idx2, container2)
 
         return mutated_solution
 
@@ -378,75 +658,13 @@ class GGA:
         """
         Realiza uma mutação de inserção na solução.
         """
-        mutated_solution = solution.copy()
-
-        if len(mutated_solution) < 2:
-            return mutated_solution
-
-        # Seleciona aleatoriamente dois índices de contêineres diferentes
-        idx1, idx2 = random.sample(range(len(mutated_solution)), 2)
-        container1 = mutated_solution[idx1]
-        container2 = mutated_solution[idx2]
-
-        if container1.elements:
-            # Fazer cópias dos contêineres
-            container1 = container1.copy()
-            container2 = container2.copy()
-            mutated_solution[idx1] = container1
-            mutated_solution[idx2] = container2
-
-            # Seleciona um item aleatório do container1
-            element = random.choice(container1.elements)
-            container1.remove_element(element)
-
-            # Tenta inserir o item em container2
-            if container2.remaining_space() >= element:
-                container2.add_element(element)
-            else:
-                # Se container2 não tiver espaço, cria um novo contêiner
-                new_container = Container(self.container_capacity)
-                if new_container.remaining_space() >= element:
-                    new_container.add_element(element)
-                    mutated_solution.append(new_container)
-                else:
-                    # Se o item não couber, devolve o item ao container1
-                    container1.add_element(element)
-
-        return mutated_solution
-
-    def _scramble_Mutation(self, solution):
-        """
-        Realiza uma mutação de embaralhamento em um contêiner.
-        """
-        mutated_solution = solution.copy()
-
-        # Filtra índices de contêineres com pelo menos dois elementos
-        eligible_indices = [i for i, c in enumerate(
-            mutated_solution) if len(c.elements) > 1]
-        if not eligible_indices:
-            return mutated_solution
-
-        # Seleciona um índice de contêiner aleatório
-        idx = random.choice(eligible_indices)
-        container = mutated_solution[idx]
-
-        # Fazer uma cópia do contêiner
-        container = container.copy()
-        mutated_solution[idx] = container
-
-        # Seleciona dois índices e embaralha os elementos nessa subsequência
-        idx1, idx2 = sorted(random.sample(range(len(container.elements)), 2))
-        subsequence = container.elements[idx1:idx2]
-        random.shuffle(subsequence)
-        container.elements[idx1:idx2] = subsequence
-
-        return mutated_solution
+        return self._move_random_element(solution)
 
     def _gausian_Mutation(self, solution):
         """
         Realiza uma mutação baseada em distribuição gaussiana sem alterar os pesos dos itens.
         """
-        mutated_solution = solution.copy()
+        mutated_solution = Solution.wrap(solution)
 
         num_containers = len(mutated_solution)
         if num_containers < 2:
@@ -458,45 +676,17 @@ class GGA:
         max_attempts = 10
         attempts = 0
         while attempts < max_attempts:
-            index_from = int(np.random.normal(mean, std_dev))
-            if 0 <= index_from < num_containers and mutated_solution[index_from].elements:
+            index_from = int(self.rng.normal(mean, std_dev))
+            if 0 <= index_from < num_containers and len(mutated_solution[index_from]):
                 break
             attempts += 1
         else:
             return mutated_solution
 
-        # Fazer cópias dos contêineres
-        container_from = mutated_solution[index_from].copy()
-        mutated_solution[index_from] = container_from
-
-        index_to = random.choice(
+        index_to = self.random.choice(
             [i for i in range(num_containers) if i != index_from])
-        container_to = mutated_solution[index_to].copy()
-        mutated_solution[index_to] = container_to
 
-        # Seleciona um item aleatório do contêiner de origem
-        item = random.choice(container_from.elements)
-
-        # Verifica se o item cabe no contêiner de destino
-        if container_to.remaining_space() >= item:
-            container_from.remove_element(item)
-            container_to.add_element(item)
-        else:
-            # Tenta criar um novo contêiner
-            new_container = Container(self.container_capacity)
-            if new_container.remaining_space() >= item:
-                container_from.remove_element(item)
-                new_container.add_element(item)
-                mutated_solution.append(new_container)
-            else:
-                # Não foi possível mover o item
-                mutated_solution[index_from] = solution[index_from]
-                mutated_solution[index_to] = solution[index_to]
-
-        # Remove contêineres vazios
-        mutated_solution = self._remove_empty_containers(mutated_solution)
-
-        return mutated_solution
+        return self._move_element(mutated_solution, index_from, index_to)
 
     def _bitflip_Mutation(self, solution):
         """
@@ -513,92 +703,408 @@ class GGA:
 
             list: Uma nova solução com a mutação de bit-flip aplicada.
         """
-        mutated_solution = solution.copy()
+        return self._move_random_element(solution)
+
+    def _move_random_element(self, solution):
+        """
+        Move um elemento aleatório entre dois contêineres sorteados (base das mutações
+        de inserção e bit-flip).
+        """
+        mutated_solution = Solution.wrap(solution)
 
         if len(mutated_solution) < 2:
             return mutated_solution
 
         # Seleciona aleatoriamente dois índices de contêineres diferentes
-        idx1, idx2 = random.sample(range(len(mutated_solution)), 2)
-        container1 = mutated_solution[idx1]
-        container2 = mutated_solution[idx2]
+        idx1, idx2 = self.random.sample(range(len(mutated_solution)), 2)
+        if not len(mutated_solution[idx1]):
+            return mutated_solution
 
-        if container1.elements:
-            # Fazer cópias dos contêineres
-            container1 = container1.copy()
-            container2 = container2.copy()
-            mutated_solution[idx1] = container1
-            mutated_solution[idx2] = container2
+        return self._move_element(mutated_solution, idx1, idx2)
 
-            # Seleciona um item aleatório do container1
-            element = random.choice(container1.elements)
-            container1.remove_element(element)
+    def _move_element(self, solution, idx_from, idx_to):
+        """
+        Move um elemento aleatório do contêiner `idx_from` para o contêiner `idx_to`.
 
-            # Tenta inserir o item em container2
-            if container2.remaining_space() >= element:
-                container2.add_element(element)
-            else:
-                # Se container2 não tiver espaço, cria um novo contêiner
-                new_container = Container(self.container_capacity)
-                if new_container.remaining_space() >= element:
-                    new_container.add_element(element)
-                    mutated_solution.append(new_container)
-                else:
-                    # Se o item não couber, devolve o item ao container1
-                    container1.add_element(element)
+        Se o contêiner de destino não tiver espaço, o elemento vai para um novo contêiner;
+        se nem assim couber, a solução é mantida. Apenas os contêineres alterados são copiados,
+        e o contêiner de origem é descartado caso fique vazio.
 
-        return mutated_solution
+        Args:
+            solution (Solution): A solução persistente atual.
+            idx_from (int): Índice do contêiner de origem (não vazio).
+            idx_to (int): Índice do contêiner de destino.
+
+        Returns:
+            Solution: A nova solução.
+        """
+        container_from = solution[idx_from]
+        container_to = solution[idx_to]
+
+        # Seleciona um item aleatório do contêiner de origem
+        element = container_from.random_element(self.random)
+
+        if container_to.remaining_space() >= element:
+            # Fazer cópias dos contêineres
+            container_to = container_to.copy()
+            container_to.add_element(element)
+            solution = solution.replace(idx_to, container_to)
+        elif self.container_capacity >= element:
+            # Se o destino não tiver espaço, cria um novo contêiner
+            new_container = Container(self.container_capacity)
+            new_container.add_element(element)
+            solution = solution.append(new_container)
+        else:
+            # Se o item não couber, a solução não é alterada
+            return solution
+
+        container_from = container_from.copy()
+        container_from.remove_element(element)
+        if len(container_from):
+            return solution.replace(idx_from, container_from)
+        return solution.remove(idx_from)
 
 # -------------------------------- Metodos Auxiliares -------------------------------- #
 
     def _remove_empty_containers(self, solution):
-        return [container for container in solution if container.elements]
+        return [container for container in solution if len(container)]
 
     # Função auxiliar para redistribuir os elementos em contêineres
     def pack_elements(self, elements):
         """
-        Empacota os elementos fornecidos em contêineres usando um método de geração de solução inicial.
+        Decodifica uma sequência de elementos (permutação) em contêineres.
+
+        O modo de decodificação é definido por `decoder`:
+            - 'sorted': ordena os elementos de forma decrescente antes de empacotar
+              (a ordem produzida pelo cruzamento é descartada).
+            - 'order': empacota os elementos exatamente na ordem recebida.
+            - 'partial': ordena apenas por classes de tamanho (`decoder_size_classes` faixas
+              da capacidade), preservando a ordem recebida dentro de cada classe.
 
         Args:
-            elements (list): Uma lista de elementos a serem empacotados em contêineres.
+            elements (list ou np.ndarray): Os elementos a serem empacotados em contêineres.
 
         Returns:
             list: Uma lista de contêineres com os elementos empacotados.
         """
-        original_elements = self.elements
-        self.elements = elements
-        containers = self.generate_initial_solution()
-        self.elements = original_elements
-        return containers
+        if self.decoder == 'sorted':
+            return self.generate_initial_solution(elements)
+        if self.decoder == 'partial':
+            classes = self.decoder_size_classes
+            capacity = self.container_capacity
+            elements = np.asarray(elements, dtype=np.int64)
+            # Ordenação estável: a ordem recebida é mantida dentro de cada classe
+            elements = elements[np.argsort(-(elements * classes // capacity), kind='stable')]
+        elif self.decoder != 'order':
+            raise ValueError(f"Decodificador desconhecido: {self.decoder}")
+        return self.generate_initial_solution(elements, presorted=True)
+
+    def population_diversity(self, population):
+        """
+        Calcula a diversidade da população como a fração de empacotamentos distintos.
+
+        Dois indivíduos são considerados iguais quando têm a mesma chave canônica
+        (`canonical_key`), isto é, os mesmos bins independentemente da ordem dos bins e dos itens.
+
+        Returns:
+            float: Valor em (0, 1]; 1 indica que todos os indivíduos são diferentes.
+        """
+        return len({canonical_key(solution) for solution in population}) / len(population)
+
+    def improve_elite(self, individuals, keys=None):
+        """
+        Melhora cada indivíduo da elite com a Busca Tabu, a busca local por dominância ou a
+        dominância seguida da Busca Tabu (`elite_search`).
+
+        Indivíduos cujo empacotamento já foi melhorado antes (mesma chave canônica) reaproveitam
+        o resultado do cache. Os demais recebem, cada um, uma semente própria e são processados
+        sequencialmente ou, com `tabu_workers` > 1, em um pool de processos reaproveitado entre
+        as gerações; o resultado é o mesmo nos dois casos.
+
+        Args:
+            individuals (list): As soluções a serem melhoradas.
+            keys (list, opcional): Chave canônica de cada solução, se já calculada.
+
+        Returns:
+            list: As soluções melhoradas, na mesma ordem de `individuals`.
+        """
+        if keys is None:
+            keys = [canonical_key(individual) for individual in individuals]
+
+        improved = [None] * len(individuals)
+        pending = {}
+        for index, key in enumerate(keys):
+            if key in pending:
+                pending[key].append(index)
+                continue
+            cached = self.tabu_cache.get(key)
+            if cached is None:
+                pending[key] = [index]
+            else:
+                improved[index] = cached
+
+        if not pending:
+            return improved
+
+        to_search = [individuals[indices[0]] for indices in pending.values()]
+        if self.elite_search != 'tabu':
+            # A busca por dominância é rápida e roda sempre no processo principal
+            search = DominanceLocalSearch(self, self.dominance_removed_bins, self.dominance_max_rounds)
+            to_search = [search.search(individual) for individual in to_search]
+            self.dominance_exchanges += search.exchanges
+
+        seeds = [self.random.getrandbits(32) for _ in to_search]
+        if self.elite_search == 'dominance':
+            results = to_search
+        elif self.tabu_workers > 1 and len(to_search) > 1:
+            if self._tabu_pool is None:
+                self._tabu_pool = TabuWorkerPool(self.tabu_workers, self.container_capacity,
+                                                 self.target_fitness)
+            pool = self._tabu_pool
+            before = (pool.neighbors_evaluated, pool.moves_accepted, pool.tabu_hits)
+            results = pool.search_many(to_search, seeds, self.tabu_max_iterations,
+                                       self.tabu_tenure, self.tabu_max_neighbors,
+                                       self.tabu_search_time_limit())
+            self.tabu_neighbors_evaluated += pool.neighbors_evaluated - before[0]
+            self._count_tabu(pool.neighbors_evaluated - before[0], pool.moves_accepted - before[1],
+                             pool.tabu_hits - before[2])
+        else:
+            results = []
+            for individual, seed in zip(to_search, seeds):
+                TS = Tabu_Search(self, max_iterations=self.tabu_max_iterations,
+                                 tabu_tenure=self.tabu_tenure,
+                                 max_neighbors=self.tabu_max_neighbors, seed=seed,
+                                 time_limit=self.tabu_search_time_limit())
+                results.append(TS.search(individual))
+                self.tabu_neighbors_evaluated += TS.neighbors_evaluated
+                self._count_tabu(TS.neighbors_evaluated, TS.moves_accepted, TS.tabu_hits)
+
+        for (key, indices), result in zip(pending.items(), results):
+            # As soluções nunca são alteradas no lugar, então o resultado pode ser compartilhado
+            self.tabu_cache.put(key, result)
+            for index in indices:
+                improved[index] = result
+        return improved
+
+    def close(self):
+        """Encerra o pool de processos da Busca Tabu, se houver."""
+        if self._tabu_pool is not None:
+            self._tabu_pool.close()
+            self._tabu_pool = None
+
+    def __getstate__(self):
+        # O pool de processos não pode ser serializado (ex.: ao retornar o GGA de um worker)
+        state = self.__dict__.copy()
+        state['_tabu_pool'] = None
+        # Os métodos instrumentados são funções locais; são recriados em `__setstate__`
+        for name in self._phase_methods():
+            state.pop(name, None)
+        # Sem semente, `random` é o próprio módulo global, que não é serializável
+        if state['random'] is random:
+            state['random'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.random is None:
+            self.random = random
+        if self.instrumentation is not None:
+            self._instrument_phases()
+
+    def _phase_methods(self):
+        """Retorna o nome de cada método instrumentado e a sua fase."""
+        phases = {
+            'stoic_tournament_index': 'selection',
+            'tournament_selection': 'selection',
+            'roulette_wheel_selection': 'selection',
+            'pack_elements': 'pack',
+            'reinsert_items': 'pack',
+            'improve_elite': 'tabu',
+            'fitness': 'fitness',
+            'evaluate_population': 'fitness',
+            'evaluate_population_cached': 'fitness',
+        }
+        phases.update({name: 'crossover' for name in self.CROSSOVER_OPERATORS.values()})
+        phases.update({name: 'mutation' for name in self.MUTATION_OPERATORS.values()})
+        return phases
+
+    def _instrument_phases(self):
+        """
+        Substitui, nesta instância, os métodos de cada fase por versões cronometradas.
+
+        Os métodos chamados por meio de `self` (inclusive pela Busca Tabu e pela busca por
+        dominância, que recebem o GGA) passam a ser contabilizados. A fase 'tabu' inclui toda
+        a melhoria da elite, e cada empacotamento ('pack') incrementa o contador 'repacks'.
+        """
+        for name, phase in self._phase_methods().items():
+            counter = 'repacks' if phase == 'pack' else None
+            setattr(self, name, self.instrumentation.wrap(phase, getattr(type(self), name).__get__(self), counter))
+
+    def _phase(self, phase, function, counter=None):
+        # Versão cronometrada de `function` quando a instrumentação está ligada (a própria função, senão)
+        if self.instrumentation is None:
+            return function
+        return self.instrumentation.wrap(phase, function, counter)
+
+    def _count_tabu(self, neighbors, accepted, hits):
+        """Soma os contadores de uma ou mais Buscas Tabu à instrumentação, se ligada."""
+        if self.instrumentation is not None:
+            self.instrumentation.count('neighbors_generated', neighbors)
+            self.instrumentation.count('moves_accepted', accepted)
+            self.instrumentation.count('tabu_hits', hits)
+
+    def _record_operator_stats(self):
+        """Registra no histórico o uso e a taxa de sucesso de cada operador na geração."""
+        crossover_usage, crossover_success = self.crossover_selector.generation_stats()
+        mutation_usage, mutation_success = self.mutation_selector.generation_stats()
+        self.history['operator_usage'].append({**crossover_usage, **mutation_usage})
+        self.history['operator_success_rate'].append({**crossover_success, **mutation_success})
+
+    def _record_cache_stats(self):
+        """Registra no histórico os acertos e falhas acumulados dos caches de fitness e Tabu."""
+        self.history['cache_hits'].append(self.fitness_cache.hits + self.tabu_cache.hits)
+        self.history['cache_misses'].append(self.fitness_cache.misses + self.tabu_cache.misses)
+
+    def elapsed(self):
+        """Segundos de relógio desde o início de `run`/`iterate` (0 antes do início)."""
+        return 0.0 if self.start_time is None else time.perf_counter() - self.start_time
+
+    def time_expired(self):
+        """Indica se o orçamento de tempo da execução (`time_limit`) já foi consumido."""
+        return self.time_limit is not None and self.elapsed() >= self.time_limit
+
+    def tabu_search_time_limit(self):
+        """
+        Tempo disponível para a próxima Busca Tabu: o limite por busca (`tabu_time_limit`),
+        reduzido ao que resta do orçamento da execução. None se não houver limite.
+        """
+        limits = [limit for limit in (self.tabu_time_limit,
+                                      None if self.time_limit is None else self.time_limit - self.elapsed())
+                  if limit is not None]
+        return max(min(limits), 0.0) if limits else None
+
+    def current_best(self):
+        """
+        Retorna a melhor solução da última geração avaliada, como lista de contêineres.
+
+        Pode ser chamada a qualquer momento da execução (por exemplo, a cada snapshot de
+        `iterate`); retorna None antes da primeira geração.
+        """
+        if self._best is None:
+            return None
+        population, index = self._best
+        if isinstance(population, ArrayPopulation):
+            return population.decode(index)
+        return population[index]
+
+    def _snapshot(self, generation, fitnesses, population, index, bins, last_time):
+        """Registra o tempo da geração e monta o snapshot produzido por `iterate`."""
+        now = time.perf_counter()
+        self.history['generation_time'].append(now - last_time)
+        if self.instrumentation is not None:
+            # O trabalho medido é o que produziu esta geração (inclusive sua avaliação)
+            times, counts = self.instrumentation.flush()
+            # Tempo fora das fases instrumentadas (hashing, diversidade, cópias da população etc.)
+            times['other'] = max(now - last_time - sum(times.values()), 0.0)
+            self.history['phase_times'].append(times)
+            self.history['phase_counts'].append(counts)
+        self._best = (population, index)
+        return {
+            'generation': generation + 1,
+            'elapsed': now - self.start_time,
+            'best_fitness': float(fitnesses[index]),
+            'avg_fitness': float(fitnesses.mean()),
+            'bins': bins,
+            'lower_bound': self.lower_bound,
+        }
 
     # Função principal que executa o algoritmo genético
-    def run(self):
+    def run(self, callback=None):
         """
         Executa o algoritmo genético para otimização.
 
         Inicializa a população e itera por um número definido de gerações,
         avaliando a aptidão (fitness) de cada indivíduo e criando novas populações
-        até que a estagnação seja atingida ou o número máximo de gerações seja alcançado.
+        até que a estagnação seja atingida, o número máximo de gerações seja alcançado,
+        a melhor solução atinja o limitante inferior L2 (e seja, portanto, ótima) ou o
+        orçamento de tempo (`time_limit`) se esgote. É um algoritmo "anytime": ao fim do
+        orçamento, retorna a melhor solução encontrada até ali.
 
         Armazena o histórico de desempenho para visualização posterior.
 
+        Args:
+            callback (callable, opcional): Chamada a cada geração com o snapshot de progresso
+                (ver `iterate`).
+
         Returns:
             best_solution: O indivíduo com a melhor aptidão encontrado durante a execução do algoritmo.
         """
+        for snapshot in self.iterate():
+            if callback is not None:
+                callback(snapshot)
+        return self.current_best()
+
+    def iterate(self):
+        """
+        Executa o algoritmo genético como um gerador, produzindo um snapshot por geração.
+
+        Cada snapshot é um dicionário com 'generation', 'elapsed' (segundos desde o início),
+        'best_fitness', 'avg_fitness', 'bins' (contêineres da melhor solução) e 'lower_bound'.
+        A melhor solução correspondente é obtida com `current_best`. Interromper a iteração
+        encerra a execução mantendo a melhor solução encontrada até então.
+
+        Yields:
+            dict: O snapshot de cada geração.
+        """
+        self.start_time = time.perf_counter()
+        self._best = None
+        try:
+            if self.population_engine == 'array':
+                yield from self._run_array()
+            else:
+                yield from self._run_objects()
+        finally:
+            self.close()
+
+    def _time_limit_message(self, generation):
+        print(f"Tempo limite ({self.time_limit} s) atingido na geração {generation}. "
+              "Finalizando o algoritmo...")
+
+    def _run_objects(self):
+        """
+        Executa o algoritmo genético com a população de listas de contêineres.
+
+        Yields:
+            dict: O snapshot de cada geração (ver `iterate`); ao final, a melhor solução da
+                população final fica disponível em `current_best`.
+        """
+        last_time = self.start_time
         self.initialize_population()
+        self.population_keys = None
         best_fitness = float('inf')
         stagnation_counter = 0
+        fitnesses = None
 
         for generation in range(self.num_generations):
-            fitnesses = [self.fitness(individual)
-                         for individual in self.population]
-            current_best_fitness = min(fitnesses)
-            avg_fitness = sum(fitnesses) / len(fitnesses)
+            # Cada indivíduo é avaliado no máximo uma vez por geração (e nunca se já estiver no
+            # cache); a chave dos que vieram de `create_new_population` já está calculada
+            known_keys = self.population_keys or [None] * len(self.population)
+            keys = [key if key is not None else canonical_key(individual)
+                    for key, individual in zip(known_keys, self.population)]
+            fitnesses = self.evaluate_population_cached(self.population, keys)
+            current_best_fitness = float(fitnesses.min())
+            avg_fitness = float(fitnesses.mean())
 
             # Armazenar dados para visualização
             self.history['best_fitness'].append(current_best_fitness)
             self.history['avg_fitness'].append(avg_fitness)
             self.history['generation'].append(generation + 1)
+            self.history['diversity'].append(len(set(keys)) / len(keys))
+            self._record_cache_stats()
+            index = int(np.argmin(fitnesses))
+            yield self._snapshot(generation, fitnesses, self.population, index,
+                                 len(self.population[index]), last_time)
+            last_time = time.perf_counter()
 
             if current_best_fitness < best_fitness:
                 best_fitness = current_best_fitness
@@ -606,15 +1112,174 @@ class GGA:
             else:
                 stagnation_counter += 1
 
+            if self.reached_lower_bound(current_best_fitness):
+                print(f"Limitante inferior ({self.lower_bound} bins) atingido na geração {generation}. "
+                      "Finalizando o algoritmo...")
+                break
+
+            if stagnation_counter >= self.stagnation_limit:
+                print(f"Estagnação atingida na geração {generation}. Finalizando o algoritmo...")
+                break
+
+            if self.time_expired():
+                self._time_limit_message(generation)
+                break
+
+            if self.migration is not None and self.migration.due(generation):
+                self._migrate(fitnesses, keys)
+
+            ratio = stagnation_counter / self.stagnation_limit
+            self.crossover_selector.set_stagnation(ratio)
+            self.mutation_selector.set_stagnation(ratio)
+            self.population = self.create_new_population(fitnesses, keys)
+            if self.adaptive_operators:
+                self._record_operator_stats()
+            fitnesses = None
+
+        if fitnesses is None:
+            fitnesses = self.evaluate_population(self.population)
+        self._best = (self.population, int(np.argmin(fitnesses)))
+        print(f"Melhor fitness obtido: {best_fitness}")
+
+    def _migrate(self, fitnesses, keys):
+        """
+        Troca indivíduos com as outras ilhas (modelo de ilhas).
+
+        Os melhores indivíduos são enviados pelo canal `migration` e os imigrantes recebidos
+        substituem os piores indivíduos da população. `fitnesses` e `keys` são atualizados
+        no lugar.
+        """
+        order = np.argsort(fitnesses, kind='stable')
+        emigrants = [self.population[i] for i in order[:self.migration.migrants]]
+        immigrants = self.migration.exchange(emigrants)[:len(self.population)]
+        if not immigrants:
+            return
+
+        worst = order[::-1][:len(immigrants)]
+        for index, immigrant in zip(worst, immigrants):
+            self.population[index] = immigrant
+            keys[index] = canonical_key(immigrant)
+        fitnesses[worst] = self.evaluate_population(immigrants)
+
+    def _migrate_array(self, population, fitnesses):
+        """
+        Troca indivíduos com as outras ilhas a partir da população vetorizada.
+
+        Apenas os emigrantes são decodificados em contêineres e apenas os imigrantes são
+        codificados nas linhas dos piores indivíduos; `population` e `fitnesses` são
+        atualizados no lugar.
+        """
+        order = np.argsort(fitnesses, kind='stable')
+        emigrants = [population.decode(row) for row in order[:self.migration.migrants].tolist()]
+        immigrants = self.migration.exchange(emigrants)[:population.size]
+        if not immigrants:
+            return
+
+        worst = order[::-1][:len(immigrants)]
+        for row, immigrant in zip(worst.tolist(), immigrants):
+            population.encode(row, immigrant)
+        fitnesses[worst] = batch_fitness(population.loads[worst], self.container_capacity)
+
+    def _run_array(self):
+        """
+        Executa o algoritmo genético usando a população vetorizada (`ArrayPopulation`).
+
+        Segue o mesmo fluxo de `run` (elitismo com Busca Tabu, seleção por torneio estoico,
+        cruzamento e mutação), mas toda a população é mantida em arrays NumPy.
+
+        É também o caminho do modo de instâncias grandes (`large_instance`, a partir de
+        `large_instance_threshold` itens): nele nenhum objeto é criado por item ou por bin
+        durante as gerações (sem Busca Tabu da elite e com a diversidade estimada pelos perfis
+        de carga), de modo que cada geração custa O(população x n log n); apenas a melhor
+        solução final é convertida em contêineres.
+
+        Yields:
+            dict: O snapshot de cada geração (ver `iterate`); ao final, a melhor solução da
+                população final fica disponível em `current_best`.
+        """
+        last_time = self.start_time
+        rng = self.rng
+        # A solução inicial vai direto do núcleo de empacotamento para os arrays
+        assignment, _ = pack(self.elements, self.container_capacity, self.packing_heuristic)
+        population = ArrayPopulation.from_assignment(self.elements, self.container_capacity,
+                                                     assignment, self.population_size)
+        elite_size = int(self.elite_rating * self.population_size)
+        num_children = self.population_size - elite_size
+
+        best_fitness = float('inf')
+        stagnation_counter = 0
+
+        for generation in range(self.num_generations):
+            fitnesses = self._phase('fitness', population.fitness)()
+            current_best_fitness = fitnesses.min()
+            avg_fitness = fitnesses.mean()
+
+            # Armazenar dados para visualização
+            self.history['best_fitness'].append(float(current_best_fitness))
+            self.history['avg_fitness'].append(float(avg_fitness))
+            self.history['generation'].append(generation + 1)
+            if self.large_instance:
+                # Decodificar a população a cada geração criaria objetos para todos os bins
+                self.history['diversity'].append(population.load_profile_diversity())
+            else:
+                self.history['diversity'].append(self.population_diversity(
+                    [population.decode(row) for row in range(population.size)]))
+            self._record_cache_stats()
+            index = int(np.argmin(fitnesses))
+            yield self._snapshot(generation, fitnesses, population, index,
+                                 int(np.count_nonzero(population.loads[index])), last_time)
+            last_time = time.perf_counter()
+
+            if current_best_fitness < best_fitness:
+                best_fitness = current_best_fitness
+                stagnation_counter = 0
+            else:
+                stagnation_counter += 1
+
+            if self.reached_lower_bound(current_best_fitness):
+                print(f"Limitante inferior ({self.lower_bound} bins) atingido na geração {generation}. "
+                      "Finalizando o algoritmo...")
+                break
+
             if stagnation_counter >= self.stagnation_limit:
                 print(f"Estagnação atingida na geração {generation}. Finalizando o algoritmo...")
                 break
 
-            self.population = self.create_new_population(fitnesses)
+            if self.time_expired():
+                self._time_limit_message(generation)
+                break
+
+            if self.migration is not None and self.migration.due(generation):
+                self._migrate_array(population, fitnesses)
+
+            # Elitismo: os melhores indivíduos são melhorados pela Busca Tabu
+            elite_rows = np.argsort(fitnesses, kind='stable')[:elite_size]
+            parents = self._phase('selection', population.stoic_tournament_selection)(
+                fitnesses, 2 * ((num_children + 1) // 2), rng, self.tournament_size)
 
-        best_solution = min(self.population, key=self.fitness)
+            new_population = population.take(np.concatenate((elite_rows, parents[:num_children])))
+
+            if self.elite_tabu:
+                improved_elite = self.improve_elite([new_population.decode(row) for row in range(elite_size)])
+                for row, individual in enumerate(improved_elite):
+                    new_population.encode(row, individual)
+
+            # Cada cruzamento reempacota os itens do filho
+            crossover = self._phase('crossover', population.crossover, 'repacks')
+            for child in range(num_children):
+                parent1, parent2 = parents[child], parents[child ^ 1]
+                assignment, loads = crossover(parent1, parent2, rng)
+                new_population.assignment[elite_size + child] = assignment
+                new_population.loads[elite_size + child] = loads
+
+            self._phase('mutation', new_population.mutate)(
+                np.arange(elite_size, self.population_size), self.mutation_rate, rng)
+            population = new_population
+
+        fitnesses = population.fitness()
+        self.array_population = population
+        self._best = (population, int(np.argmin(fitnesses)))
         print(f"Melhor fitness obtido: {best_fitness}")
-        return best_solution
 
     def initialize_population(self):
         """
@@ -625,13 +1290,23 @@ class GGA:
         população. O tamanho da população é determinado pelo atributo
         `population_size`.
 
+        Quando o decodificador preserva a ordem ('order' ou 'partial'), apenas o
+        primeiro indivíduo usa a heurística ordenada; os demais são decodificados a
+        partir de permutações aleatórias, para que a população comece diversa.
+
         Retorna:
             None
         """
-        self.population = [self.generate_initial_solution()
-                           for _ in range(self.population_size)]
+        if self.decoder == 'sorted':
+            self.population = [self.generate_initial_solution()
+                               for _ in range(self.population_size)]
+            return
+
+        self.population = [self.generate_initial_solution()]
+        while len(self.population) < self.population_size:
+            self.population.append(self.pack_elements(self.random.sample(self.elements, len(self.elements))))
 
-    def create_new_population(self, fitnesses):
+    def create_new_population(self, fitnesses, keys=None):
         """
         Gera uma nova população para o algoritmo genético.
 
@@ -640,55 +1315,86 @@ class GGA:
         usando operações de cruzamento e mutação.
 
         Args:
-            fitnesses (list): Uma lista de valores de fitness correspondentes à população atual.
+            fitnesses (np.ndarray): Valores de fitness correspondentes à população atual,
+                calculados por `evaluate_population`.
+            keys (list, opcional): Chave canônica de cada indivíduo da população atual.
 
         Returns:
-            list: Uma nova população de indivíduos.
+            list: Uma nova população de indivíduos. A chave canônica dos indivíduos que já a
+            têm calculada (ou None) fica em `population_keys`.
         """
-        # aplicação do elitismo
+        # aplicação do elitismo (reaproveita o fitness já calculado para a geração)
         elite_size = int(self.elite_rating * self.population_size)
-        elite = sorted(self.population, key=self.fitness)[:elite_size]
-        new_population = elite.copy()  # Garantir que a elite passe para a próxima geração
-
-        TS = Tabu_Search(self, max_iterations=self.tabu_max_iterations,
-                         tabu_tenure=self.tabu_tenure, max_neighbors=self.tabu_max_neighbors)
-        improved_elite = []
-        for individual in elite:
-            improved_individual = TS.search(individual)
-            improved_elite.append(improved_individual)
-        new_population = improved_elite.copy()
+        elite_indices = np.argsort(fitnesses, kind='stable')[:elite_size]
+        elite = [self.population[i] for i in elite_indices]
+        elite_keys = [keys[i] for i in elite_indices] if keys is not None else None
+
+        # A elite melhorada pela Busca Tabu passa para a próxima geração
+        if self.elite_tabu:
+            new_population = self.improve_elite(elite, elite_keys)
+            new_keys = [None] * len(new_population)
+        else:
+            new_population = elite
+            new_keys = elite_keys or [None] * len(elite)
 
         while len(new_population) < self.population_size:
-            parent1 = self.stoic_tournament_selection(
-                self.population, fitnesses)
-            parent2 = self.stoic_tournament_selection(
-                self.population, fitnesses)
+            index1 = self.stoic_tournament_index(fitnesses)
+            index2 = self.stoic_tournament_index(fitnesses)
+            parent1, parent2 = self.population[index1], self.population[index2]
 
-            # multi_point_crossover
-            child1, child2 = self.multi_point_crossover(parent1, parent2)
-            child1 = self.mutate(child1, self.mutation_rate)
-            child2 = self.mutate(child2, self.mutation_rate)
+            if self.adaptive_operators:
+                children, children_keys = self.adaptive_offspring(
+                    parent1, parent2, fitnesses[index1], fitnesses[index2])
+            else:
+                child1, child2 = self.multi_point_crossover(parent1, parent2)
+                children = (self.mutate(child1, self.mutation_rate), self.mutate(child2, self.mutation_rate))
+                children_keys = (None, None)
 
-            new_population.append(child1)
-            if len(new_population) < self.population_size:
-                new_population.append(child2)
+            for child, key in zip(children, children_keys):
+                if len(new_population) < self.population_size:
+                    new_population.append(child)
+                    new_keys.append(key)
 
+        self.population_keys = new_keys
         return new_population
 
-    def _pmx_fix_collisions(self, child_elements, mapping, point1, point2):
+    def _pmx_fix_collisions(self, own, other, point1, point2):
         """
-        Corrige colisões causadas pelo cruzamento PMX, garantindo que cada item apareça apenas uma vez.
+        Troca o segmento `point1:point2` de `own` pelo de `other` e corrige as colisões, garantindo
+        que o filho contenha cada tamanho de item exatamente tantas vezes quanto os pais.
+
+        Como os itens se repetem, o mapeamento posição a posição do PMX clássico pode formar
+        ciclos; em vez dele, as cópias excedentes fora da faixa de cruzamento são substituídas,
+        da esquerda para a direita, pelos itens que faltam, na ordem do segmento deslocado.
 
         Args:
-            child_elements (list): Os elementos do filho gerado após a troca.
-            mapping (dict): Mapeamento entre os itens trocados nos pais.
+            own (list): Blocos (tamanho, quantidade) do pai que recebe o segmento.
+            other (list): Blocos (tamanho, quantidade) do pai que cede o segmento.
             point1 (int): Primeiro ponto de cruzamento.
             point2 (int): Segundo ponto de cruzamento.
-        """
-        swapped_elements = set(child_elements[point1:point2])
 
-        # Percorre os elementos fora da faixa de cruzamento
-        for i in list(range(0, point1)) + list(range(point2, len(child_elements))):
-            # Se o elemento estiver em swapped_elements, ele precisa ser corrigido
-            while child_elements[i] in swapped_elements:
-                child_elements[i] = mapping[child_elements[i]]
+        Returns:
+            list: Blocos (tamanho, quantidade) do filho.
+        """
+        segment = slice_runs(other, point1, point2)
+        displaced = slice_runs(own, point1, point2)
+        surplus = type_counts(segment)
+        for size, count in displaced:
+            surplus[size] = surplus.get(size, 0) - count
+        missing = {size: -count for size, count in surplus.items() if count < 0}
+        replacements = take_runs(displaced, missing)
+
+        # Percorre os elementos fora da faixa de cruzamento (prefixo e sufixo, em sequência)
+        length = runs_length(own)
+        outside = replace_surplus(slice_runs(own, 0, point1) + slice_runs(own, point2, length),
+                                  surplus, replacements)
+        return slice_runs(outside, 0, point1) + segment + slice_runs(outside, point1, length)
+
+    def _complete_with(self, prefix, other_parent):
+        """
+        Completa os blocos `prefix` com os itens que ainda faltam, na ordem em que aparecem em `other_parent`.
+        """
+        remaining = dict(self.item_counts)
+        for size, count in prefix:
+            remaining[size] -= count
+        return prefix + take_runs(other_parent, remaining)
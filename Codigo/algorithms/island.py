@@ -0,0 +1,184 @@
+"""
+Modelo de ilhas para o GGA.
+
+Uma única instância é resolvida por várias subpopulações (ilhas), cada uma em
+seu próprio processo, que a cada `migration_interval` gerações enviam seus
+melhores indivíduos às ilhas vizinhas. A topologia pode ser em anel ('ring',
+cada ilha envia para a seguinte) ou totalmente conectada ('full', cada ilha
+envia para todas as outras).
+
+A migração é síncrona: em cada época a ilha envia seus emigrantes e espera os
+imigrantes de todas as ilhas de origem ainda ativas. Uma ilha que termina
+(por estagnação ou fim das gerações) avisa as vizinhas, que deixam de esperá-la.
+As filas são de um `multiprocessing.Manager`, de modo que mensagens enviadas a
+uma ilha que já terminou não impedem o processo remetente de encerrar.
+"""
+
+import multiprocessing
+import queue
+import numpy as np
+from collections import deque
+from algorithms.gga import GGA
+from algorithms.parallel_tabu import encode_solution, decode_solution
+from utils.rng import derive_seed
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def island_targets(island_id, num_islands, topology):
+    """Retorna as ilhas para as quais a ilha `island_id` envia emigrantes."""
+    if topology == 'ring':
+        return [(island_id + 1) % num_islands] if num_islands > 1 else []
+    if topology == 'full':
+        return [i for i in range(num_islands) if i != island_id]
+    raise ValueError(f"Topologia desconhecida: {topology}")
+
+
+class Migration:
+
+    def __init__(self, island_id, inboxes, topology, interval, migrants, capacity):
+        """
+        Canal de migração de uma ilha.
+
+        Args:
+            island_id (int): Índice desta ilha.
+            inboxes (list): Filas de entrada de todas as ilhas.
+            topology (str): 'ring' ou 'full'.
+            interval (int): Número de gerações entre migrações.
+            migrants (int): Número de indivíduos enviados em cada migração.
+            capacity (int): Capacidade dos contêineres (para reconstruir os imigrantes).
+        """
+        num_islands = len(inboxes)
+        self.island_id = island_id
+        self.inbox = inboxes[island_id]
+        self.targets = [inboxes[i] for i in island_targets(island_id, num_islands, topology)]
+        self.sources = {i for i in range(num_islands)
+                        if island_id in island_targets(i, num_islands, topology)}
+        self.interval = interval
+        self.migrants = migrants
+        self.capacity = capacity
+        self.pending = {source: deque() for source in self.sources}
+
+    def due(self, generation):
+        return (generation + 1) % self.interval == 0
+
+    def exchange(self, emigrants):
+        """
+        Envia os emigrantes às ilhas de destino e recebe os imigrantes desta época.
+
+        Returns:
+            list: Os imigrantes, ordenados pela ilha de origem.
+        """
+        message = (self.island_id, [encode_solution(solution) for solution in emigrants])
+        for target in self.targets:
+            target.put(message)
+
+        while any(not self.pending[source] for source in self.sources):
+            source, encoded = self.inbox.get()
+            if source in self.pending:
+                self.pending[source].append(encoded)
+
+        immigrants = []
+        for source in sorted(self.sources):
+            encoded = self.pending[source].popleft()
+            if encoded is None:
+                # A ilha de origem terminou: não há mais imigrantes dela
+                self.sources.discard(source)
+                continue
+            immigrants.extend(decode_solution(item, self.capacity) for item in encoded)
+        return immigrants
+
+    def finish(self):
+        """Avisa as ilhas de destino que esta ilha terminou."""
+        for target in self.targets:
+            target.put((self.island_id, None))
+
+
+def _island_worker(island_id, data, inboxes, results, topology, interval, migrants):
+    # Cada ilha tem seu próprio fluxo aleatório, derivado da semente da instância
+    seed = derive_seed(data.get('seed'), island_id)
+    gga = GGA(dict(data, seed=seed))
+    gga.migration = Migration(island_id, inboxes, topology, interval, migrants,
+                              gga.container_capacity)
+    try:
+        best_solution = gga.run()
+    finally:
+        gga.migration.finish()
+    results.put((island_id, encode_solution(best_solution), gga.fitness(best_solution), gga.history))
+
+
+class IslandModel:
+
+    def __init__(self, data, num_islands, migration_interval=10, topology='ring', migrants=2):
+        """
+        Inicializa o modelo de ilhas.
+
+        Args:
+            data (dict): Dados da instância e parâmetros do GGA (ver `GGA.__init__`). A semente
+                ('seed') de cada ilha é derivada da semente da instância.
+            num_islands (int): Número de ilhas (processos).
+            migration_interval (int): Número de gerações entre migrações.
+            topology (str): 'ring' ou 'full'.
+            migrants (int): Número de indivíduos enviados por ilha em cada migração.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topologia desconhecida: {topology}")
+        self.data = data
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.topology = topology
+        self.migrants = migrants
+        self.container_capacity = data.get('bin_capacity', 0)
+        # Sem semente, sorteia uma: processos criados por fork herdariam o mesmo estado do
+        # módulo `random` e todas as ilhas evoluiriam de forma idêntica
+        self.seed = data.get('seed')
+        if self.seed is None:
+            self.seed = np.random.SeedSequence().entropy
+        self.history = {}
+
+    def run(self):
+        """
+        Executa todas as ilhas em paralelo e retorna a melhor solução encontrada.
+
+        O histórico (`history`) é o da ilha vencedora, acrescido de 'best_island' e
+        'island_best_fitness' (melhor fitness final de cada ilha).
+
+        Returns:
+            list: A melhor solução entre todas as ilhas.
+        """
+        with multiprocessing.Manager() as manager:
+            inboxes = [manager.Queue() for _ in range(self.num_islands)]
+            results = manager.Queue()
+            processes = [multiprocessing.Process(target=_island_worker,
+                                                 args=(island_id, dict(self.data, seed=self.seed),
+                                                       inboxes, results,
+                                                       self.topology, self.migration_interval,
+                                                       self.migrants))
+                         for island_id in range(self.num_islands)]
+            for process in processes:
+                process.start()
+
+            try:
+                outcomes = []
+                while len(outcomes) < len(processes):
+                    try:
+                        outcomes.append(results.get(timeout=1))
+                    except queue.Empty:
+                        if any(process.exitcode not in (None, 0) for process in processes):
+                            raise RuntimeError("Uma das ilhas terminou com erro")
+            except BaseException:
+                # As demais ilhas podem estar esperando imigrantes que nunca chegarão
+                for process in processes:
+                    process.terminate()
+                raise
+            finally:
+                for process in processes:
+                    process.join()
+
+        outcomes.sort(key=lambda outcome: outcome[0])
+
+        best_island, encoded, _, history = min(outcomes, key=lambda outcome: outcome[2])
+        self.history = dict(history)
+        self.history['best_island'] = best_island
+        self.history['island_best_fitness'] = [outcome[2] for outcome in outcomes]
+        return decode_solution(encoded, self.container_capacity)
@@ -0,0 +1,116 @@
+"""
+Sequências de itens representadas por tipos.
+
+Os cruzamentos por permutação (ponto único, multi-pontos e PMX) trabalham sobre a sequência
+dos itens dos pais. Como os itens se repetem e os contêineres guardam apenas a contagem de
+cada tamanho, a sequência é representada como uma lista de blocos `(tamanho, quantidade)`
+na ordem dos contêineres, sem expandir um valor por item: as operações abaixo custam
+O(blocos) em vez de O(itens).
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+import numpy as np
+
+
+def solution_runs(solution):
+    """
+    Blocos `(tamanho, quantidade)` de uma solução, na ordem dos contêineres.
+
+    A expansão dos blocos é a mesma sequência que concatenar `container.elements` de cada contêiner.
+    """
+    return [(size, count) for container in solution for size, count in container.counts.items()]
+
+
+def type_counts(runs):
+    """Quantidade total de itens de cada tamanho em uma lista de blocos."""
+    counts = {}
+    for size, count in runs:
+        counts[size] = counts.get(size, 0) + count
+    return counts
+
+
+def runs_length(runs):
+    """Número de itens representados por uma lista de blocos."""
+    return sum(count for _, count in runs)
+
+
+def slice_runs(runs, start, stop):
+    """Blocos dos itens nas posições `start` a `stop - 1` da sequência expandida."""
+    if start >= stop:
+        return []
+    # Posição final (exclusiva) de cada bloco; os blocos das pontas são recortados
+    ends = list(accumulate(count for _, count in runs))
+    first = bisect_right(ends, start)
+    last = bisect_left(ends, stop)
+    sliced = runs[first:last + 1]
+    if not sliced:
+        return sliced
+    size, count = sliced[-1]
+    sliced[-1] = (size, count - (ends[last] - stop)) if last < len(ends) else (size, count)
+    size, count = sliced[0]
+    sliced[0] = (size, count - (start - (ends[first] - runs[first][1])))
+    return sliced
+
+
+def take_runs(runs, remaining):
+    """
+    Percorre os blocos em ordem e mantém, de cada tamanho, apenas as primeiras `remaining[tamanho]` cópias.
+
+    Args:
+        runs (list): Blocos `(tamanho, quantidade)`.
+        remaining (dict): Quantas cópias de cada tamanho ainda faltam (decrementado no lugar).
+
+    Returns:
+        list: Os blocos mantidos, na ordem original.
+    """
+    taken = []
+    for size, count in runs:
+        wanted = remaining.get(size, 0)
+        if wanted > 0:
+            count = min(count, wanted)
+            remaining[size] = wanted - count
+            taken.append((size, count))
+    return taken
+
+
+def replace_surplus(runs, surplus, replacements):
+    """
+    Substitui, da esquerda para a direita, as cópias excedentes de cada tamanho pelos itens de `replacements`.
+
+    Args:
+        runs (list): Blocos `(tamanho, quantidade)` a corrigir.
+        surplus (dict): Quantas cópias de cada tamanho sobram (decrementado no lugar).
+        replacements (list): Blocos dos itens que entram no lugar das cópias excedentes, em ordem.
+
+    Returns:
+        list: Os blocos corrigidos.
+    """
+    fixed = []
+    index, used = 0, 0
+    for size, count in runs:
+        excess = min(count, surplus.get(size, 0))
+        if excess > 0:
+            surplus[size] -= excess
+            # As primeiras cópias do bloco dão lugar aos próximos `excess` itens de reposição
+            while excess:
+                replacement, available = replacements[index]
+                taken = min(excess, available - used)
+                fixed.append((replacement, taken))
+                excess -= taken
+                count -= taken
+                used += taken
+                if used == available:
+                    index, used = index + 1, 0
+        if count:
+            fixed.append((size, count))
+    return fixed
+
+
+def expand_runs(runs):
+    """Sequência expandida (um valor por item) de uma lista de blocos, como array int64."""
+    if not runs:
+        return np.zeros(0, dtype=np.int64)
+    sizes, counts = zip(*runs)
+    return np.repeat(np.asarray(sizes, dtype=np.int64), counts)
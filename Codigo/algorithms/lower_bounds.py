@@ -0,0 +1,71 @@
+"""
+Limitantes inferiores para o número de bins de uma instância.
+
+- L1: o limitante contínuo, ceil(soma dos itens / capacidade).
+- L2: o limitante de Martello e Toth, que para cada limiar K separa os itens
+  grandes (que não podem dividir um bin entre si) dos pequenos e verifica se
+  estes cabem no espaço deixado pelos grandes. L2 >= L1 sempre.
+
+Nenhuma solução pode usar menos bins do que o limitante; uma solução que o
+atinge é ótima.
+"""
+
+import numpy as np
+
+
+def l1_bound(weights, capacity):
+    """
+    Calcula o limitante L1 = ceil(soma dos itens / capacidade).
+
+    Args:
+        weights (list): Tamanhos dos itens.
+        capacity (int): Capacidade dos bins.
+
+    Returns:
+        int: O limitante L1.
+    """
+    total = int(np.sum(np.asarray(weights, dtype=np.int64)))
+    return -(-total // capacity)
+
+
+def l2_bound(weights, capacity):
+    """
+    Calcula o limitante L2 de Martello e Toth.
+
+    Para cada limiar K (0 e os tamanhos distintos até capacidade/2), os itens são
+    divididos em N1 (w > C - K), N2 (C/2 < w <= C - K) e N3 (K <= w <= C/2). Os
+    itens de N1 e N2 ocupam um bin cada, e os de N3 precisam de bins extras na
+    medida em que não cabem no espaço livre dos bins de N2:
+
+        L(K) = |N1| + |N2| + max(0, ceil((soma(N3) - (|N2| * C - soma(N2))) / C))
+
+    O cálculo usa os itens ordenados e somas prefixadas, em O(n log n).
+
+    Args:
+        weights (list): Tamanhos dos itens.
+        capacity (int): Capacidade dos bins.
+
+    Returns:
+        int: O limitante L2 (maior valor de L(K)).
+    """
+    w = np.sort(np.asarray(weights, dtype=np.int64))
+    if w.size == 0:
+        return 0
+    prefix = np.concatenate(([0], np.cumsum(w)))
+    n = w.size
+
+    # Itens com w > C/2 começam em `big` (para inteiros, w > C/2 equivale a 2w > C)
+    big = int(np.searchsorted(w, capacity // 2, side='right'))
+    ks = np.unique(np.concatenate(([0], w[:big])))
+
+    # N3: [lo, big); N2: [big, hi); N1: [hi, n)
+    lo = np.searchsorted(w, ks, side='left')
+    hi = np.maximum(np.searchsorted(w, capacity - ks, side='right'), big)
+
+    n1 = n - hi
+    n2 = hi - big
+    free = n2 * capacity - (prefix[hi] - prefix[big])
+    excess = (prefix[big] - prefix[lo]) - free
+    extra = np.maximum(0, -(-excess // capacity))
+
+    return max(int((n1 + n2 + extra).max()), l1_bound(w, capacity))
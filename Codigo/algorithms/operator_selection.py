@@ -0,0 +1,97 @@
+"""
+Seleção adaptativa de operadores para o GGA.
+
+Cada operador (de cruzamento ou de mutação) é um "braço" de um multi-armed bandit.
+Após cada aplicação, o operador recebe um crédito igual à melhoria de fitness que
+produziu dividida pelo custo da aplicação (tempo de CPU, por padrão). A escolha segue
+o UCB1 sobre a média dos créditos recentes (janela deslizante), normalizada pelo melhor
+operador, de modo que o tempo de execução é gasto nos operadores que de fato melhoram
+as soluções.
+
+A exploração é ajustada pela estagnação da busca: quanto mais gerações sem melhoria,
+maior o peso do termo de exploração, dando nova chance a operadores pouco usados.
+"""
+
+import math
+from collections import Counter, deque
+
+
+class AdaptiveOperatorSelector:
+    """
+    Escolhe operadores pelo UCB1 com créditos de melhoria por unidade de custo.
+
+    Args:
+        operators (list): Nomes dos operadores disponíveis.
+        window (int, opcional): Número de aplicações recentes consideradas por operador.
+        exploration (float, opcional): Peso base do termo de exploração do UCB1.
+    """
+
+    def __init__(self, operators, window=50, exploration=0.5):
+        if not operators:
+            raise ValueError("É necessário ao menos um operador")
+        self.operators = list(operators)
+        self.exploration = exploration
+        self.stagnation = 0.0
+        self.credits = {operator: deque(maxlen=window) for operator in self.operators}
+        # Aplicações e sucessos (melhoria positiva) desde a última chamada de `generation_stats`
+        self.uses = Counter()
+        self.successes = Counter()
+
+    def set_stagnation(self, ratio):
+        """
+        Informa a fração do limite de estagnação já atingida (0 = busca melhorando).
+        """
+        self.stagnation = min(max(ratio, 0.0), 1.0)
+
+    def select(self):
+        """
+        Retorna o operador a ser aplicado.
+
+        Operadores ainda sem crédito registrado são escolhidos primeiro, na ordem em que
+        foram informados; depois, vence o maior escore UCB1.
+        """
+        for operator in self.operators:
+            if not self.credits[operator]:
+                return operator
+
+        means = {operator: sum(credits) / len(credits) for operator, credits in self.credits.items()}
+        best_mean = max(means.values())
+        total = sum(len(credits) for credits in self.credits.values())
+        weight = self.exploration * (1.0 + self.stagnation)
+
+        def score(operator):
+            exploitation = means[operator] / best_mean if best_mean > 0 else 0.0
+            return exploitation + weight * math.sqrt(2.0 * math.log(total) / len(self.credits[operator]))
+
+        return max(self.operators, key=score)
+
+    def update(self, operator, improvement, cost):
+        """
+        Registra o resultado de uma aplicação do operador.
+
+        Args:
+            operator (str): O operador aplicado.
+            improvement (float): Redução do fitness obtida (valores negativos contam como zero).
+            cost (float): Custo da aplicação (ex.: segundos de CPU).
+        """
+        improvement = max(improvement, 0.0)
+        self.credits[operator].append(improvement / cost if cost > 0 else improvement)
+        self.uses[operator] += 1
+        if improvement > 0:
+            self.successes[operator] += 1
+
+    def generation_stats(self):
+        """
+        Retorna o uso e a taxa de sucesso de cada operador desde a chamada anterior e
+        reinicia a contagem.
+
+        Returns:
+            tuple: (usos, taxas de sucesso), dicionários indexados pelo nome do operador;
+                a taxa é None para operadores não aplicados no período.
+        """
+        usage = {operator: self.uses[operator] for operator in self.operators}
+        success_rate = {operator: self.successes[operator] / usage[operator] if usage[operator] else None
+                        for operator in self.operators}
+        self.uses.clear()
+        self.successes.clear()
+        return usage, success_rate
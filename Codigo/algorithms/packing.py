@@ -0,0 +1,316 @@
+"""
+Núcleo de empacotamento para o problema de Bin Packing.
+
+Implementa as heurísticas construtivas clássicas com estruturas de dados
+que evitam o custo O(n·bins) de manter listas ordenadas com `del` + `insert`:
+
+- 'ffd' (First-Fit Decreasing): árvore de segmentos de máximos sobre os espaços
+  restantes dos bins, permitindo achar o primeiro bin com espaço em O(log n).
+- 'bfd' (Best-Fit Decreasing) e 'wfd' (Worst-Fit Decreasing): lista ordenada em
+  blocos (no estilo do `SortedList` do pacote sortedcontainers) com os espaços
+  restantes dos bins, permitindo achar o bin mais justo (ou mais folgado) com
+  duas buscas binárias e inserções em blocos de tamanho limitado.
+- 'nfd' (Next-Fit Decreasing): mantém apenas o bin aberto mais recente.
+
+Itens consecutivos de mesmo tamanho (em instâncias ordenadas, todos os itens de um
+mesmo tipo) são empacotados em bloco: FFD, BFD e NFD colocam de uma vez no bin
+escolhido tantas cópias quantas couberem, o que dá o mesmo resultado de colocá-las
+uma a uma com custo proporcional ao número de tipos e de bins, e não de itens.
+"""
+
+import bisect
+import numpy as np
+
+HEURISTICS = ('ffd', 'bfd', 'wfd', 'nfd')
+
+
+def pack(weights, capacity, heuristic='bfd', presorted=False, loads=None):
+    """
+    Empacota os itens usando a heurística indicada.
+
+    Args:
+        weights (list): Pesos dos itens.
+        capacity (int): Capacidade de cada bin.
+        heuristic (str): Uma de 'ffd', 'bfd', 'wfd' ou 'nfd'.
+        presorted (bool): Se True, os itens são empacotados na ordem recebida, sem
+            ordenação decrescente.
+        loads (np.ndarray, opcional): Cargas de bins já abertos (índices 0..k-1), que recebem
+            itens antes de novos bins serem abertos.
+
+    Returns:
+        tuple: (assignment, loads), onde `assignment` é um array com o índice do bin de
+            cada item (na ordem de `weights`) e `loads` é a carga de cada bin usado
+            (incluindo os bins já abertos).
+
+    Raises:
+        ValueError: Se a heurística for desconhecida ou algum item exceder a capacidade.
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Heurística de empacotamento desconhecida: {heuristic}")
+
+    weights = np.asarray(weights, dtype=np.int64)
+    if len(weights) and weights.max() > capacity:
+        raise ValueError("Capacidade excedida no container!")
+
+    if presorted:
+        order = np.arange(len(weights))
+    else:
+        order = np.argsort(-weights, kind='stable')
+
+    initial = [] if loads is None else np.asarray(loads, dtype=np.int64).tolist()
+    max_bins = len(initial) + len(weights)
+    sizes, counts = item_runs(weights[order])
+    if heuristic == 'ffd':
+        bins, repeats, loads = _first_fit(sizes, counts, capacity, max_bins, initial)
+    elif heuristic == 'nfd':
+        bins, repeats, loads = _next_fit(sizes, counts, capacity, initial)
+    elif heuristic == 'bfd':
+        bins, repeats, loads = _best_fit(sizes, counts, capacity, max_bins, initial)
+    else:
+        bins, repeats, loads = _worst_fit(sizes, counts, capacity, max_bins, initial)
+
+    assignment = np.empty(len(weights), dtype=np.int64)
+    assignment[order] = np.repeat(np.asarray(bins, dtype=np.int64), repeats)
+    return assignment, np.asarray(loads, dtype=np.int64)
+
+
+def item_runs(items):
+    """
+    Comprime uma sequência de itens em blocos de itens consecutivos de mesmo tamanho.
+
+    Args:
+        items (np.ndarray): Tamanhos dos itens, na ordem de empacotamento.
+
+    Returns:
+        tuple: (sizes, counts), listas com o tamanho e a quantidade de itens de cada bloco.
+    """
+    if not len(items):
+        return [], []
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(items)) + 1))
+    counts = np.diff(np.append(starts, len(items)))
+    return items[starts].tolist(), counts.tolist()
+
+
+def _fitting(residual, size, count):
+    # Quantas cópias de um item de tamanho `size` cabem no espaço `residual` (no máximo `count`)
+    return count if size == 0 else min(count, residual // size)
+
+
+def _first_fit(sizes, counts, capacity, max_bins, initial):
+    tree = _FirstFitTree(max_bins, capacity, [capacity - load for load in initial])
+    bins = []
+    repeats = []
+    loads = list(initial)
+    for size, count in zip(sizes, counts):
+        while count:
+            index = tree.find(size)
+            if index == len(loads):
+                # Nenhum bin aberto comporta o item, e os bins novos ficam sem espaço para outra
+                # cópia: as cópias restantes vão para bins novos consecutivos, colocados em bloco
+                per_bin = _fitting(capacity, size, count)
+                full = count // per_bin
+                tree.fill(index, index + full, capacity - per_bin * size)
+                bins.extend(range(index, index + full))
+                repeats.extend([per_bin] * full)
+                loads.extend([per_bin * size] * full)
+                count -= full * per_bin
+                continue
+            placed = _fitting(capacity - loads[index], size, count)
+            loads[index] += placed * size
+            tree.update(index, capacity - loads[index])
+            bins.append(index)
+            repeats.append(placed)
+            count -= placed
+    return bins, repeats, loads
+
+
+def _next_fit(sizes, counts, capacity, initial):
+    # Apenas o último bin já aberto continua recebendo itens
+    bins = []
+    repeats = []
+    loads = list(initial)
+    for size, count in zip(sizes, counts):
+        while count:
+            placed = _fitting(capacity - loads[-1], size, count) if loads else 0
+            if not placed:
+                loads.append(0)
+                placed = _fitting(capacity, size, count)
+            loads[-1] += placed * size
+            bins.append(len(loads) - 1)
+            repeats.append(placed)
+            count -= placed
+    return bins, repeats, loads
+
+
+def _best_fit(sizes, counts, capacity, max_bins, initial):
+    # Depois de receber cópias de um item, o bin mais justo continua sendo o mais justo
+    # enquanto comportar o item, então as cópias podem ser colocadas de uma vez
+    residuals = _SortedResiduals(max_bins, [capacity - load for load in initial])
+    bins = []
+    repeats = []
+    loads = list(initial)
+    for size, count in zip(sizes, counts):
+        while count:
+            index = residuals.pop_best(size)
+            if index is None:
+                index = len(loads)
+                loads.append(0)
+            placed = _fitting(capacity - loads[index], size, count)
+            loads[index] += placed * size
+            residuals.add(capacity - loads[index], index)
+            bins.append(index)
+            repeats.append(placed)
+            count -= placed
+    return bins, repeats, loads
+
+
+def _worst_fit(sizes, counts, capacity, max_bins, initial):
+    # No Worst-Fit o bin mais folgado muda a cada item: as cópias são colocadas uma a uma
+    residuals = _SortedResiduals(max_bins, [capacity - load for load in initial])
+    bins = []
+    loads = list(initial)
+    for size, count in zip(sizes, counts):
+        for _ in range(count):
+            index = residuals.pop_worst(size)
+            if index is None:
+                index = len(loads)
+                loads.append(0)
+            loads[index] += size
+            residuals.add(capacity - loads[index], index)
+            bins.append(index)
+    return bins, 1, loads
+
+
+class _FirstFitTree:
+    """Árvore de segmentos de máximos sobre os espaços restantes dos bins."""
+
+    def __init__(self, num_bins, capacity, residuals=()):
+        size = 1
+        while size < max(num_bins, 1):
+            size *= 2
+        self.size = size
+        if not residuals:
+            # Bins ainda não abertos têm o espaço inteiro disponível
+            self.tree = [capacity] * (2 * size)
+            return
+
+        # Construção de baixo para cima, nível a nível, a partir dos bins já abertos
+        level = np.full(size, capacity, dtype=np.int64)
+        level[:len(residuals)] = residuals
+        levels = [level]
+        while len(level) > 1:
+            level = np.maximum(level[0::2], level[1::2])
+            levels.append(level)
+        self.tree = [capacity] + np.concatenate(levels[::-1]).tolist()
+
+    def find(self, item):
+        """Retorna o índice do primeiro bin com espaço restante >= item."""
+        tree = self.tree
+        node = 1
+        while node < self.size:
+            node *= 2
+            if tree[node] < item:
+                node += 1
+        return node - self.size
+
+    def update(self, index, residual):
+        tree = self.tree
+        node = index + self.size
+        tree[node] = residual
+        node //= 2
+        while node:
+            left = tree[2 * node]
+            right = tree[2 * node + 1]
+            best = left if left >= right else right
+            if tree[node] == best:
+                # Os ancestrais já refletem este máximo
+                break
+            tree[node] = best
+            node //= 2
+
+
+    def fill(self, start, stop, residual):
+        """Atribui o mesmo espaço restante aos bins `start` a `stop - 1`."""
+        if stop - start == 1:
+            return self.update(start, residual)
+        tree = self.tree
+        start += self.size
+        stop += self.size
+        tree[start:stop] = [residual] * (stop - start)
+        # Recalcula os ancestrais nível a nível, apenas no intervalo afetado
+        while start > 1:
+            start //= 2
+            stop = (stop + 1) // 2
+            tree[start:stop] = map(max, tree[2 * start:2 * stop:2], tree[2 * start + 1:2 * stop:2])
+
+
+class _SortedResiduals:
+    """
+    Conjunto ordenado dos bins abertos, indexado pelo espaço restante.
+
+    Cada bin é guardado como a chave `espaço_restante * max_bins + índice`, de modo que
+    empates são resolvidos pelo menor índice. As chaves ficam em blocos ordenados de até
+    `2 * LOAD` elementos; `maxes` guarda o maior valor de cada bloco para a busca binária.
+    """
+
+    LOAD = 256
+
+    def __init__(self, max_bins, residuals=()):
+        self.max_bins = max(max_bins, 1)
+        self.buckets = []
+        self.maxes = []
+        if len(residuals):
+            # Carga inicial em bloco: as chaves já ordenadas são divididas em blocos de LOAD
+            keys = np.sort(np.asarray(residuals, dtype=np.int64) * self.max_bins
+                           + np.arange(len(residuals))).tolist()
+            self.buckets = [keys[i:i + self.LOAD] for i in range(0, len(keys), self.LOAD)]
+            self.maxes = [bucket[-1] for bucket in self.buckets]
+
+    def add(self, residual, index):
+        key = residual * self.max_bins + index
+        buckets = self.buckets
+        maxes = self.maxes
+        if not buckets:
+            buckets.append([key])
+            maxes.append(key)
+            return
+
+        position = bisect.bisect_left(maxes, key)
+        if position == len(maxes):
+            position -= 1
+            buckets[position].append(key)
+            maxes[position] = key
+        else:
+            bisect.insort(buckets[position], key)
+
+        bucket = buckets[position]
+        if len(bucket) > 2 * self.LOAD:
+            # Divide o bloco para manter as inserções baratas
+            buckets[position:position + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            maxes[position:position + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+
+    def pop_best(self, item):
+        """Remove e retorna o bin com o menor espaço restante >= item (ou None)."""
+        key = item * self.max_bins
+        position = bisect.bisect_left(self.maxes, key)
+        if position == len(self.maxes):
+            return None
+        bucket = self.buckets[position]
+        return self._pop(position, bisect.bisect_left(bucket, key))
+
+    def pop_worst(self, item):
+        """Remove e retorna o bin com o maior espaço restante, se ele comportar o item."""
+        if not self.maxes or self.maxes[-1] < item * self.max_bins:
+            return None
+        position = len(self.buckets) - 1
+        return self._pop(position, len(self.buckets[position]) - 1)
+
+    def _pop(self, position, offset):
+        bucket = self.buckets[position]
+        key = bucket.pop(offset)
+        if not bucket:
+            del self.buckets[position]
+            del self.maxes[position]
+        elif offset == len(bucket):
+            self.maxes[position] = bucket[-1]
+        return key % self.max_bins
@@ -0,0 +1,121 @@
+"""
+Execução paralela da Busca Tabu sobre a elite do GGA.
+
+Os processos do pool são criados uma única vez e reaproveitados entre as
+gerações. As soluções trafegam entre os processos em uma representação
+compacta (arrays NumPy com os tipos de item de cada bin, isto é, tamanho e
+quantidade) em vez de listas de objetos `Container`, e cada busca recebe sua própria
+semente, o que torna o resultado independente do número de processos.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from models.container import Container
+from algorithms.tabu_search import Tabu_Search
+
+# Objeto GGA mínimo de cada processo do pool (usado pela Busca Tabu para o fitness)
+_worker_gga = None
+
+
+def encode_solution(solution):
+    """
+    Converte uma solução em uma representação compacta, agregada por tipo de item.
+
+    Returns:
+        tuple: (sizes, counts, lengths), onde `sizes` e `counts` contêm os tipos de item
+            (tamanho e quantidade) de todos os bins concatenados e `lengths` o número de
+            tipos de cada bin.
+    """
+    sizes = np.fromiter((size for container in solution for size in container.counts),
+                        dtype=np.int64)
+    counts = np.fromiter((count for container in solution for count in container.counts.values()),
+                         dtype=np.int64, count=len(sizes))
+    lengths = np.fromiter((len(container.counts) for container in solution),
+                          dtype=np.int64, count=len(solution))
+    return sizes, counts, lengths
+
+
+def decode_solution(encoded, capacity):
+    """
+    Reconstrói a lista de contêineres a partir da representação de `encode_solution`.
+    """
+    sizes, counts, lengths = encoded
+    solution = []
+    start = 0
+    sizes = sizes.tolist()
+    counts = counts.tolist()
+    for length in lengths.tolist():
+        container = Container(capacity)
+        for size, count in zip(sizes[start:start + length], counts[start:start + length]):
+            container.add_elements(size, count)
+        solution.append(container)
+        start += length
+    return solution
+
+
+def _init_worker(capacity, target_fitness):
+    global _worker_gga
+    # Importado aqui para evitar import circular (gga importa este módulo)
+    from algorithms.gga import GGA
+    _worker_gga = GGA({'weights': [], 'bin_capacity': capacity})
+    # O GGA do processo não conhece os itens; o critério de parada vem do GGA principal
+    _worker_gga.target_fitness = target_fitness
+
+
+def _search_task(task):
+    encoded, seed, max_iterations, tabu_tenure, max_neighbors, time_limit = task
+    solution = decode_solution(encoded, _worker_gga.container_capacity)
+    TS = Tabu_Search(_worker_gga, max_iterations=max_iterations, tabu_tenure=tabu_tenure,
+                     max_neighbors=max_neighbors, seed=seed, time_limit=time_limit)
+    best = TS.search(solution)
+    return encode_solution(best), (TS.neighbors_evaluated, TS.moves_accepted, TS.tabu_hits)
+
+
+class TabuWorkerPool:
+
+    def __init__(self, workers, capacity, target_fitness=float('-inf')):
+        """
+        Cria o pool de processos para a Busca Tabu.
+
+        Args:
+            workers (int): Número de processos.
+            capacity (int): Capacidade dos contêineres da instância.
+            target_fitness (float, opcional): Fitness de uma solução que atinge o limitante
+                inferior; as buscas param ao alcançá-lo.
+        """
+        self.capacity = capacity
+        # Totais das buscas do pool: vizinhos avaliados, movimentos aceitos e descartes pela lista tabu
+        self.neighbors_evaluated = 0
+        self.moves_accepted = 0
+        self.tabu_hits = 0
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(capacity, target_fitness))
+
+    def search_many(self, solutions, seeds, max_iterations, tabu_tenure, max_neighbors, time_limit=None):
+        """
+        Executa uma Busca Tabu independente para cada solução.
+
+        Args:
+            solutions (list): Soluções a serem melhoradas.
+            seeds (list): Semente da busca de cada solução.
+            max_iterations (int): Número máximo de iterações de cada busca.
+            tabu_tenure (int): Tamanho da lista tabu.
+            max_neighbors (int): Número de vizinhos por iteração.
+            time_limit (float, opcional): Tempo máximo (s) de cada busca, contado a partir do
+                seu início no processo. None = sem limite.
+
+        Returns:
+            list: As soluções melhoradas, na mesma ordem de `solutions`.
+        """
+        tasks = [(encode_solution(solution), seed, max_iterations, tabu_tenure, max_neighbors, time_limit)
+                 for solution, seed in zip(solutions, seeds)]
+        results = []
+        for encoded, (neighbors_evaluated, moves_accepted, tabu_hits) in self.executor.map(_search_task, tasks):
+            self.neighbors_evaluated += neighbors_evaluated
+            self.moves_accepted += moves_accepted
+            self.tabu_hits += tabu_hits
+            results.append(decode_solution(encoded, self.capacity))
+        return results
+
+    def close(self):
+        self.executor.shutdown()
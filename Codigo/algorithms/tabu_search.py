@@ -1,9 +1,12 @@
 import random
+import time
 from collections import deque
+from models.solution import Solution
 
 
 class Tabu_Search:
-    def __init__(self, gga, max_iterations=100, tabu_tenure=5, max_neighbors=100):
+    def __init__(self, gga, max_iterations=100, tabu_tenure=5, max_neighbors=100, seed=None,
+                 time_limit=None):
         """
         Inicializa o algoritmo de Busca Tabu com os parâmetros fornecidos.
 
@@ -12,13 +15,24 @@ class Tabu_Search:
             max_iterations (int, opcional): O número máximo de iterações para a Busca Tabu. Padrão é 100.
             tabu_tenure (int, opcional): O número de iterações que um movimento permanece na lista tabu. Padrão é 5.
             max_neighbors (int, opcional): O número máximo de vizinhos a considerar em cada iteração. Padrão é 100.
+            seed (int, opcional): Semente de um gerador próprio, tornando a busca reprodutível
+                independentemente do processo em que roda. Se None, usa o módulo `random` global.
+            time_limit (float, opcional): Tempo máximo de relógio (s) de cada chamada a `search`.
+                Se None, a busca é limitada apenas pelo número de iterações.
         """
         self.gga = gga
         self.max_iterations = max_iterations
         self.tabu_tenure = tabu_tenure
         self.max_neighbors = max_neighbors
+        self.time_limit = time_limit
         self.tabu_list = deque(maxlen=self.tabu_tenure)
         self.tabu_set = set()
+        self.random = random if seed is None else random.Random(seed)
+        # Total de vizinhos avaliados (usado pelo benchmark para medir vizinhos/segundo)
+        self.neighbors_evaluated = 0
+        # Movimentos aceitos e vizinhos descartados por estarem na lista tabu (instrumentação)
+        self.moves_accepted = 0
+        self.tabu_hits = 0
 
     def search(self, solution):
         """
@@ -32,18 +46,28 @@ class Tabu_Search:
 
         A função explora iterativamente a vizinhança da solução atual,
         atualizando a melhor solução encontrada e mantendo uma lista tabu para evitar ciclos.
-        A busca para quando o número máximo de iterações é alcançado ou nenhum
-        vizinho aceitável é encontrado.
+        A busca para quando o número máximo de iterações é alcançado, nenhum
+        vizinho aceitável é encontrado, a melhor solução atinge o limitante
+        inferior do GGA (`gga.reached_lower_bound`) ou o tempo limite se esgota.
+        Em todos os casos retorna a melhor solução encontrada até então.
         """
         current_solution = solution
+        current_fitness = self.gga.fitness(solution)
         best_solution = solution
-        best_fitness = self.gga.fitness(solution)
+        best_fitness = current_fitness
         iteration = 0
+        deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+
+        if self.gga.reached_lower_bound(best_fitness):
+            return best_solution
 
         while iteration < self.max_iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break  # Tempo esgotado: retorna a melhor solução até aqui
             neighbor_found = False
-            neighbors = self.generate_neighborhood(current_solution)
-            for neighbor, move, fitness in neighbors:
+            neighbors = self.generate_neighborhood(current_solution, current_fitness)
+            self.neighbors_evaluated += len(neighbors)
+            for move, fitness in neighbors:
                 if move not in self.tabu_set or fitness < best_fitness:
                     # Atualiza o tabu list
                     self.tabu_list.append(move)
@@ -52,81 +76,121 @@ class Tabu_Search:
                         oldest_move = self.tabu_list.popleft()
                         self.tabu_set.remove(oldest_move)
 
-                    current_solution = neighbor
+                    # Apenas o vizinho aceito é materializado
+                    current_solution = self.apply_move(current_solution, move)
+                    current_fitness = fitness
                     if fitness < best_fitness:
-                        best_solution = neighbor
+                        best_solution = current_solution
                         best_fitness = fitness
                     neighbor_found = True
+                    self.moves_accepted += 1
                     break  # Move para a próxima iteração
+                self.tabu_hits += 1
 
             if not neighbor_found:
                 break  # Nenhum vizinho aceitável encontrado
 
+            if self.gga.reached_lower_bound(best_fitness):
+                break  # Solução ótima: nenhum vizinho pode ser melhor
+
             iteration += 1
 
         return best_solution
 
-    def generate_neighborhood(self, solution):
+    def generate_neighborhood(self, solution, current_fitness):
         """
-        Gera uma vizinhança de soluções movendo elementos entre contêineres.
+        Gera uma vizinhança de movimentos de elementos entre contêineres.
 
         Args:
             solution (list): A solução atual representada como uma lista de contêineres.
+            current_fitness (float): A aptidão da solução atual.
 
         Returns:
-            list: Uma lista de tuplas, cada uma contendo uma nova solução, o movimento realizado e a aptidão da nova solução.
+            list: Uma lista de tuplas, cada uma contendo o movimento `(elemento, i, j)` e a aptidão
+            da solução resultante.
 
-        A função tenta gerar um número especificado de soluções vizinhas selecionando aleatoriamente dois contêineres
+        A função tenta gerar um número especificado de movimentos selecionando aleatoriamente dois contêineres
         e movendo um elemento de um contêiner para outro, se houver espaço suficiente. Ela garante que o número de vizinhos
-        não exceda `self.max_neighbors` e evita loops infinitos limitando o número de tentativas. Cada nova solução
-        é avaliada quanto à sua aptidão, e contêineres vazios são removidos antes de adicionar a solução à lista de vizinhos.
+        não exceda `self.max_neighbors` e evita loops infinitos limitando o número de tentativas. A aptidão de cada
+        vizinho é obtida em O(1) pela variação (`move_delta`) dos dois contêineres afetados, sem copiar a solução;
+        a solução vizinha só é construída por `apply_move` quando o movimento é aceito.
         """
         neighbors = []
-        n = len(solution)
+        # Uma única materialização por iteração: as leituras abaixo são feitas na lista
+        solution = list(solution)
 
-        indices = [i for i, container in enumerate(solution) if container.elements]
+        indices = [i for i, container in enumerate(solution) if len(container)]
 
         if not indices:
             return neighbors
 
         indices_com_espaco = [i for i, container in enumerate(solution) if container.remaining_space() > 0]
 
+        if not indices_com_espaco:
+            return neighbors
+
         max_attempts = self.max_neighbors * 10
         attempts = 0
 
         while(len(neighbors) < self.max_neighbors and attempts < max_attempts):
             attempts += 1
-            i = random.choice(indices)
-
-            possiveis_j = [j for j in indices_com_espaco if i != j]
+            i = self.random.choice(indices)
 
-            if not possiveis_j:
+            # Sorteia o destino diretamente (O(1)); se coincidir com a origem, a tentativa é descartada
+            j = self.random.choice(indices_com_espaco)
+            if j == i:
                 continue
-
-            j = random.choice(possiveis_j)
             container_i = solution[i]
             container_j = solution[j]
 
-            element = random.choice(container_i.elements)
+            # Sorteio ponderado pela quantidade de cada tamanho (como sortear um item da lista),
+            # sem expandir os itens do contêiner
+            element = container_i.random_element(self.random)
             if container_j.remaining_space() >= element:
-                new_container_i = container_i.copy()
-                new_container_j = container_j.copy()
-                new_container_i.remove_element(element)
+                move = (element, i, j)
+                fitness = current_fitness + self.move_delta(container_i, container_j, element)
+                neighbors.append((move, fitness))
 
-                try:
-                    new_container_j.add_element(element)
-                except Exception:
-                    continue
+        return neighbors
 
-                nova_solution = solution.copy()
-                nova_solution[i] = new_container_i
-                nova_solution[j] = new_container_j
-                nova_solution = self.gga._remove_empty_containers(nova_solution)
+    def move_delta(self, container_i, container_j, element):
+        """
+        Calcula a variação de aptidão ao mover `element` do contêiner i para o contêiner j.
 
-                move = (element, i, j)
+        Apenas os dois contêineres afetados entram no cálculo: cada contêiner não vazio contribui
+        com 1 + espaço restante / capacidade, e o contêiner de origem deixa de contar se ficar vazio.
 
-                fitness = self.gga.fitness(nova_solution)
+        Returns:
+            float: A aptidão do vizinho menos a aptidão da solução atual.
+        """
+        capacity = self.gga.container_capacity
+        before = 2 + (container_i.remaining_space() + container_j.remaining_space()) / capacity
 
-                neighbors.append((nova_solution, move, fitness))
+        after = 1 + (container_j.remaining_space() - element) / capacity
+        if container_i.used != element:
+            after += 1 + (container_i.remaining_space() + element) / capacity
+        return after - before
 
-        return neighbors
+    def apply_move(self, solution, move):
+        """
+        Materializa a solução vizinha resultante de um movimento.
+
+        Args:
+            solution (list): A solução atual.
+            move (tuple): O movimento `(elemento, i, j)`.
+
+        Returns:
+            Solution: A nova solução persistente, sem contêineres vazios. Ela compartilha com a
+            solução original todos os contêineres exceto os dois afetados, que são copiados.
+        """
+        element, i, j = move
+        solution = Solution.wrap(solution)
+        new_container_i = solution[i].copy()
+        new_container_j = solution[j].copy()
+        new_container_i.remove_element(element)
+        new_container_j.add_element(element)
+
+        nova_solution = solution.replace(j, new_container_j)
+        if len(new_container_i):
+            return nova_solution.replace(i, new_container_i)
+        return nova_solution.remove(i)
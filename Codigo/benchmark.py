@@ -0,0 +1,375 @@
+"""
+Benchmark dos algoritmos de Bin Packing com acompanhamento de regressões.
+
+Executa cada configuração de BENCHMARK_CONFIG (GGA, Busca Tabu e busca por dominância) sobre um
+conjunto de instâncias e registra, para cada par instância/configuração:
+
+- tempo de parede, gerações por segundo e vizinhos da Busca Tabu avaliados por segundo;
+- pico de memória (tracemalloc), medido em uma segunda execução com a mesma semente
+  para não distorcer o tempo;
+- bins usados e distância (gap) para o limitante inferior L2.
+
+O pico de memória é o do tracemalloc (alocações do Python e do NumPy), não o RSS do processo.
+Os resultados registram a máquina (`machine_info`): tempos e memória só são comparáveis entre
+execuções na mesma máquina.
+
+Com `--startup`, mede também o tempo de inicialização de `main.py --list` e de
+`import main` (custo de criação de cada processo de trabalho).
+
+As instâncias podem ser arquivos de INSTANCES_DIR ou instâncias sintéticas
+('synthetic/<nome>', ver SYNTHETIC_INSTANCES), o que permite rodar o benchmark
+sem o diretório externo de instâncias. Os resultados são gravados em JSON e podem
+ser comparados com uma linha de base (outro arquivo de resultados): o programa
+termina com código 1 se alguma métrica piorar além do limiar configurado.
+
+Exemplo:
+    python Codigo/benchmark.py --output atual.json --baseline base.json --threshold 0.1
+"""
+
+import sys
+import os
+
+# Adicionar o diretório atual ao sys.path para que o Python encontre os módulos
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import numpy as np
+from algorithms.gga import GGA
+from algorithms.tabu_search import Tabu_Search
+from algorithms.dominance_search import DominanceLocalSearch
+from algorithms.lower_bounds import l2_bound
+from utils.data_processor import create_data
+from utils.instance_generator import uniform_instance, triplet_instance
+from utils.rng import derive_seed, instance_key
+from config import BENCHMARK_CONFIG
+
+RESULTS_VERSION = 1
+
+# Instâncias sintéticas no estilo das famílias clássicas (Falkenauer U/T, Scholl N)
+SYNTHETIC_INSTANCES = {
+    'u120': (uniform_instance, {'num_items': 120, 'capacity': 150, 'min_size': 20, 'max_size': 100}),
+    'u250': (uniform_instance, {'num_items': 250, 'capacity': 150, 'min_size': 20, 'max_size': 100}),
+    't60': (triplet_instance, {'num_triplets': 20, 'capacity': 1000}),
+    'n100': (uniform_instance, {'num_items': 100, 'capacity': 100, 'min_size': 20, 'max_size': 100}),
+    # Modo de instâncias grandes (fora das instâncias padrão do benchmark)
+    'u100k': (uniform_instance, {'num_items': 100000, 'capacity': 150, 'min_size': 20, 'max_size': 100}),
+    'u1m': (uniform_instance, {'num_items': 1000000, 'capacity': 150, 'min_size': 20, 'max_size': 100}),
+}
+
+
+def load_instance(name, seed, instances_dir=None, cache_dir=None):
+    """
+    Carrega uma instância pelo nome.
+
+    Args:
+        name (str): 'synthetic/<nome>' ou o caminho de um arquivo relativo a INSTANCES_DIR.
+        seed (int): Semente usada na geração das instâncias sintéticas.
+        instances_dir (str, opcional): Diretório das instâncias. Se None, usa INSTANCES_DIR.
+        cache_dir (str, opcional): Diretório do cache `.npy`. Se None, usa INSTANCE_CACHE_DIR.
+
+    Returns:
+        dict: Dados da instância no formato de `create_data`.
+    """
+    if name.startswith('synthetic/'):
+        key = name.split('/', 1)[1]
+        if key not in SYNTHETIC_INSTANCES:
+            raise ValueError(f"Instância sintética desconhecida: {key}")
+        generator, params = SYNTHETIC_INSTANCES[key]
+        return generator(seed=derive_seed(seed, instance_key(name)), **params)
+    return create_data(name, instances_dir, as_array=True, cache_dir=cache_dir)
+
+
+def _run_gga(data, params, seed):
+    gga = GGA(dict(data, seed=seed, **params))
+    # A saída do GGA (melhor fitness, estagnação) não interessa ao benchmark
+    with contextlib.redirect_stdout(io.StringIO()):
+        solution = gga.run()
+    return solution, len(gga.history['generation']), gga.tabu_neighbors_evaluated
+
+
+def _random_first_fit(data, seed):
+    gga = GGA(dict(data, seed=seed))
+    # As buscas locais partem de um empacotamento first-fit de uma permutação aleatória dos
+    # itens, que (ao contrário da solução BFD) deixa espaço para melhorias
+    elements = [data['weights'][i] for i in gga.rng.permutation(len(data['weights']))]
+    return gga, gga.generate_initial_solution(elements, presorted=True)
+
+
+def _run_tabu(data, params, seed):
+    gga, initial = _random_first_fit(data, seed)
+    TS = Tabu_Search(gga, max_iterations=params.get('max_iterations', 1000),
+                     tabu_tenure=params.get('tabu_tenure', 10),
+                     max_neighbors=params.get('max_neighbors', 20),
+                     seed=derive_seed(seed, 0))
+    solution = TS.search(initial)
+    return solution, None, TS.neighbors_evaluated
+
+
+def _run_dominance(data, params, seed):
+    gga, initial = _random_first_fit(data, seed)
+    search = DominanceLocalSearch(gga, removed_bins=params.get('removed_bins', 3),
+                                  max_rounds=params.get('max_rounds', 10))
+    return search.search(initial), None, None
+
+
+def run_case(data, params, seed, measure_memory=True):
+    """
+    Executa uma configuração sobre uma instância e coleta as métricas.
+
+    Args:
+        data (dict): Dados da instância.
+        params (dict): Configuração ('algorithm': 'gga', 'tabu' ou 'dominance' e os parâmetros
+            do algoritmo).
+        seed (int): Semente da execução.
+        measure_memory (bool, opcional): Se True, repete a execução com tracemalloc para medir
+            o pico de memória.
+
+    Returns:
+        dict: As métricas da execução.
+    """
+    params = dict(params)
+    algorithm = params.pop('algorithm', 'gga')
+    if algorithm == 'gga':
+        task = _run_gga
+    elif algorithm == 'tabu':
+        task = _run_tabu
+    elif algorithm == 'dominance':
+        task = _run_dominance
+    else:
+        raise ValueError(f"Algoritmo desconhecido: {algorithm}")
+
+    start = time.perf_counter()
+    solution, generations, neighbors = task(data, params, seed)
+    wall_time = time.perf_counter() - start
+
+    peak_memory_mb = None
+    if measure_memory:
+        # Com a mesma semente a segunda execução faz exatamente o mesmo trabalho
+        tracemalloc.start()
+        try:
+            task(data, params, seed)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_memory_mb = peak / 2 ** 20
+
+    lower_bound = l2_bound(data['weights'], data['bin_capacity'])
+    bins = len(solution)
+    return {
+        'algorithm': algorithm,
+        'num_items': len(data['weights']),
+        'wall_time': wall_time,
+        'generations': generations,
+        'generations_per_second': generations / wall_time if generations else None,
+        'neighbors_evaluated': neighbors,
+        'neighbors_per_second': neighbors / wall_time if neighbors is not None and wall_time > 0 else None,
+        'peak_memory_mb': peak_memory_mb,
+        'bins': bins,
+        'lower_bound': lower_bound,
+        'gap': (bins - lower_bound) / lower_bound if lower_bound else 0.0,
+    }
+
+
+def machine_info():
+    """
+    Descreve a máquina em que o benchmark foi executado.
+
+    Os tempos e a memória dependem do processador, do número de CPUs e das versões do Python e
+    do NumPy: resultados de máquinas diferentes não devem ser comparados diretamente.
+
+    Returns:
+        dict: Plataforma, modelo do processador (quando disponível) e número de CPUs.
+    """
+    processor = platform.processor() or platform.machine()
+    with contextlib.suppress(OSError):
+        with open('/proc/cpuinfo') as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith('model name'):
+                    processor = line.split(':', 1)[1].strip()
+                    break
+    return {'platform': platform.platform(), 'processor': processor, 'cpus': os.cpu_count()}
+
+
+def run_benchmark(instances, configs, seed=0, measure_memory=True, instances_dir=None, cache_dir=None):
+    """
+    Executa todas as configurações sobre todas as instâncias.
+
+    Args:
+        instances (list): Nomes das instâncias (ver `load_instance`).
+        configs (dict): Configurações indexadas pelo nome.
+        seed (int, opcional): Semente principal; cada instância recebe uma semente derivada.
+        measure_memory (bool, opcional): Se True, mede o pico de memória.
+        instances_dir (str, opcional): Diretório das instâncias (ver `load_instance`).
+        cache_dir (str, opcional): Diretório do cache `.npy` (ver `load_instance`).
+
+    Returns:
+        dict: Os resultados, no formato gravado em JSON.
+    """
+    results = []
+    for name in instances:
+        data = load_instance(name, seed, instances_dir, cache_dir)
+        instance_seed = derive_seed(seed, instance_key(name))
+        for config_name, params in configs.items():
+            record = {'instance': name, 'config': config_name}
+            record.update(run_case(data, params, instance_seed, measure_memory))
+            results.append(record)
+            print(f"{name:<28} {config_name:<12} {record['wall_time']:8.3f}s "
+                  f"bins={record['bins']:<5} L2={record['lower_bound']:<5} gap={record['gap']:.2%}")
+    return {
+        'version': RESULTS_VERSION,
+        'seed': seed,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': machine_info(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def measure_startup(repeats=5):
+    """
+    Mede o custo de inicialização do programa principal em processos novos.
+
+    São medidos `python main.py --list` (inicialização completa, sem resolver instâncias) e
+    `import main` (o que cada processo de trabalho faz ao ser criado com o método 'spawn'),
+    além de verificar se matplotlib é carregado ao importar `main`.
+
+    Args:
+        repeats (int, opcional): Repetições de cada medição; vale o menor tempo. Padrão é 5.
+
+    Returns:
+        dict: Tempos em segundos ('main_list', 'import_main') e 'plotting_imported'.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    commands = {
+        'main_list': [sys.executable, os.path.join(directory, 'main.py'), '--list'],
+        'import_main': [sys.executable, '-c', 'import main'],
+    }
+    startup = {}
+    for name, command in commands.items():
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run(command, cwd=directory, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=True)
+            times.append(time.perf_counter() - start)
+        startup[name] = min(times)
+    probe = subprocess.run([sys.executable, '-c', "import sys, main; print('matplotlib' in sys.modules)"],
+                           cwd=directory, capture_output=True, text=True, check=True)
+    startup['plotting_imported'] = probe.stdout.strip() == 'True'
+    return startup
+
+
+def compare_results(current, baseline, threshold, min_wall_time=0.0):
+    """
+    Compara resultados com uma linha de base.
+
+    Há regressão quando, para o mesmo par instância/configuração, o tempo de parede ou o
+    pico de memória aumentam mais que `threshold` (fração relativa) ou o número de bins aumenta.
+    Tempos de parede menores que `min_wall_time` nas duas execuções são ignorados, pois são
+    dominados por ruído.
+
+    Args:
+        current (dict): Resultados atuais (ver `run_benchmark`).
+        baseline (dict): Resultados da linha de base.
+        threshold (float): Piora relativa tolerada (ex.: 0.10 = 10%).
+        min_wall_time (float, opcional): Tempo mínimo (s) para comparar tempos de parede.
+
+    Returns:
+        list: Mensagens descrevendo cada regressão encontrada (vazia se não houver).
+    """
+    base = {(r['instance'], r['config']): r for r in baseline.get('results', [])}
+    regressions = []
+    for record in current['results']:
+        reference = base.get((record['instance'], record['config']))
+        if reference is None:
+            continue
+        label = f"{record['instance']} [{record['config']}]"
+        for metric in ('wall_time', 'peak_memory_mb'):
+            old, new = reference.get(metric), record.get(metric)
+            if metric == 'wall_time' and max(old or 0, new or 0) < min_wall_time:
+                continue
+            if old and new is not None and new > old * (1 + threshold):
+                regressions.append(f"{label}: {metric} {old:.3f} -> {new:.3f} "
+                                   f"(+{new / old - 1:.1%})")
+        if record['bins'] > reference['bins']:
+            regressions.append(f"{label}: bins {reference['bins']} -> {record['bins']}")
+
+    # Tempo de inicialização, quando medido nas duas execuções (--startup)
+    startup, reference = current.get('startup'), baseline.get('startup')
+    if startup and reference:
+        for metric in ('main_list', 'import_main'):
+            old, new = reference[metric], startup[metric]
+            if new > old * (1 + threshold) and max(old, new) >= min_wall_time:
+                regressions.append(f"inicialização: {metric} {old:.3f} -> {new:.3f} (+{new / old - 1:.1%})")
+    return regressions
+
+
+def main():
+    """
+    Executa o benchmark pela linha de comando.
+
+    Returns:
+        int: 0 se não houver regressões, 1 caso contrário.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark dos algoritmos de bin packing')
+    parser.add_argument('--instances', nargs='+', default=BENCHMARK_CONFIG['instances'],
+                        help="Instâncias ('synthetic/<nome>' ou arquivos de INSTANCES_DIR)")
+    parser.add_argument('--configs', nargs='+', choices=sorted(BENCHMARK_CONFIG['configs']),
+                        help='Configurações a executar (default: todas)')
+    parser.add_argument('--seed', type=int, default=BENCHMARK_CONFIG['seed'],
+                        help='Semente das execuções (default: %(default)s)')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help='Arquivo JSON de saída (default: %(default)s)')
+    parser.add_argument('--baseline', help='Arquivo JSON de resultados usado como linha de base')
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_CONFIG['regression_threshold'],
+                        help='Piora relativa tolerada em relação à linha de base (default: %(default)s)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Não medir o pico de memória (evita a segunda execução)')
+    parser.add_argument('--startup', action='store_true',
+                        help='Medir também o tempo de inicialização de main.py e dos processos de trabalho')
+    parser.add_argument('--instances-dir', default=None,
+                        help='Diretório das instâncias (default: INSTANCES_DIR; variável BPP_INSTANCES_DIR)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Diretório do cache .npy das instâncias (default: INSTANCE_CACHE_DIR; '
+                             'variável BPP_CACHE_DIR)')
+    args = parser.parse_args()
+
+    configs = BENCHMARK_CONFIG['configs']
+    if args.configs:
+        configs = {name: configs[name] for name in args.configs}
+
+    results = run_benchmark(args.instances, configs, args.seed, not args.no_memory,
+                            args.instances_dir, args.cache_dir)
+    if args.startup:
+        results['startup'] = measure_startup()
+        print(f"Inicialização: main.py --list {results['startup']['main_list']:.3f}s | "
+              f"import main {results['startup']['import_main']:.3f}s | "
+              f"matplotlib carregado: {results['startup']['plotting_imported']}")
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResultados gravados em {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare_results(results, baseline, args.threshold,
+                                      BENCHMARK_CONFIG['min_wall_time'])
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) em relação a {args.baseline}:")
+            for message in regressions:
+                print(f"  - {message}")
+            return 1
+        print(f"\nNenhuma regressão em relação a {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
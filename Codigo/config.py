@@ -7,6 +7,8 @@ de resolução do problema de Bin Packing, permitindo ajustes fáceis
 sem necessidade de modificar o código-fonte.
 """
 
+import os
+
 # Configurações gerais
 DEFAULT_INSTANCES = [
     "Scholl/Scholl_3/HARD0.txt",
@@ -17,7 +19,13 @@ DEFAULT_INSTANCES = [
     "Scholl/Scholl_3/HARD5.txt",
 ]
 
-INSTANCES_DIR = "/workspaces/Bin-Paking-Problem/Instances"
+# Diretório das instâncias; pode ser trocado pela variável de ambiente BPP_INSTANCES_DIR
+# ou pela opção --instances-dir de main.py e benchmark.py
+INSTANCES_DIR = os.environ.get('BPP_INSTANCES_DIR', "/workspaces/Bin-Paking-Problem/Instances")
+
+# Diretório do cache binário (.npy) das instâncias lidas. None grava o cache ao lado de cada
+# instância; pode ser trocado pela variável de ambiente BPP_CACHE_DIR ou pela opção --cache-dir
+INSTANCE_CACHE_DIR = os.environ.get('BPP_CACHE_DIR') or None
 
 # Configurações para o algoritmo GGA (Grouping Genetic Algorithm)
 GGA_CONFIG = {
@@ -27,6 +35,27 @@ GGA_CONFIG = {
     'num_generations': 100,      # Número de gerações
     'elite_size': 5,             # Número de indivíduos elite mantidos entre gerações
     'selection_tournament_size': 3,  # Tamanho do torneio para seleção
+    'population_engine': 'object',   # Representação da população: 'object' (listas de Container) ou 'array' (NumPy)
+    'packing_heuristic': 'bfd',      # Heurística construtiva: 'ffd', 'bfd', 'wfd' ou 'nfd'
+    'decoder': 'sorted',             # Decodificação dos filhos: 'sorted', 'order' ou 'partial'
+    'decoder_size_classes': 4,       # Número de classes de tamanho do decodificador 'partial'
+    'cache_size': 1024,              # Entradas do cache LRU de fitness/Busca Tabu (0 desabilita)
+    'seed': None,                    # Semente dos geradores aleatórios (None = não reprodutível)
+    'stop_at_lower_bound': True,     # Parar quando a melhor solução atingir o limitante inferior L2
+    'time_limit': None,              # Tempo máximo (s, relógio) de execução por instância (None = sem limite)
+    'instrumentation': False,        # Registrar tempo e contadores por fase em cada geração (history)
+    'large_instance_threshold': 100000,   # Itens a partir dos quais o modo de instâncias grandes é usado
+    'large_instance_population_size': 20, # Tamanho máximo da população no modo de instâncias grandes
+    'large_instance_tabu': False,         # Busca Tabu da elite no modo de instâncias grandes
+    'elite_search': 'tabu',          # Melhoria da elite: 'tabu', 'dominance' ou 'dominance_tabu'
+    'dominance_removed_bins': 3,     # Contêineres esvaziados por rodada da busca por dominância
+    'dominance_max_rounds': 10,      # Rodadas máximas da busca por dominância
+    'adaptive_operators': True,      # Escolher cruzamento/mutação por seleção adaptativa (False = multi-pontos + bit-flip)
+    'crossover_operators': ['bpcx', 'multi_point', 'single_point', 'pmx'],  # Cruzamentos disponíveis
+    'mutation_operators': ['bitflip', 'swap', 'gaussian'],  # Mutações disponíveis
+    'operator_window': 50,           # Aplicações recentes consideradas no crédito de cada operador
+    'operator_exploration': 0.5,     # Peso base da exploração (UCB1), ampliado com a estagnação
+    'operator_credit': None,         # 'cpu_time' ou 'applications' (None = cpu_time, ou applications com semente)
 }
 
 # Configurações para o algoritmo Tabu Search
@@ -35,6 +64,36 @@ TABU_CONFIG = {
     'max_iterations': 1000,     # Número máximo de iterações
     'max_iterations_no_improve': 100,  # Número máximo de iterações sem melhoria
     'neighborhood_size': 20,    # Tamanho da vizinhança a explorar em cada iteração
+    'workers': 0,               # Processos para a Busca Tabu da elite (0 ou 1 = sequencial)
+    'time_limit': None,         # Tempo máximo (s, relógio) de cada Busca Tabu (None = sem limite)
+}
+
+# Configurações do modelo de ilhas (uma instância resolvida por várias subpopulações do GGA)
+ISLAND_CONFIG = {
+    'num_islands': 1,           # Número de ilhas/processos (1 = GGA único, sem ilhas)
+    'migration_interval': 10,   # Gerações entre migrações
+    'topology': 'ring',         # Topologia de migração: 'ring' ou 'full'
+    'migrants': 2,              # Indivíduos enviados por ilha em cada migração
+}
+
+# Configurações do benchmark (benchmark.py)
+BENCHMARK_CONFIG = {
+    'instances': ['synthetic/u120', 'synthetic/u250', 'synthetic/t60', 'synthetic/n100'],
+    'seed': 0,                      # Semente de todas as execuções do benchmark
+    'regression_threshold': 0.10,   # Piora relativa tolerada em relação à linha de base
+    'min_wall_time': 0.05,          # Tempos (s) abaixo deste valor não são comparados (ruído)
+    'configs': {                    # Configurações executadas em cada instância
+        'gga': {'algorithm': 'gga', 'num_generations': 30, 'population_size': 30,
+                'tabu_max_iterations': 50},
+        'gga_array': {'algorithm': 'gga', 'population_engine': 'array', 'num_generations': 30,
+                      'population_size': 30, 'tabu_max_iterations': 50},
+        'tabu': {'algorithm': 'tabu', 'max_iterations': 1000, 'tabu_tenure': 10,
+                 'max_neighbors': 20},
+        # Busca local por dominância a partir da mesma solução inicial da 'tabu'
+        'dominance': {'algorithm': 'dominance', 'removed_bins': 3, 'max_rounds': 50},
+        # Poucas gerações, pensada para as instâncias grandes (synthetic/u100k, synthetic/u1m)
+        'gga_large': {'algorithm': 'gga', 'num_generations': 5, 'population_size': 20},
+    },
 }
 
 # Configurações de visualização
@@ -43,4 +102,16 @@ VISUALIZATION_CONFIG = {
     'save_plots': True,          # Salvar gráficos em arquivos
     'plots_directory': '/workspaces/Bin-Paking-Problem/resultados',  # Diretório para salvar gráficos
     'plot_format': 'png',        # Formato dos gráficos (png, pdf, svg, etc.)
+    'max_listed_containers': 100,  # Acima deste número de contêineres, a saída mostra apenas um resumo
+    'max_plotted_bins': 200,     # Acima deste número de bins, o gráfico de ocupação desenha uma amostra
+    'max_labeled_bins': 40,      # Máximo de bins com rótulo no eixo x
+    'max_drawn_items': 20000,    # Acima deste número de itens, itens iguais em um bin formam um só bloco
+    'bin_plot_dpi': 150,         # Resolução dos gráficos de ocupação
+    'background_plots': True,    # Gravar os gráficos em um processo separado (apenas sem show_plots)
+}
+
+# Configurações do perfilamento (`main.py --profile`)
+PROFILE_CONFIG = {
+    'output_dir': 'perfis',      # Diretório padrão dos arquivos .pstats e .collapsed
+    'top': 20,                   # Funções exibidas no resumo ao final do lote
 }
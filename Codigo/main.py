@@ -9,8 +9,10 @@ exibir os resultados obtidos.
 O módulo oferece as seguintes funcionalidades:
 - Processamento de instâncias específicas ou instâncias padrão
 - Execução paralela para melhor performance
+- Modelo de ilhas para resolver uma única instância em vários processos
 - Listagem de instâncias disponíveis
 - Exibição formatada de resultados
+- Perfilamento de cada instância com cProfile (`--profile`)
 """
 
 import sys
@@ -21,44 +23,84 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from models.container import Container
+from models.result import RunResult
 from algorithms.gga import GGA
+from algorithms.island import IslandModel, TOPOLOGIES
 from algorithms.tabu_search import Tabu_Search
 from utils.data_processor import create_data
 from utils.file_utils import list_directory_files, get_valid_files
 import argparse
-from result_display import display_solution
-from config import DEFAULT_INSTANCES, INSTANCES_DIR
-
-def process_instance(arquivo):
+from result_display import display_solution, wait_for_plots
+from utils.rng import derive_seed, instance_key
+from utils.profiling import profile_call, profile_name, print_hot_functions
+from config import (DEFAULT_INSTANCES, INSTANCES_DIR, INSTANCE_CACHE_DIR, ISLAND_CONFIG, GGA_CONFIG,
+                    PROFILE_CONFIG, VISUALIZATION_CONFIG)
+
+def process_instance(arquivo, island_options=None, seed=None, time_limit=None, profile_dir=None,
+                     instances_dir=None, cache_dir=None):
     """
     Processa uma instância do problema do bin packing usando o algoritmo GGA.
 
     Esta função carrega os dados do arquivo de instância, cria um objeto GGA
     e executa o algoritmo para encontrar a melhor solução. O tempo de execução
-    é medido para avaliação de performance.
+    é medido para avaliação de performance. O resultado é um registro compacto
+    (`RunResult`), barato de transferir entre processos: o objeto do algoritmo,
+    com sua população, não sai do processo que o executou. Com mais de uma ilha em
+    `island_options`, a instância é resolvida pelo modelo de ilhas (`IslandModel`).
 
     Args:
         arquivo (str): O caminho do arquivo de instância a ser processado.
+        island_options (dict, opcional): Parâmetros do modelo de ilhas ('num_islands',
+            'migration_interval', 'topology', 'migrants'). Se None, usa ISLAND_CONFIG.
+        seed (int, opcional): Semente principal da execução. A semente da instância é derivada
+            dela e do nome do arquivo, de modo que o resultado não depende da ordem de
+            processamento nem da execução em paralelo. Se None, a execução não é reprodutível.
+        time_limit (float, opcional): Tempo máximo (s) de execução do GGA nesta instância; ao
+            esgotá-lo, é retornada a melhor solução encontrada. Se None, usa GGA_CONFIG.
+        profile_dir (str, opcional): Se informado, a chamada inteira (leitura e resolução) roda
+            sob o cProfile, no próprio processo (inclusive nos workers do pool), e os arquivos
+            `<instância>.pstats` e `<instância>.collapsed` são gravados neste diretório. As ilhas
+            do modelo de ilhas rodam em processos próprios e não entram no perfil.
+        instances_dir (str, opcional): Diretório das instâncias. Se None, usa INSTANCES_DIR.
+        cache_dir (str, opcional): Diretório do cache `.npy` das instâncias. Se None, usa
+            INSTANCE_CACHE_DIR.
 
     Returns:
-        tuple: Uma tupla contendo (nome do arquivo, melhor solução encontrada, tempo de execução, objeto do algoritmo).
-            - nome do arquivo (str): Nome da instância processada
-            - melhor solução (list): Lista de containers com a melhor solução encontrada
-            - tempo de execução (float): Tempo em segundos gasto para encontrar a solução
-            - objeto do algoritmo (GGA): A instância do algoritmo usado para resolver o problema
+        RunResult: A solução codificada, seu fitness, os tempos ('load', 'run' e 'total', em
+            segundos) e o histórico do algoritmo.
 
     Raises:
         Exception: Se ocorrer erro durante o processamento da instância
     """
+    if profile_dir is not None:
+        return profile_call(profile_dir, profile_name(arquivo), process_instance,
+                            arquivo, island_options, seed, time_limit,
+                            instances_dir=instances_dir, cache_dir=cache_dir)
+
     import time
     start_time = time.time()
 
-    data = create_data(arquivo)
-    gga = GGA(data)
+    if island_options is None:
+        island_options = ISLAND_CONFIG
+
+    data = create_data(arquivo, instances_dir, as_array=True, cache_dir=cache_dir)
+    load_time = time.time()
+    if seed is not None:
+        data['seed'] = derive_seed(seed, instance_key(arquivo))
+    if time_limit is not None:
+        data['time_limit'] = time_limit
+    if island_options['num_islands'] > 1:
+        gga = IslandModel(data, island_options['num_islands'],
+                          migration_interval=island_options['migration_interval'],
+                          topology=island_options['topology'],
+                          migrants=island_options['migrants'])
+    else:
+        gga = GGA(data)
     best_solution = gga.run()
 
-    execute_time = time.time() - start_time
-    return arquivo, best_solution, execute_time, gga
+    end_time = time.time()
+    timings = {'load': load_time - start_time, 'run': end_time - load_time, 'total': end_time - start_time}
+    return RunResult.from_solution(arquivo, best_solution, data['bin_capacity'], timings, gga.history)
 
 def main():
     """
@@ -77,24 +119,62 @@ def main():
     parser.add_argument('--files', nargs='+', help='Lista de arquivos de instância para processar')
     parser.add_argument('--list', action='store_true', help='Listar arquivos disponíveis')
     parser.add_argument('--parallel', action='store_true', help='Executar em paralelo (default: False)')
+    parser.add_argument('--islands', type=int, default=ISLAND_CONFIG['num_islands'],
+                        help='Número de ilhas (processos) por instância (default: %(default)s)')
+    parser.add_argument('--migration-interval', type=int, default=ISLAND_CONFIG['migration_interval'],
+                        help='Gerações entre migrações no modelo de ilhas (default: %(default)s)')
+    parser.add_argument('--topology', choices=TOPOLOGIES, default=ISLAND_CONFIG['topology'],
+                        help='Topologia de migração do modelo de ilhas (default: %(default)s)')
+    parser.add_argument('--migrants', type=int, default=ISLAND_CONFIG['migrants'],
+                        help='Indivíduos enviados por ilha em cada migração (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=GGA_CONFIG['seed'],
+                        help='Semente para execuções reprodutíveis (default: %(default)s)')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_CONFIG['output_dir'], default=None,
+                        metavar='DIR',
+                        help='Perfilar cada instância com cProfile e gravar .pstats e pilhas colapsadas '
+                             '(flame graph) em DIR (default: %(const)s)')
+    parser.add_argument('--profile-top', type=int, default=PROFILE_CONFIG['top'],
+                        help='Funções exibidas no resumo do perfil ao final (default: %(default)s)')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='Não gerar gráficos (nem carregar matplotlib): apenas a saída em texto')
+    parser.add_argument('--time-limit', type=float, default=GGA_CONFIG['time_limit'],
+                        help='Tempo máximo (s) por instância; retorna a melhor solução encontrada até lá '
+                             '(default: %(default)s)')
+    parser.add_argument('--instances-dir', default=INSTANCES_DIR,
+                        help='Diretório das instâncias (default: %(default)s; variável BPP_INSTANCES_DIR)')
+    parser.add_argument('--cache-dir', default=INSTANCE_CACHE_DIR,
+                        help='Diretório do cache .npy das instâncias (default: ao lado de cada '
+                             'instância; variável BPP_CACHE_DIR)')
     args = parser.parse_args()
 
+    if args.no_plots:
+        # Os gráficos são gerados no processo principal por `display_solution`
+        VISUALIZATION_CONFIG['show_plots'] = False
+        VISUALIZATION_CONFIG['save_plots'] = False
+
+    island_options = {
+        'num_islands': args.islands,
+        'migration_interval': args.migration_interval,
+        'topology': args.topology,
+        'migrants': args.migrants,
+    }
+
     # Listar apenas os arquivos disponíveis se solicitado
     if args.list:
         print("\nArquivos disponíveis na pasta de instâncias:")
-        list_directory_files(INSTANCES_DIR)
+        list_directory_files(args.instances_dir)
         return
 
     # Lista de instâncias para processar
     arquivos = args.files if args.files else DEFAULT_INSTANCES
 
     # Verificar se os arquivos existem
-    valid_files = get_valid_files(arquivos, INSTANCES_DIR)
+    valid_files = get_valid_files(arquivos, args.instances_dir)
 
     if not valid_files:
         print("Nenhum arquivo válido encontrado. Verifique o diretório de instâncias.")
         print("\nArquivos disponíveis na pasta de instâncias:")
-        list_directory_files(INSTANCES_DIR)
+        list_directory_files(args.instances_dir)
         return
 
     print(f"\nProcessando {len(valid_files)} arquivos válidos...\n")
@@ -103,13 +183,16 @@ def main():
     if args.parallel:
         # Execução paralela
         with ProcessPoolExecutor() as executor:
-            future_to_file = {executor.submit(process_instance, arquivo): arquivo for arquivo in valid_files}
+            future_to_file = {executor.submit(process_instance, arquivo, island_options, args.seed,
+                                              args.time_limit, args.profile, args.instances_dir,
+                                              args.cache_dir): arquivo
+                              for arquivo in valid_files}
 
             for future in as_completed(future_to_file):
                 arquivo = future_to_file[future]
                 try:
-                    arquivo, best_solution, execute_time, gga = future.result()
-                    display_solution(arquivo, best_solution, execute_time, gga)
+                    result = future.result()
+                    display_solution(arquivo, result.solution(), result.execution_time, result)
                 except ZeroDivisionError as zde:
                     print(f"{arquivo} gerou uma exceção de divisão por zero: {zde}")
                 except Exception as exc:
@@ -118,10 +201,18 @@ def main():
         # Execução sequencial
         for arquivo in valid_files:
             try:
-                arquivo, best_solution, execute_time, gga = process_instance(arquivo)
-                display_solution(arquivo, best_solution, execute_time, gga)
+                result = process_instance(arquivo, island_options, args.seed, args.time_limit,
+                                          args.profile, args.instances_dir, args.cache_dir)
+                display_solution(arquivo, result.solution(), result.execution_time, result)
             except Exception as exc:
                 print(f"{arquivo} gerou uma exceção: {exc}")
 
+    wait_for_plots()
+
+    if args.profile is not None:
+        print_hot_functions([os.path.join(args.profile, profile_name(arquivo) + '.pstats')
+                             for arquivo in valid_files], args.profile_top)
+        print(f"Perfis (.pstats e .collapsed) gravados em: {os.path.abspath(args.profile)}")
+
 if __name__ == "__main__":
     main()
@@ -1,29 +1,85 @@
-from copy import deepcopy
+# Pacote de modelos para o problema de Bin Packing.
+import random
 
 
 class Container:
+    # Sem __dict__: cada instância guarda apenas os atributos abaixo
+    __slots__ = ('counts', 'capacity', 'used', 'num_elements')
+
     def __init__(self, capacity):
-        self.elements = []  # Lista de elementos (tamanhos) dentro do container
+        self.counts = {}  # Multiconjunto de elementos: tamanho -> quantidade
         self.capacity = capacity
         self.used = 0  # Espaço já utilizado no container
+        self.num_elements = 0
 
     def __deepcopy__(self, memo):
-        new_container = Container(self.capacity)
-        new_container.elements = deepcopy(self.elements, memo)
-        # Copiar outros atributos, se houver
-        return new_container
+        # Os elementos são inteiros imutáveis, então uma cópia rasa do dicionário é suficiente
+        return self.copy()
+
+    @property
+    def elements(self):
+        """
+        Lista de elementos (tamanhos) dentro do container.
+
+        A lista é montada a partir de `counts` a cada acesso: alterá-la no lugar não altera o
+        container (use `add_element`/`remove_element` ou atribua uma nova sequência). Os
+        elementos iguais aparecem agrupados, então a ordem de inserção não é preservada
+        (após adicionar 30, 20 e 30 a lista é [30, 30, 20]).
+        """
+        return [size for size, count in self.counts.items() for _ in range(count)]
+
+    @elements.setter
+    def elements(self, elements):
+        elements = list(elements)
+        used = sum(elements)
+        if used > self.capacity:
+            raise Exception("Capacidade excedida no container!")
+        counts = {}
+        for element in elements:
+            counts[element] = counts.get(element, 0) + 1
+        self.counts = counts
+        self.used = used
+        self.num_elements = len(elements)
+
+    def __len__(self):
+        return self.num_elements
 
     def add_element(self, element):
         if self.used + element <= self.capacity:
-            self.elements.append(element)
+            counts = self.counts
+            counts[element] = counts.get(element, 0) + 1
             self.used += element
+            self.num_elements += 1
+        else:
+            raise Exception("Capacidade excedida no container!")
+
+    def add_elements(self, element, count):
+        """Adiciona `count` cópias de um elemento (um tipo de item) de uma só vez."""
+        if self.used + element * count <= self.capacity:
+            counts = self.counts
+            counts[element] = counts.get(element, 0) + count
+            self.used += element * count
+            self.num_elements += count
         else:
             raise Exception("Capacidade excedida no container!")
 
     def remove_element(self, element):
-        if element in self.elements:
-            self.elements.remove(element)
+        count = self.counts.get(element, 0)
+        if count:
+            if count == 1:
+                del self.counts[element]
+            else:
+                self.counts[element] = count - 1
             self.used -= element
+            self.num_elements -= 1
+
+    def random_element(self, rng=random):
+        """Sorteia um elemento com probabilidade uniforme entre os itens do container."""
+        position = rng.randrange(self.num_elements)
+        for size, count in self.counts.items():
+            if position < count:
+                return size
+            position -= count
 
     def is_full(self):
         return self.used >= self.capacity
@@ -35,7 +91,9 @@ class Container:
         return f"Container({self.elements}, usado: {self.used}/{self.capacity})"
 
     def copy(self):
-        new_container = Container(self.capacity)
-        new_container.elements = self.elements.copy()
+        new_container = Container.__new__(Container)
+        new_container.counts = self.counts.copy()
+        new_container.capacity = self.capacity
         new_container.used = self.used
+        new_container.num_elements = self.num_elements
         return new_container
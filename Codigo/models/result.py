@@ -0,0 +1,113 @@
+"""
+Registro compacto do resultado da resolução de uma instância.
+
+Os processos de `main.py` devolvem ao processo principal apenas este registro, em vez
+do objeto do algoritmo: a solução vai como arrays de inteiros (tipos de item e o bin
+de cada um) e o histórico como arrays NumPy, sem população, configuração ou objetos
+`Container`. O registro é versionado para que dados de uma versão incompatível sejam
+recusados em vez de interpretados de forma errada.
+"""
+
+import numpy as np
+from models.container import Container
+
+RESULT_VERSION = 1
+
+
+class RunResult:
+    """
+    Resultado de uma instância: solução codificada, métricas, tempos e histórico.
+
+    Attributes:
+        instance (str): Nome do arquivo da instância.
+        capacity (int): Capacidade dos contêineres.
+        sizes (np.ndarray): Tamanho de cada tipo de item da solução.
+        counts (np.ndarray): Quantidade de itens de cada tipo.
+        assignment (np.ndarray): Índice do contêiner de cada tipo de item.
+        num_bins (int): Número de contêineres usados.
+        fitness (float): Fitness da solução (contêineres + desperdício / capacidade).
+        timings (dict): Tempos em segundos ('load', 'run' e 'total').
+        history (dict): Histórico do algoritmo; as séries numéricas são arrays NumPy.
+    """
+    __slots__ = ('version', 'instance', 'capacity', 'sizes', 'counts', 'assignment',
+                 'num_bins', 'fitness', 'timings', 'history')
+
+    def __init__(self, instance, capacity, sizes, counts, assignment, timings, history):
+        self.version = RESULT_VERSION
+        self.instance = instance
+        self.capacity = capacity
+        self.sizes = sizes
+        self.counts = counts
+        self.assignment = assignment
+        self.num_bins = int(assignment.max()) + 1 if len(assignment) else 0
+        total = int(np.dot(sizes, counts))
+        self.fitness = 2 * self.num_bins - total / capacity if capacity else float(self.num_bins)
+        self.timings = timings
+        self.history = history
+
+    @classmethod
+    def from_solution(cls, instance, solution, capacity, timings, history=None):
+        """
+        Cria o registro a partir de uma solução (lista de contêineres).
+
+        Args:
+            instance (str): Nome do arquivo da instância.
+            solution (list): A solução.
+            capacity (int): Capacidade dos contêineres.
+            timings (dict): Tempos da execução, em segundos.
+            history (dict, opcional): Histórico do algoritmo (`GGA.history`).
+
+        Returns:
+            RunResult: O registro.
+        """
+        lengths = np.fromiter((len(container.counts) for container in solution),
+                              dtype=np.int64, count=len(solution))
+        sizes = np.fromiter((size for container in solution for size in container.counts),
+                            dtype=np.int64, count=int(lengths.sum()))
+        counts = np.fromiter((count for container in solution for count in container.counts.values()),
+                             dtype=np.int64, count=len(sizes))
+        assignment = np.repeat(np.arange(len(solution), dtype=np.int32), lengths)
+        return cls(instance, capacity, sizes, counts, assignment, dict(timings),
+                   compact_history(history or {}))
+
+    @property
+    def execution_time(self):
+        return self.timings.get('total', 0.0)
+
+    def solution(self):
+        """
+        Reconstrói a solução como lista de contêineres.
+
+        Returns:
+            list: Os contêineres, na ordem da solução original.
+        """
+        solution = [Container(self.capacity) for _ in range(self.num_bins)]
+        for size, count, index in zip(self.sizes.tolist(), self.counts.tolist(),
+                                      self.assignment.tolist()):
+            solution[index].add_elements(size, count)
+        return solution
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        if state.get('version') != RESULT_VERSION:
+            raise ValueError(f"Versão de resultado não suportada: {state.get('version')} "
+                             f"(esperada {RESULT_VERSION})")
+        for name in self.__slots__:
+            setattr(self, name, state[name])
+
+
+def compact_history(history):
+    """
+    Converte as séries numéricas do histórico (listas de números) em arrays NumPy.
+
+    Os demais valores (ex.: uso de operadores por geração, que são dicionários) são mantidos.
+    """
+    compact = {}
+    for key, value in history.items():
+        if isinstance(value, list) and value and all(isinstance(item, (int, float)) for item in value):
+            compact[key] = np.asarray(value)
+        else:
+            compact[key] = value
+    return compact
@@ -0,0 +1,112 @@
+# Pacote de modelos para o problema de Bin Packing.
+
+
+class Solution:
+    """
+    Solução persistente: uma sequência imutável de contêineres com compartilhamento estrutural.
+
+    Cada modificação (`replace`, `append`, `remove`) devolve uma nova solução que compartilha a
+    tupla base de contêineres da solução de origem e guarda apenas as posições alteradas em
+    relação a essa base. Os contêineres em si nunca devem ser modificados no lugar: quem altera
+    um contêiner faz uma cópia (`Container.copy`) e a registra com `replace` (copy-on-write).
+
+    As alterações de cada versão são acumuladas em um único dicionário (posição -> contêiner),
+    de modo que a leitura de uma posição é O(1) sem percorrer versões e a memória de cada
+    versão é O(contêineres alterados). Quando as alterações acumuladas passam de `MAX_CHANGES`,
+    a versão nova é materializada em uma tupla base própria.
+    """
+    __slots__ = ('_base', '_changes', '_length')
+
+    MAX_CHANGES = 32
+
+    def __init__(self, containers=()):
+        self._base = tuple(containers)
+        self._changes = None
+        self._length = len(self._base)
+
+    @classmethod
+    def wrap(cls, solution):
+        """Retorna `solution` se ela já for persistente, ou uma nova `Solution` com seus contêineres."""
+        return solution if isinstance(solution, cls) else cls(solution)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Índice de contêiner fora do intervalo")
+        if self._changes:
+            container = self._changes.get(index)
+            if container is not None:
+                return container
+        return self._base[index]
+
+    def __iter__(self):
+        if not self._changes and self._length == len(self._base):
+            return iter(self._base)
+        return iter(self.to_list())
+
+    def __repr__(self):
+        return f"Solution({self.to_list()})"
+
+    def copy(self):
+        # Soluções persistentes são imutáveis: a "cópia" é a própria solução
+        return self
+
+    def to_list(self):
+        """Materializa a solução como uma lista de contêineres."""
+        length = self._length
+        containers = list(self._base[:length])
+        if not self._changes:
+            return containers
+        # As posições além da base (contêineres adicionados) estão sempre nas alterações
+        containers.extend([None] * (length - len(containers)))
+        for index, container in self._changes.items():
+            containers[index] = container
+        return containers
+
+    def replace(self, index, container):
+        """Retorna uma nova solução com o contêiner da posição `index` substituído."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Índice de contêiner fora do intervalo")
+        return self._derive({index: container}, self._length)
+
+    def append(self, container):
+        """Retorna uma nova solução com `container` adicionado ao final."""
+        return self._derive({self._length: container}, self._length + 1)
+
+    def remove(self, index):
+        """
+        Retorna uma nova solução sem o contêiner da posição `index`.
+
+        O último contêiner ocupa a posição removida, de modo que apenas uma posição é alterada.
+        """
+        if index < 0:
+            index += self._length
+        last = self._length - 1
+        if not 0 <= index <= last:
+            raise IndexError("Índice de contêiner fora do intervalo")
+        if index == last:
+            return self._derive({}, last)
+        return self._derive({index: self[last]}, last)
+
+    def _derive(self, changes, length):
+        merged = dict(self._changes) if self._changes else {}
+        merged.update(changes)
+        # A posição que deixou de existir não é mais lida (as remoções encurtam uma de cada vez)
+        merged.pop(length, None)
+
+        solution = Solution.__new__(Solution)
+        solution._base = self._base
+        solution._changes = merged
+        solution._length = length
+        if len(merged) > self.MAX_CHANGES:
+            solution._base = tuple(solution.to_list())
+            solution._changes = None
+        return solution
@@ -2,13 +2,55 @@ from models.container import Container
 import os
 import sys
 import os.path
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Adicionar o diretório Codigo ao path para importação do config e utils
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from utils.visualization import (create_convergence_plot, visualize_bin_packing,
+from utils.visualization import (create_convergence_plot, render_bin_packing, bin_packing_arrays,
                               ensure_visualization_directory)
+from algorithms.lower_bounds import l2_bound
 from config import VISUALIZATION_CONFIG
 
+# Processo que desenha e grava os gráficos em segundo plano (criado no primeiro uso)
+_plot_executor = None
+_pending_plots = []
+
+
+def _submit_plot(function, *args):
+    """
+    Gera um gráfico em um processo separado, sem bloquear o processamento das instâncias.
+
+    Só é usado quando os gráficos são apenas gravados (`background_plots` e `show_plots`
+    desligado); exibir uma janela exige o processo principal. Caso contrário, o gráfico é
+    gerado imediatamente.
+    """
+    global _plot_executor
+    if not VISUALIZATION_CONFIG.get('background_plots', True) or VISUALIZATION_CONFIG.get('show_plots', True):
+        function(*args)
+        return
+    if _plot_executor is None:
+        _plot_executor = ProcessPoolExecutor(max_workers=1)
+    _pending_plots.append(_plot_executor.submit(function, *args))
+
+
+def wait_for_plots():
+    """
+    Espera os gráficos gerados em segundo plano e encerra o processo de desenho.
+
+    Erros de um gráfico são exibidos sem interromper os demais.
+    """
+    global _plot_executor
+    for future in _pending_plots:
+        try:
+            future.result()
+        except Exception as exc:
+            print(f"Erro ao gerar gráfico: {exc}")
+    _pending_plots.clear()
+    if _plot_executor is not None:
+        _plot_executor.shutdown()
+        _plot_executor = None
+
 def display_solution(arquivo, solution, execution_time, algorithm_obj=None):
     """
     Exibe os resultados da solução de uma instância do problema e gera visualizações.
@@ -17,18 +59,38 @@ def display_solution(arquivo, solution, execution_time, algorithm_obj=None):
         arquivo (str): Nome do arquivo da instância
         solution (list): Lista de contêineres na solução
         execution_time (float): Tempo de execução em segundos
-        algorithm_obj (object, optional): Objeto do algoritmo que contém histórico de execução
+        algorithm_obj (object, optional): Objeto com o histórico de execução (`history`), como
+            o próprio algoritmo ou o `RunResult` devolvido por `process_instance`
     """
     # Exibir informações textuais sobre a solução
+    max_listed = VISUALIZATION_CONFIG.get('max_listed_containers', 100)
     print(f"\nMelhor solução encontrada para {arquivo}:")
     print("=" * 100)
-    for i, container in enumerate(solution, 1):
-        print(f"Contêiner {i}: {container}")
+    if len(solution) <= max_listed:
+        for i, container in enumerate(solution, 1):
+            print(f"Contêiner {i}: {container}")
+    else:
+        # Instâncias grandes: apenas um resumo da ocupação dos contêineres
+        fill = np.fromiter((c.used / c.capacity for c in solution), dtype=np.float64, count=len(solution))
+        print(f"{len(solution)} contêineres (lista omitida, acima de {max_listed})")
+        print(f"Ocupação: mínima {fill.min():.1%} | média {fill.mean():.1%} | máxima {fill.max():.1%} | "
+              f"contêineres cheios: {np.count_nonzero(fill >= 1)}")
     print("=" * 100)
     print("Quantidade de contêineres usados: ", len(solution))
+    if solution:
+        # Limitante inferior L2 calculado a partir dos tipos de item da própria solução
+        sizes = np.fromiter((size for c in solution for size in c.counts), dtype=np.int64)
+        counts = np.fromiter((count for c in solution for count in c.counts.values()), dtype=np.int64)
+        lower_bound = l2_bound(np.repeat(sizes, counts), solution[0].capacity)
+        gap = (len(solution) - lower_bound) / lower_bound if lower_bound else 0.0
+        status = " (ótimo)" if len(solution) <= lower_bound else ""
+        print(f"Limitante inferior (L2): {lower_bound} | Gap: {gap:.2%}{status}")
     print("=" * 100)
     print("Tempo total de solução: {:.2f} segundos".format(execution_time))
     print("=" * 100)
+    if algorithm_obj is not None and getattr(algorithm_obj, 'history', {}).get('phase_times'):
+        display_phase_summary(algorithm_obj.history)
+        print("=" * 100)
 
     # Verificar se a visualização está habilitada
     if not VISUALIZATION_CONFIG.get('show_plots', True) and not VISUALIZATION_CONFIG.get('save_plots', True):
@@ -46,17 +108,45 @@ def display_solution(arquivo, solution, execution_time, algorithm_obj=None):
     else:
         bin_plot_path = None
 
-    visualize_bin_packing(solution,
-                        title=f"Solução Bin Packing - {instance_name}",
-                        save_path=bin_plot_path)
+    # Apenas arrays seguem para o desenho (com muitos bins, uma amostra é desenhada)
+    if solution:
+        bins, sizes, counts = bin_packing_arrays(solution)
+        _submit_plot(render_bin_packing, bins, sizes, counts, len(solution), solution[0].capacity,
+                     f"Solução Bin Packing - {instance_name}", bin_plot_path)
 
     # Se o objeto do algoritmo estiver disponível e tiver histórico, gerar gráfico de convergência
-    if algorithm_obj and hasattr(algorithm_obj, 'history') and algorithm_obj.history.get('generation'):
+    if algorithm_obj and hasattr(algorithm_obj, 'history') and len(algorithm_obj.history.get('generation', ())):
         if VISUALIZATION_CONFIG.get('save_plots', True):
             convergence_plot_path = os.path.join(plots_dir, f"{instance_name}_convergence.{VISUALIZATION_CONFIG.get('plot_format', 'png')}")
         else:
             convergence_plot_path = None
 
-        create_convergence_plot(algorithm_obj.history,
-                             instance_name,
-                             save_path=convergence_plot_path)
+        _submit_plot(create_convergence_plot, dict(algorithm_obj.history),
+                     instance_name, convergence_plot_path)
+
+
+def display_phase_summary(history):
+    """
+    Exibe o tempo total de cada fase e os contadores da instrumentação do GGA.
+
+    Args:
+        history (dict): Histórico com 'phase_times' e 'phase_counts' (uma entrada por geração).
+    """
+    totals = {}
+    for times in history['phase_times']:
+        for phase, seconds in times.items():
+            totals[phase] = totals.get(phase, 0.0) + seconds
+    counts = {}
+    for generation_counts in history.get('phase_counts', []):
+        for name, value in generation_counts.items():
+            counts[name] = counts.get(name, 0) + value
+
+    elapsed = sum(totals.values())
+    print("Tempo por fase (soma das gerações):")
+    for phase, seconds in sorted(totals.items(), key=lambda item: item[1], reverse=True):
+        share = seconds / elapsed if elapsed else 0.0
+        calls = f" | {counts[phase]} chamadas" if phase in counts else ""
+        print(f"  {phase:<10} {seconds:9.3f} s  {share:6.1%}{calls}")
+    others = {name: value for name, value in counts.items() if name not in totals}
+    if others:
+        print("Contadores: " + " | ".join(f"{name}: {value}" for name, value in others.items()))
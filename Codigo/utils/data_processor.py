@@ -1,33 +1,179 @@
-def create_data(arquivo):
+"""
+Leitura de instâncias do problema de Bin Packing.
+
+As instâncias são lidas em uma única passagem pelo arquivo, direto para um
+array NumPy de inteiros. Formatos suportados:
+
+- 'scholl': número de itens, capacidade e um tamanho por item (Scholl e as
+  cópias das instâncias de Falkenauer distribuídas no mesmo formato). O
+  cabeçalho pode estar em uma ou duas linhas.
+- 'falkenauer': sinônimo de 'scholl'.
+- 'orlib': arquivos da OR-Library (binpack1..8, as instâncias originais de
+  Falkenauer), com várias instâncias por arquivo: número de instâncias e, para
+  cada uma, o nome, a linha "capacidade número_de_itens melhor_conhecido" e os
+  tamanhos dos itens.
+
+Com o cache habilitado, a instância lida é gravada em um arquivo `.npy`
+(capacidade seguida dos tamanhos) e, nas leituras seguintes, esse arquivo é
+mapeado em memória em vez de o texto ser interpretado novamente. O cache fica ao
+lado do original ou em um diretório de cache (INSTANCE_CACHE_DIR), útil para
+conjuntos de instâncias somente leitura; se o diretório não puder ser escrito, a
+instância é lida normalmente, sem cache.
+"""
+
+import hashlib
+import os
+import sys
+from itertools import islice
+import numpy as np
+
+# Adicionar o diretório Codigo ao path para importação do config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import INSTANCES_DIR, INSTANCE_CACHE_DIR
+
+FORMATS = ('auto', 'scholl', 'falkenauer', 'orlib')
+
+
+def resolve_instance_path(arquivo, instances_dir=None):
     """
-    Processa um arquivo de instância e extrai os dados necessários.
+    Resolve o caminho de um arquivo de instância.
+
+    Caminhos absolutos ou existentes a partir do diretório atual são usados como estão;
+    os demais são relativos a `instances_dir` (por padrão, INSTANCES_DIR).
+    """
+    if os.path.isabs(arquivo) or os.path.exists(arquivo):
+        return arquivo
+    return os.path.join(instances_dir or INSTANCES_DIR, arquivo)
+
+
+def _numeric_tokens(file):
+    # Apenas as linhas que começam com dígitos ou sinal negativo contêm dados
+    for line in file:
+        line = line.strip()
+        if line and (line[0].isdigit() or line[0] == '-'):
+            yield from line.split()
+
+
+def _detect_format(file):
+    lines = []
+    for line in file:
+        if line.strip():
+            lines.append(line.split())
+            if len(lines) == 2:
+                break
+    file.seek(0)
+    # OR-Library: número de instâncias seguido do nome (não numérico) da primeira
+    if len(lines) == 2 and len(lines[0]) == 1 and not lines[1][0][0].isdigit():
+        return 'orlib'
+    return 'scholl'
+
+
+def _parse_scholl(file):
+    tokens = _numeric_tokens(file)
+    n = int(next(tokens))
+    capacity = int(next(tokens))
+    weights = np.fromiter(map(int, islice(tokens, n)), dtype=np.int64)
+    return capacity, weights
+
+
+def _parse_orlib(file, problem):
+    lines = (line for line in map(str.strip, file) if line)
+    num_problems = int(next(lines))
+    for index in range(num_problems):
+        name = next(lines)
+        capacity, n = (int(float(token)) for token in next(lines).split()[:2])
+        if problem in (index, name):
+            weights = np.fromiter(map(float, islice(lines, n)), dtype=np.float64, count=n)
+            if not np.array_equal(weights, np.floor(weights)):
+                raise ValueError(f"A instância {name} tem itens com tamanho não inteiro")
+            return capacity, weights.astype(np.int64)
+        for _ in islice(lines, n):
+            pass
+    raise ValueError(f"Instância {problem!r} não encontrada no arquivo")
+
+
+def _cache_path(path, fmt, problem, cache_dir=None):
+    base = f"{path}.{problem}" if fmt == 'orlib' else path
+    if cache_dir is None:
+        return f"{base}.npy"
+    # No diretório de cache, o caminho absoluto distingue instâncias de mesmo nome
+    digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{os.path.basename(base)}.{digest}.npy")
+
+
+def read_instance(path, fmt='auto', problem=0, use_cache=True, cache_dir=None):
+    """
+    Lê uma instância para um array NumPy.
 
     Args:
-        arquivo (str): Nome do arquivo de instância a ser processado
+        path (str): Caminho do arquivo de instância.
+        fmt (str, opcional): Formato do arquivo (ver FORMATS); 'auto' detecta pelo conteúdo.
+        problem (int ou str, opcional): Índice ou nome da instância nos arquivos 'orlib'.
+        use_cache (bool, opcional): Se True, usa (e cria) o cache binário `.npy` mapeado em memória.
+        cache_dir (str, opcional): Diretório do cache. Se None, usa INSTANCE_CACHE_DIR (e, se
+            este também for None, o diretório da instância).
 
     Returns:
-        dict: Dicionário contendo os dados processados
+        tuple: (capacidade, tamanhos dos itens como array de inteiros).
+
+    Raises:
+        ValueError: Se o formato for desconhecido ou a instância não existir no arquivo.
     """
-    caminho = f"/workspaces/Bin-Paking-Problem/Instances/{arquivo}"
-    with open(caminho, "r") as file:
-        # Filtrar apenas as linhas não vazias que iniciam com dígitos ou sinal negativo
-        linhas = [linha.strip() for linha in file.readlines() if linha.strip() and (linha.strip()[0].isdigit() or linha.strip()[0] == '-')]
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato de instância desconhecido: {fmt}")
+
+    with open(path, "r") as file:
+        if fmt == 'auto':
+            fmt = _detect_format(file)
+
+        cache = _cache_path(path, fmt, problem, cache_dir or INSTANCE_CACHE_DIR)
+        if use_cache and os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+            data = np.load(cache, mmap_mode='r')
+            return int(data[0]), data[1:]
 
-    # Primeira linha: número de itens (N)
-    n = int(linhas[0])
+        if fmt == 'orlib':
+            capacity, weights = _parse_orlib(file, problem)
+        else:
+            capacity, weights = _parse_scholl(file)
 
-    # Segunda linha: capacidade do contêiner
-    bin_capacity = int(linhas[1])
+    if use_cache:
+        temporary = f"{cache}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache) or '.', exist_ok=True)
+            with open(temporary, "wb") as file:
+                np.save(file, np.concatenate(([capacity], weights)))
+            os.replace(temporary, cache)
+        except OSError:
+            # Diretório somente leitura: a instância continua válida, apenas sem cache
+            if os.path.exists(temporary):
+                os.remove(temporary)
+    return capacity, weights
 
-    # Das linhas restantes, extraímos os pesos dos itens
-    weights = []
-    for i in range(2, 2+n):
-        if i < len(linhas):
-            weights.append(int(linhas[i]))
+
+def create_data(arquivo, instances_dir=None, fmt='auto', problem=0, use_cache=True, as_array=False,
+                cache_dir=None):
+    """
+    Processa um arquivo de instância e extrai os dados necessários.
+
+    Args:
+        arquivo (str): Nome do arquivo de instância (relativo a INSTANCES_DIR) ou caminho explícito.
+        instances_dir (str, opcional): Diretório de instâncias. Se None, usa INSTANCES_DIR.
+        fmt (str, opcional): Formato do arquivo (ver `read_instance`).
+        problem (int ou str, opcional): Instância escolhida nos arquivos 'orlib'.
+        use_cache (bool, opcional): Se True, usa o cache binário da instância.
+        as_array (bool, opcional): Se True, 'weights' é o array NumPy (possivelmente mapeado em
+            memória); caso contrário, uma lista de inteiros.
+        cache_dir (str, opcional): Diretório do cache (ver `read_instance`).
+
+    Returns:
+        dict: Dicionário contendo os dados processados
+    """
+    caminho = resolve_instance_path(arquivo, instances_dir)
+    bin_capacity, weights = read_instance(caminho, fmt, problem, use_cache, cache_dir)
 
     data = {
-        "num_items": n,
+        "num_items": len(weights),
         "bin_capacity": bin_capacity,
-        "weights": weights
+        "weights": weights if as_array else weights.tolist()
     }
     return data
@@ -17,7 +17,8 @@ def get_valid_files(arquivos, base_dir):
     """Verifica quais arquivos existem no diretório base e retorna uma lista dos válidos."""
     valid_files = []
     for arquivo in arquivos:
-        full_path = os.path.join(base_dir, arquivo)
+        # Aceita também caminhos explícitos (absolutos ou relativos ao diretório atual)
+        full_path = arquivo if os.path.isabs(arquivo) or os.path.exists(arquivo) else os.path.join(base_dir, arquivo)
         if os.path.exists(full_path):
             valid_files.append(arquivo)
         else:
@@ -0,0 +1,72 @@
+"""
+Gerador de instâncias sintéticas de Bin Packing.
+
+Permite executar benchmarks e testes sem o diretório externo de instâncias.
+As famílias seguem a construção das instâncias clássicas:
+
+- 'uniform': itens com tamanho uniforme em [min_size, max_size] (ex.: Falkenauer U,
+  capacidade 150 e itens em [20, 100]; Scholl N, capacidade 100).
+- 'triplet': Falkenauer T, capacidade 1000 e itens em (250, 500) formando trincas que
+  somam exatamente a capacidade; o ótimo é conhecido (um bin por trinca).
+
+Os dicionários retornados têm o mesmo formato de `create_data`.
+"""
+
+import numpy as np
+from utils.rng import make_rng
+
+
+def uniform_instance(num_items, capacity=150, min_size=20, max_size=100, seed=None):
+    """
+    Gera uma instância com tamanhos de itens uniformemente distribuídos.
+
+    Args:
+        num_items (int): Número de itens.
+        capacity (int, opcional): Capacidade dos bins.
+        min_size (int, opcional): Menor tamanho de item.
+        max_size (int, opcional): Maior tamanho de item.
+        seed (int, opcional): Semente do gerador.
+
+    Returns:
+        dict: Dicionário com 'num_items', 'bin_capacity' e 'weights'.
+    """
+    rng = make_rng(seed)
+    weights = rng.integers(min_size, max_size, size=num_items, endpoint=True)
+    return {
+        "num_items": num_items,
+        "bin_capacity": capacity,
+        "weights": weights.tolist()
+    }
+
+
+def triplet_instance(num_triplets, capacity=1000, seed=None):
+    """
+    Gera uma instância de trincas (Falkenauer T) com ótimo igual a `num_triplets`.
+
+    Cada trinca tem um item em [0.38C, 0.49C] e dois itens em (C/4, C/2) que completam
+    exatamente a capacidade. Os itens são embaralhados.
+
+    Args:
+        num_triplets (int): Número de trincas (e de bins da solução ótima).
+        capacity (int, opcional): Capacidade dos bins (múltiplo de 4 para trincas exatas).
+        seed (int, opcional): Semente do gerador.
+
+    Returns:
+        dict: Dicionário com 'num_items', 'bin_capacity' e 'weights'.
+    """
+    rng = make_rng(seed)
+    quarter = capacity // 4
+    first = rng.integers(int(0.38 * capacity), int(0.49 * capacity), size=num_triplets, endpoint=True)
+    # O segundo item deixa para o terceiro um tamanho também em (C/4, C/2)
+    low = np.maximum(quarter + 1, capacity // 2 + 1 - first)
+    high = capacity - first - quarter - 1
+    second = low + (rng.random(num_triplets) * (high - low + 1)).astype(np.int64)
+    third = capacity - first - second
+
+    weights = np.concatenate((first, second, third))
+    rng.shuffle(weights)
+    return {
+        "num_items": int(weights.size),
+        "bin_capacity": capacity,
+        "weights": weights.tolist()
+    }
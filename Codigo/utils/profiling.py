@@ -0,0 +1,125 @@
+"""
+Perfilamento (cProfile) da resolução de instâncias.
+
+Cada chamada perfilada grava dois arquivos no diretório de saída:
+
+- `<instância>.pstats`: as estatísticas do cProfile, para `pstats`/snakeviz;
+- `<instância>.collapsed`: pilhas no formato "colapsado" (`f1;f2;f3 microssegundos`
+  por linha), aceito por flamegraph.pl, speedscope e inferno.
+
+O cProfile registra apenas as arestas chamador → chamado, não as pilhas completas;
+as pilhas colapsadas são reconstruídas percorrendo o grafo de chamadas a partir das
+raízes e repartindo o tempo de cada função entre os chamadores na proporção do tempo
+acumulado de cada aresta (a mesma aproximação usada por flameprof e gprof2dot).
+"""
+
+import cProfile
+import os
+import pstats
+import re
+from collections import Counter
+
+# Profundidade máxima das pilhas reconstruídas e menor tempo (s) de um ramo percorrido
+MAX_STACK_DEPTH = 64
+MIN_BRANCH_TIME = 1e-6
+
+
+def profile_name(arquivo):
+    """Nome base dos arquivos de perfil de uma instância (o caminho sem separadores nem extensão)."""
+    return re.sub(r'[^\w.-]+', '_', os.path.splitext(arquivo)[0]).strip('_')
+
+
+def profile_call(output_dir, name, function, *args, **kwargs):
+    """
+    Executa `function(*args, **kwargs)` sob o cProfile e grava `.pstats` e `.collapsed`.
+
+    Args:
+        output_dir (str): Diretório de saída (criado se não existir).
+        name (str): Nome base dos arquivos.
+        function (callable): A função a ser perfilada.
+
+    Returns:
+        O valor retornado por `function`.
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, name)
+        profiler.dump_stats(path + '.pstats')
+        write_collapsed_stacks(pstats.Stats(profiler), path + '.collapsed')
+
+
+def collapsed_stacks(stats):
+    """
+    Reconstrói as pilhas de chamadas a partir das estatísticas do cProfile.
+
+    Args:
+        stats (pstats.Stats): As estatísticas.
+
+    Returns:
+        Counter: Tempo próprio (s) de cada pilha, indexado pela pilha ('f1;f2;f3').
+    """
+    table = stats.stats
+    children = {}
+    for function, (_, _, _, _, callers) in table.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((function, edge[3]))
+    roots = [function for function, entry in table.items() if not entry[4]]
+
+    stacks = Counter()
+
+    def visit(function, path, on_path, fraction):
+        _, _, own_time, cumulative, _ = table[function]
+        path = path + (_frame_label(function),)
+        if own_time * fraction > 0:
+            stacks[';'.join(path)] += own_time * fraction
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        on_path = on_path | {function}
+        for callee, edge_time in children.get(function, ()):
+            callee_time = table[callee][3]
+            if callee in on_path or callee_time <= 0:
+                continue
+            # Parte do tempo do chamado que passa por esta aresta e por este caminho
+            share = fraction * min(edge_time / callee_time, 1.0)
+            if share * callee_time >= MIN_BRANCH_TIME:
+                visit(callee, path, on_path, share)
+
+    for root in roots:
+        visit(root, (), frozenset(), 1.0)
+    return stacks
+
+
+def write_collapsed_stacks(stats, path):
+    """Grava as pilhas colapsadas de `stats` em `path`, com os tempos em microssegundos."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds:
+                file.write(f"{stack} {microseconds}\n")
+
+
+def print_hot_functions(paths, top=20):
+    """
+    Exibe as `top` funções com maior tempo próprio somando os perfis de `paths`.
+
+    Args:
+        paths (list): Arquivos `.pstats` (os inexistentes são ignorados).
+        top (int, opcional): Número de funções exibidas. Padrão é 20.
+    """
+    paths = [path for path in paths if os.path.exists(path)]
+    if not paths:
+        return
+    stats = pstats.Stats(*paths)
+    print(f"\nFunções mais custosas ({len(paths)} perfis, ordenadas pelo tempo próprio):")
+    stats.sort_stats('tottime').print_stats(top)
+
+
+def _frame_label(function):
+    filename, line, name = function
+    if filename == '~':
+        # Funções embutidas: o cProfile registra apenas o nome (ex.: "<built-in method len>")
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
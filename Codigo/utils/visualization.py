@@ -4,29 +4,60 @@ Módulo para visualização de resultados do problema de Bin Packing.
 Este módulo implementa funções para gerar visualizações gráficas dos resultados
 dos algoritmos de otimização, permitindo uma melhor compreensão e análise
 do desempenho e das soluções encontradas.
+
+matplotlib e seaborn são importados apenas quando um gráfico é de fato gerado
+(`_plotting`): importar este módulo não custa o carregamento das bibliotecas
+gráficas, nem no processo principal nem nos processos de trabalho.
 """
 
-import matplotlib.pyplot as plt
+import sys
 import numpy as np
 import os
 from config import VISUALIZATION_CONFIG
-import seaborn as sns
+
+
+def _plotting():
+    """
+    Importa matplotlib.pyplot e seaborn sob demanda.
+
+    Se os gráficos não forem exibidos (`show_plots` desligado), usa o backend 'Agg', que
+    apenas grava arquivos e funciona sem display.
+
+    Returns:
+        tuple: Os módulos (pyplot, seaborn).
+    """
+    if 'matplotlib.pyplot' not in sys.modules and not VISUALIZATION_CONFIG.get('show_plots', True):
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
 
 
 def create_convergence_plot(history, instance_name, save_path=None):
     """
     Cria um gráfico de convergência mostrando a evolução do fitness ao longo das gerações.
 
+    Se o histórico tiver a instrumentação por fase ('phase_times'), um segundo painel mostra
+    o tempo de cada fase em cada geração, em barras empilhadas.
+
     Args:
         history (dict): Dicionário contendo listas de 'best_fitness', 'avg_fitness' e 'generation'
         instance_name (str): Nome da instância para o título do gráfico
         save_path (str, optional): Caminho para salvar o gráfico. Se None, não salva.
     """
-    plt.figure(figsize=(10, 6))
+    plt, sns = _plotting()
 
     # Configuração de estilo
     sns.set_style("whitegrid")
 
+    phase_times = history.get('phase_times') or []
+    if phase_times:
+        _, (axis, phase_axis) = plt.subplots(2, 1, figsize=(10, 10), sharex=True)
+        plt.sca(axis)
+    else:
+        plt.figure(figsize=(10, 6))
+
     # Plotar fitness médio e melhor fitness
     plt.plot(history['generation'], history['best_fitness'],
              'b-', linewidth=2, label='Melhor Fitness')
@@ -40,6 +71,9 @@ def create_convergence_plot(history, instance_name, save_path=None):
     plt.legend()
     plt.grid(True)
 
+    if phase_times:
+        _plot_phase_times(phase_axis, history['generation'], phase_times)
+
     # Salvar o gráfico se o caminho for fornecido
     if save_path:
         plt.savefig(save_path, bbox_inches='tight', dpi=300)
@@ -51,6 +85,112 @@ def create_convergence_plot(history, instance_name, save_path=None):
     plt.close()
 
 
+def _plot_phase_times(axis, generations, phase_times):
+    """Desenha o tempo de cada fase por geração em barras empilhadas."""
+    _, sns = _plotting()
+    phases = sorted({phase for times in phase_times for phase in times})
+    colors = sns.color_palette("tab10", len(phases))
+    bottom = np.zeros(len(phase_times))
+    for phase, color in zip(phases, colors):
+        seconds = np.array([times.get(phase, 0.0) for times in phase_times])
+        axis.bar(generations, seconds, bottom=bottom, color=color, label=phase)
+        bottom += seconds
+    axis.set_title('Tempo por fase em cada geração')
+    axis.set_xlabel('Geração')
+    axis.set_ylabel('Tempo (s)')
+    axis.legend(loc='upper right', fontsize='small')
+
+
+def bin_packing_arrays(solution):
+    """
+    Converte uma solução nos arrays usados pelos gráficos de ocupação.
+
+    Args:
+        solution (list): Lista de containers (bins).
+
+    Returns:
+        tuple: (bins, sizes, counts), com o índice do bin, o tamanho e a quantidade de cada
+            tipo de item da solução.
+    """
+    lengths = np.fromiter((len(container.counts) for container in solution),
+                          dtype=np.int64, count=len(solution))
+    sizes = np.fromiter((size for container in solution for size in container.counts),
+                        dtype=np.int64, count=int(lengths.sum()))
+    counts = np.fromiter((count for container in solution for count in container.counts.values()),
+                         dtype=np.int64, count=len(sizes))
+    return np.repeat(np.arange(len(solution)), lengths), sizes, counts
+
+
+def _select_bins(bins, sizes, counts, num_bins, order=None):
+    """
+    Escolhe os bins desenhados e a posição de cada um no eixo x.
+
+    Acima de `max_plotted_bins`, desenha uma amostra de bins igualmente espaçados.
+
+    Args:
+        order (np.ndarray, opcional): Ordem dos bins no gráfico (padrão: a da solução).
+
+    Returns:
+        tuple: (posições, sizes, counts, números dos bins desenhados) dos tipos de item mantidos.
+    """
+    if order is None:
+        order = np.arange(num_bins)
+    max_bins = VISUALIZATION_CONFIG.get('max_plotted_bins', 200)
+    if num_bins > max_bins:
+        order = order[np.unique(np.linspace(0, num_bins - 1, max_bins).astype(np.int64))]
+    position = np.full(num_bins, -1)
+    position[order] = np.arange(len(order))
+    keep = position[bins] >= 0
+    return position[bins][keep], sizes[keep], counts[keep], order + 1
+
+
+def _draw_bins(ax, plt, positions, sizes, counts, labels, capacity):
+    """
+    Desenha os itens empilhados em cada bin com uma chamada `bar` por grupo de tamanhos.
+
+    Os tamanhos distintos são divididos em até 10 grupos (faixas), cada um com uma cor.
+    Quando há itens demais (`max_drawn_items`), os itens de um mesmo tipo em um bin formam
+    um único bloco. Em cada bin, os itens maiores ficam embaixo.
+    """
+    if counts.sum() <= VISUALIZATION_CONFIG.get('max_drawn_items', 20000):
+        heights = np.repeat(sizes, counts)
+        item_sizes = heights
+        positions = np.repeat(positions, counts)
+    else:
+        heights = sizes * counts
+        item_sizes = sizes
+
+    order = np.lexsort((-item_sizes, positions))
+    positions, heights, item_sizes = positions[order], heights[order], item_sizes[order]
+    start = np.cumsum(heights) - heights
+    _, first, inverse = np.unique(positions, return_index=True, return_inverse=True)
+    bottom = start - start[first][inverse]
+
+    distinct = np.unique(item_sizes)[::-1]
+    num_groups = min(10, len(distinct))
+    group = np.searchsorted(-distinct, -item_sizes) * num_groups // max(len(distinct), 1)
+    colors = plt.cm.viridis(np.linspace(0, 1, max(num_groups, 1)))
+    edge = 0.5 if len(labels) <= VISUALIZATION_CONFIG.get('max_labeled_bins', 40) else 0
+    for index in range(num_groups):
+        mask = group == index
+        largest, smallest = item_sizes[mask].max(), item_sizes[mask].min()
+        label = f'Item {largest}' if largest == smallest else f'Itens {smallest}-{largest}'
+        ax.bar(positions[mask], heights[mask], 0.8, bottom=bottom[mask], color=colors[index],
+               edgecolor='white', linewidth=edge, label=label)
+
+    ax.axhline(y=capacity, color='r', linestyle='--', label='Capacidade Máxima')
+    ax.set_ylim(0, capacity * 1.1)  # Deixar um espaço acima da capacidade máxima
+
+    # Com muitos bins, apenas alguns recebem rótulo
+    max_labels = VISUALIZATION_CONFIG.get('max_labeled_bins', 40)
+    ticks = np.arange(len(labels))
+    if len(labels) > max_labels:
+        ticks = np.unique(np.linspace(0, len(labels) - 1, max_labels).astype(np.int64))
+    ax.set_xticks(ticks)
+    ax.set_xticklabels([str(label) for label in labels[ticks]],
+                       rotation=90 if len(ticks) > 20 else 0)
+
+
 def visualize_bin_packing(solution, title="Solução de Bin Packing", save_path=None):
     """
     Cria uma visualização gráfica da solução de bin packing.
@@ -60,75 +200,52 @@ def visualize_bin_packing(solution, title="Solução de Bin Packing", save_path=
         title (str): Título do gráfico
         save_path (str, optional): Caminho para salvar o gráfico. Se None, não salva.
     """
-    num_bins = len(solution)
-    if num_bins == 0:
+    if len(solution) == 0:
         print("Nenhum bin para visualizar")
         return
+    bins, sizes, counts = bin_packing_arrays(solution)
+    render_bin_packing(bins, sizes, counts, len(solution),
+                       max(container.capacity for container in solution), title, save_path)
 
-    # Configurações de tamanho e estilo
-    plt.figure(figsize=(12, 8))
-    sns.set_style("whitegrid")
-
-    # Calcular altura máxima para cada bin (normalizado pela capacidade)
-    bin_capacities = [container.capacity for container in solution]
-    max_capacity = max(bin_capacities)
 
-    # Configurar largura das barras e espaçamentos
-    bar_width = 0.8
-    bin_positions = np.arange(num_bins)
-
-    # Para cada bin, plotar os itens como barras empilhadas
-    bottom = np.zeros(num_bins)
-
-    # Criar uma paleta de cores
-    colors = plt.cm.viridis(np.linspace(0, 1, 10))
-
-    # Agrupar elementos por tamanho para visualização
-    size_groups = {}
-    for i, container in enumerate(solution):
-        for item in container.elements:
-            if item not in size_groups:
-                size_groups[item] = []
-            size_groups[item].append((i, item))
-
-    # Ordenar os grupos por tamanho para a legenda
-    sorted_sizes = sorted(size_groups.keys(), reverse=True)
+def render_bin_packing(bins, sizes, counts, num_bins, capacity, title="Solução de Bin Packing",
+                       save_path=None):
+    """
+    Desenha a ocupação dos bins a partir dos arrays de `bin_packing_arrays`.
 
-    # Plotar os itens agrupados por tamanho
-    for i, size in enumerate(sorted_sizes):
-        bin_indices = []
-        heights = []
+    Recebe apenas arrays, de modo que pode ser executada em outro processo sem transferir
+    os objetos da solução. Acima de `max_plotted_bins` bins é desenhada uma amostra, e acima
+    de `max_labeled_bins` apenas parte dos bins recebe rótulo.
 
-        for bin_idx, height in size_groups[size]:
-            bin_indices.append(bin_idx)
-            heights.append(height)
+    Args:
+        bins, sizes, counts (np.ndarray): Bin, tamanho e quantidade de cada tipo de item.
+        num_bins (int): Número de bins da solução.
+        capacity (int): Capacidade dos bins.
+        title (str): Título do gráfico
+        save_path (str, optional): Caminho para salvar o gráfico. Se None, não salva.
+    """
+    plt, sns = _plotting()
 
-        color_idx = i % len(colors)
-        for bin_idx, height in zip(bin_indices, heights):
-            plt.bar(bin_positions[bin_idx], height, bar_width,
-                   bottom=bottom[bin_idx], color=colors[color_idx],
-                   edgecolor='white', linewidth=0.5)
-            bottom[bin_idx] += height
+    # Configurações de tamanho e estilo
+    sns.set_style("whitegrid")
+    _, ax = plt.subplots(figsize=(12, 8))
 
-    # Adicionar linha de capacidade máxima dos bins
-    plt.axhline(y=max_capacity, color='r', linestyle='--',
-               label='Capacidade Máxima')
+    positions, sizes, counts, labels = _select_bins(bins, sizes, counts, num_bins)
+    if len(labels) < num_bins:
+        title = f"{title} (amostra de {len(labels)} de {num_bins} bins)"
+    _draw_bins(ax, plt, positions, sizes, counts, labels, capacity)
 
     # Configurações finais do gráfico
-    plt.title(title)
-    plt.xlabel('Número do Bin')
-    plt.ylabel('Ocupação')
-    plt.xticks(bin_positions, [f'Bin {i+1}' for i in range(num_bins)])
-    plt.ylim(0, max_capacity * 1.1)  # Deixar um espaço acima da capacidade máxima
-
-    plt.legend(['Capacidade Máxima'] + [f'Item {size}' for size in sorted_sizes[:10]] +
-              (['Outros tamanhos'] if len(sorted_sizes) > 10 else []))
+    ax.set_title(title)
+    ax.set_xlabel('Número do Bin')
+    ax.set_ylabel('Ocupação')
+    ax.legend(loc='upper left', bbox_to_anchor=(1.01, 1), fontsize='small')
 
     plt.tight_layout()
 
     # Salvar o gráfico se o caminho for fornecido
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        plt.savefig(save_path, bbox_inches='tight', dpi=VISUALIZATION_CONFIG.get('bin_plot_dpi', 150))
         print(f"Visualização da solução salva em: {save_path}")
 
     if VISUALIZATION_CONFIG.get('show_plots', True):
@@ -148,53 +265,28 @@ def visualize_bin_comparison(original_solution, improved_solution,
         title (str): Título do gráfico
         save_path (str, optional): Caminho para salvar o gráfico. Se None, não salva.
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
+    plt, sns = _plotting()
 
     # Configuração de estilo
     sns.set_style("whitegrid")
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
 
     # Função auxiliar para plotar uma solução em um eixo específico
     def plot_solution(solution, ax, title):
         num_bins = len(solution)
-        bin_capacities = [container.capacity for container in solution]
-        max_capacity = max(bin_capacities)
-
-        # Configurar largura das barras e espaçamentos
-        bar_width = 0.8
-        bin_positions = np.arange(num_bins)
-
-        # Para cada bin, plotar os itens como barras empilhadas
-        bottom = np.zeros(num_bins)
-
-        # Criar uma paleta de cores única para os dois gráficos
-        colors = plt.cm.viridis(np.linspace(0, 1, 20))
+        bins, sizes, counts = bin_packing_arrays(solution)
 
         # Ordenar os bins por preenchimento (mais cheios primeiro)
-        sorted_indices = sorted(range(num_bins),
-                               key=lambda i: solution[i].used,
-                               reverse=True)
-        sorted_solution = [solution[i] for i in sorted_indices]
-
-        # Plotar cada item dentro de cada bin
-        for bin_idx, container in enumerate(sorted_solution):
-            for item_idx, item in enumerate(container.elements):
-                color_idx = item % len(colors)
-                ax.bar(bin_positions[bin_idx], item, bar_width,
-                      bottom=bottom[bin_idx], color=colors[color_idx],
-                      edgecolor='white', linewidth=0.5)
-                bottom[bin_idx] += item
-
-        # Adicionar linha de capacidade máxima dos bins
-        ax.axhline(y=max_capacity, color='r', linestyle='--',
-                  label='Capacidade Máxima')
+        used = np.bincount(bins, weights=sizes * counts, minlength=num_bins)
+        order = np.argsort(-used, kind='stable')
+        positions, sizes, counts, labels = _select_bins(bins, sizes, counts, num_bins, order)
+        _draw_bins(ax, plt, positions, sizes, counts, labels,
+                   max(container.capacity for container in solution))
 
         # Configurações do subplot
         ax.set_title(title)
         ax.set_xlabel('Número do Bin')
         ax.set_ylabel('Ocupação')
-        ax.set_xticks(bin_positions)
-        ax.set_xticklabels([f'{i+1}' for i in range(num_bins)])
-        ax.set_ylim(0, max_capacity * 1.1)
 
         # Adicionar texto com o número total de bins
         ax.text(0.5, -0.1, f'Total de Bins: {num_bins}',
@@ -211,7 +303,7 @@ def visualize_bin_comparison(original_solution, improved_solution,
 
     # Salvar o gráfico se o caminho for fornecido
     if save_path:
-        plt.savefig(save_path, bbox_inches='tight', dpi=300)
+        plt.savefig(save_path, bbox_inches='tight', dpi=VISUALIZATION_CONFIG.get('bin_plot_dpi', 150))
         print(f"Comparação de soluções salva em: {save_path}")
 
     if VISUALIZATION_CONFIG.get('show_plots', True):
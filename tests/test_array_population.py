@@ -0,0 +1,146 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from algorithms.array_population import ArrayPopulation
+
+class TestArrayPopulation(unittest.TestCase):
+    """
+    Testes unitários para a população vetorizada do GGA
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        self.weights = [50, 40, 30, 30, 20, 20, 10, 70, 60, 45]
+        self.capacity = 100
+        self.gga = GGA({'weights': self.weights, 'bin_capacity': self.capacity})
+        self.solution = self.gga.generate_initial_solution()
+        self.population = ArrayPopulation.from_solutions([self.solution] * 4,
+                                                         self.weights, self.capacity)
+        self.rng = np.random.default_rng(0)
+
+    def assertFeasible(self, population):
+        for row in range(population.size):
+            self.assertTrue((population.loads[row] <= self.capacity).all())
+            loads = np.bincount(population.assignment[row], weights=population.weights,
+                                minlength=population.max_bins)
+            np.testing.assert_array_equal(loads, population.loads[row])
+
+    def test_encode_decode(self):
+        """
+        Testa se a codificação seguida da decodificação preserva a solução
+        """
+        decoded = self.population.decode(0)
+        self.assertEqual([sorted(c.elements) for c in decoded],
+                         [sorted(c.elements) for c in self.solution])
+
+    def test_fitness_matches_object_engine(self):
+        """
+        Testa se o fitness vetorizado é igual ao fitness do GGA baseado em objetos
+        """
+        expected = self.gga.fitness(self.solution)
+        np.testing.assert_allclose(self.population.fitness(), [expected] * 4)
+
+    def test_recompute_loads(self):
+        """
+        Testa o recálculo vetorizado das cargas
+        """
+        loads = self.population.loads.copy()
+        self.population.recompute_loads()
+        np.testing.assert_array_equal(self.population.loads, loads)
+
+    def test_selection(self):
+        """
+        Testa se a seleção por torneio retorna índices válidos
+        """
+        selected = self.population.stoic_tournament_selection(
+            np.arange(4, dtype=float), 10, self.rng)
+        self.assertEqual(len(selected), 10)
+        self.assertTrue(((selected >= 0) & (selected < 4)).all())
+
+    def test_mutations_keep_feasibility(self):
+        """
+        Testa se as mutações mantêm as soluções viáveis
+        """
+        for _ in range(200):
+            for row in range(self.population.size):
+                self.population.mutate_move(row, self.rng)
+                self.population.mutate_swap(row, self.rng)
+        self.assertFeasible(self.population)
+
+        before = self.population.assignment.copy()
+        for _ in range(50):
+            self.population.mutate(np.arange(self.population.size), 1.0, self.rng)
+        self.assertFeasible(self.population)
+        self.assertFalse((self.population.assignment == before).all())
+
+    def test_encode_shares_weight_order(self):
+        """
+        Testa se a ordem dos itens por peso é calculada uma vez e se a codificação confere os itens
+        """
+        order = self.population.weight_order()
+        derived = self.population.take([0, 1])
+        self.assertIs(derived.weight_order(), order)
+        derived.encode(0, self.solution)
+        np.testing.assert_array_equal(derived.assignment[0], self.population.assignment[0])
+        self.assertFeasible(derived)
+        with self.assertRaises(ValueError):
+            derived.encode(1, self.solution[:-1])
+
+    def test_crossover(self):
+        """
+        Testa se o cruzamento gera um filho viável contendo todos os itens
+        """
+        assignment, loads = self.population.crossover(0, 1, self.rng)
+        self.assertTrue((assignment >= 0).all())
+        self.assertTrue((loads <= self.capacity).all())
+        self.assertEqual(loads.sum(), sum(self.weights))
+
+    def test_run_array_engine(self):
+        """
+        Testa a execução completa do GGA com a população vetorizada
+        """
+        gga = GGA({'weights': self.weights, 'bin_capacity': self.capacity,
+                   'num_generations': 3, 'population_size': 6,
+                   'tabu_max_iterations': 5, 'population_engine': 'array',
+                   'stop_at_lower_bound': False})
+        solution = gga.run()
+        self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+        self.assertEqual(len(gga.history['generation']), 3)
+
+    def test_from_assignment(self):
+        """
+        Testa a criação da população a partir de uma atribuição, sem passar por contêineres
+        """
+        population = ArrayPopulation.from_assignment(self.weights, self.capacity,
+                                                     self.population.assignment[0], 3)
+        self.assertEqual(population.size, 3)
+        np.testing.assert_array_equal(population.loads[2], self.population.loads[0])
+        self.assertFeasible(population)
+        # Indivíduos iguais têm um único perfil de carga
+        self.assertAlmostEqual(population.load_profile_diversity(), 1 / 3)
+
+    def test_large_instance_mode(self):
+        """
+        Testa o modo de instâncias grandes (limiar reduzido para a instância de teste)
+        """
+        gga = GGA({'weights': self.weights, 'bin_capacity': self.capacity,
+                   'num_generations': 3, 'population_size': 30, 'seed': 1,
+                   'large_instance_threshold': 5, 'large_instance_population_size': 8,
+                   'stop_at_lower_bound': False})
+        self.assertTrue(gga.large_instance)
+        self.assertEqual(gga.population_engine, 'array')
+        self.assertEqual(gga.population_size, 8)
+        solution = gga.run()
+        self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+        self.assertEqual(gga.tabu_neighbors_evaluated, 0)
+
+if __name__ == '__main__':
+    unittest.main()
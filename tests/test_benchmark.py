@@ -0,0 +1,67 @@
+import sys
+import os
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from benchmark import run_benchmark, compare_results, measure_startup
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Testes unitários para o benchmark e a detecção de regressões
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        configs = {
+            'gga': {'algorithm': 'gga', 'num_generations': 3, 'population_size': 6,
+                    'tabu_max_iterations': 5},
+            'tabu': {'algorithm': 'tabu', 'max_iterations': 20},
+        }
+        self.results = run_benchmark(['synthetic/t60'], configs, seed=0)
+
+    def test_records(self):
+        """
+        Testa as métricas registradas para cada par instância/configuração
+        """
+        records = {r['config']: r for r in self.results['results']}
+        self.assertEqual(set(records), {'gga', 'tabu'})
+        for record in records.values():
+            self.assertEqual(record['lower_bound'], 20)
+            self.assertGreaterEqual(record['bins'], record['lower_bound'])
+            self.assertGreater(record['peak_memory_mb'], 0)
+        self.assertEqual(records['gga']['generations'], 3)
+        self.assertGreaterEqual(self.results['machine']['cpus'], 1)
+        self.assertGreater(records['tabu']['neighbors_evaluated'], 0)
+
+    def test_compare_results(self):
+        """
+        Testa a detecção de regressões de tempo e de qualidade
+        """
+        self.assertEqual(compare_results(self.results, self.results, 0.1), [])
+
+        slower = {'results': [dict(r, wall_time=r['wall_time'] * 2, bins=r['bins'] + 1)
+                              for r in self.results['results']]}
+        regressions = compare_results(slower, self.results, 0.1)
+        self.assertEqual(len(regressions), 4)
+        # Tempos muito curtos são ignorados
+        self.assertEqual(len(compare_results(slower, self.results, 0.1, min_wall_time=1e9)), 2)
+
+    def test_startup_without_plotting(self):
+        """
+        Testa se a inicialização de main.py é medida e não carrega matplotlib
+        """
+        startup = measure_startup(repeats=1)
+        self.assertGreater(startup['main_list'], 0)
+        self.assertGreater(startup['import_main'], 0)
+        self.assertFalse(startup['plotting_imported'])
+
+        slower = dict(self.results, startup=dict(startup, import_main=startup['import_main'] * 2))
+        regressions = compare_results(slower, dict(self.results, startup=startup), 0.1)
+        self.assertEqual(len(regressions), 1)
+
+if __name__ == '__main__':
+    unittest.main()
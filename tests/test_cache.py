@@ -0,0 +1,99 @@
+import sys
+import os
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.cache import LRUCache, canonical_hash, canonical_key
+from algorithms.gga import GGA
+from models.container import Container
+
+def make_solution(bins, capacity=100):
+    solution = []
+    for elements in bins:
+        container = Container(capacity)
+        for element in elements:
+            container.add_element(element)
+        solution.append(container)
+    return solution
+
+class TestCache(unittest.TestCase):
+    """
+    Testes unitários para a chave canônica e o cache LRU
+    """
+
+    def test_canonical_hash_is_order_independent(self):
+        """
+        Testa se o hash ignora a ordem dos bins e dos itens
+        """
+        solution = make_solution([[50, 30], [40, 40, 10], [20]])
+        permuted = make_solution([[20], [10, 40, 40], [30, 50]])
+        different = make_solution([[50, 40], [30, 40, 10], [20]])
+        self.assertEqual(canonical_hash(solution), canonical_hash(permuted))
+        self.assertNotEqual(canonical_hash(solution), canonical_hash(different))
+
+    def test_canonical_key_survives_hash_collision(self):
+        """
+        Testa se empacotamentos diferentes com o mesmo hash não são confundidos pelo cache
+        """
+        key = canonical_key(make_solution([[50, 30], [20]]))
+        other = canonical_key(make_solution([[50, 20], [30]]))
+        self.assertEqual(key, canonical_key(make_solution([[20], [30, 50]])))
+        other._hash = key._hash
+        self.assertEqual(hash(other), hash(key))
+        self.assertNotEqual(key, other)
+
+        cache = LRUCache()
+        cache.put(key, 'a')
+        self.assertIsNone(cache.get(other))
+        cache.put(other, 'b')
+        self.assertEqual((cache.get(key), cache.get(other)), ('a', 'b'))
+
+    def test_lru_eviction_and_counters(self):
+        """
+        Testa a política LRU e os contadores de acertos e falhas
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertNotIn('b', cache)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_disabled_cache(self):
+        """
+        Testa o cache desabilitado
+        """
+        cache = LRUCache(maxsize=0)
+        cache.put('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+        # Indivíduos repetidos na população não contam como acertos de um cache desabilitado
+        gga = GGA({'weights': [50, 40, 30, 30, 20, 20, 10, 70, 60, 45], 'bin_capacity': 100,
+                   'cache_size': 0})
+        population = [gga.generate_initial_solution()] * 3
+        fitnesses = gga.evaluate_population_cached(population, [canonical_key(s) for s in population])
+        self.assertEqual(len(set(fitnesses.tolist())), 1)
+        self.assertEqual(gga.fitness_cache.hits, 0)
+
+    def test_gga_reuses_repeated_individuals(self):
+        """
+        Testa se o GGA reaproveita fitness e Busca Tabu de indivíduos repetidos
+        """
+        gga = GGA({'weights': [50, 40, 30, 30, 20, 20, 10, 70, 60, 45], 'bin_capacity': 100,
+                   'num_generations': 4, 'population_size': 10, 'elite_rating': 0.2,
+                   'tabu_max_iterations': 5, 'stop_at_lower_bound': False})
+        gga.run()
+        self.assertEqual(len(gga.history['cache_hits']), len(gga.history['generation']))
+        # A população inicial tem indivíduos idênticos: apenas o primeiro é avaliado
+        self.assertGreater(gga.history['cache_hits'][0], 0)
+        self.assertGreater(gga.tabu_cache.hits, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import random
 import unittest
 
 # Adicionar diretório raiz ao path
@@ -92,5 +93,80 @@ class TestContainer(unittest.TestCase):
         self.container.add_element(10)
         self.assertNotEqual(new_container.used, self.container.used)
 
+    def test_deepcopy(self):
+        """
+        Testa a cópia profunda do Container
+        """
+        from copy import deepcopy
+        self.container.add_element(30)
+
+        new_container = deepcopy(self.container)
+        self.assertEqual(new_container.used, 30)
+        self.assertEqual(new_container.elements, [30])
+
+        new_container.remove_element(30)
+        self.assertEqual(self.container.elements, [30])
+
+    def test_remove_repeated_and_missing_element(self):
+        """
+        Testa a remoção de elementos repetidos e de elementos ausentes
+        """
+        self.container.add_element(30)
+        self.container.add_element(30)
+        self.container.add_element(20)
+
+        self.container.remove_element(30)
+        self.assertEqual(sorted(self.container.elements), [20, 30])
+        self.assertEqual(len(self.container), 2)
+
+        self.container.remove_element(40)
+        self.assertEqual(self.container.used, 50)
+
+    def test_random_element(self):
+        """
+        Testa o sorteio de um elemento do Container
+        """
+        self.container.add_element(30)
+        self.container.add_element(20)
+        for _ in range(20):
+            self.assertIn(self.container.random_element(), [30, 20])
+
+    def test_add_elements_by_type(self):
+        """
+        Testa a adição de várias cópias de um tipo de item e o sorteio ponderado pela quantidade
+        """
+        container = Container(100)
+        container.add_elements(20, 3)
+        container.add_element(30)
+        self.assertEqual((len(container), container.used), (4, 90))
+        self.assertEqual(container.counts, {20: 3, 30: 1})
+        rng = random.Random(0)
+        draws = [container.random_element(rng) for _ in range(4000)]
+        self.assertAlmostEqual(draws.count(20) / len(draws), 0.75, delta=0.03)
+        with self.assertRaises(Exception):
+            container.add_elements(10, 2)
+
+    def test_slots(self):
+        """
+        Testa se o Container não possui __dict__
+        """
+        self.assertFalse(hasattr(self.container, '__dict__'))
+
+    def test_elements_setter(self):
+        """
+        Testa se elements devolve uma lista nova e se a atribuição reconstrói o container
+        """
+        self.container.add_element(30)
+        self.container.elements.append(20)
+        self.assertEqual(self.container.elements, [30])
+
+        self.container.elements = (size for size in [20, 20, 10])
+        self.assertEqual(self.container.counts, {20: 2, 10: 1})
+        self.assertEqual((len(self.container), self.container.used), (3, 50))
+
+        with self.assertRaises(Exception):
+            self.container.elements = [60, 50]
+        self.assertEqual(self.container.used, 50)
+
 if __name__ == '__main__':
     unittest.main()
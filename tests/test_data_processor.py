@@ -0,0 +1,140 @@
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from utils.data_processor import create_data, read_instance
+from algorithms.gga import GGA
+
+SCHOLL = "5\n100\n60\n50\n\n40\n30\n20\n"
+ORLIB = """ 2
+ u4_00
+ 150 3 2
+ 99
+ 50
+ 60
+ u4_01
+ 150 4 2
+ 70
+ 80
+ 30
+ 40
+"""
+
+class TestDataProcessor(unittest.TestCase):
+    """
+    Testes unitários para a leitura de instâncias
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_scholl_format(self):
+        """
+        Testa o formato de Scholl, com o cabeçalho em uma ou duas linhas
+        """
+        self.write("a.txt", SCHOLL)
+        data = create_data("a.txt", instances_dir=self.directory, use_cache=False)
+        self.assertEqual(data, {"num_items": 5, "bin_capacity": 100, "weights": [60, 50, 40, 30, 20]})
+
+        path = self.write("b.txt", "3 100\n60 50\n40\n")
+        capacity, weights = read_instance(path, fmt='falkenauer', use_cache=False)
+        self.assertEqual(capacity, 100)
+        self.assertEqual(weights.tolist(), [60, 50, 40])
+
+    def test_orlib_format(self):
+        """
+        Testa a detecção do formato da OR-Library e a escolha da instância pelo índice ou nome
+        """
+        path = self.write("binpack.txt", ORLIB)
+        self.assertEqual(read_instance(path, use_cache=False)[1].tolist(), [99, 50, 60])
+        capacity, weights = read_instance(path, problem='u4_01', use_cache=False)
+        self.assertEqual((capacity, weights.tolist()), (150, [70, 80, 30, 40]))
+        self.assertEqual(read_instance(path, problem=1, use_cache=False)[1].tolist(), [70, 80, 30, 40])
+        with self.assertRaises(ValueError):
+            read_instance(path, problem=2, use_cache=False)
+
+    def test_binary_cache(self):
+        """
+        Testa se a segunda leitura usa o cache `.npy` mapeado em memória
+        """
+        path = self.write("a.txt", SCHOLL)
+        first = create_data(path)
+        self.assertTrue(os.path.exists(path + ".npy"))
+
+        data = create_data(path, as_array=True)
+        self.assertIsInstance(data["weights"], np.memmap)
+        self.assertEqual(data["weights"].tolist(), first["weights"])
+        self.assertEqual(data["bin_capacity"], 100)
+
+        # Um arquivo mais novo que o cache é lido novamente
+        self.write("a.txt", "2\n100\n10\n20\n")
+        os.utime(path, (os.path.getmtime(path + ".npy") + 10,) * 2)
+        self.assertEqual(create_data(path)["weights"], [10, 20])
+
+    def test_array_engine_uses_mapped_weights(self):
+        """
+        Testa se a população vetorizada usa o array mapeado em memória sem copiá-lo
+        """
+        path = self.write("b.txt", "8\n100\n60\n50\n40\n30\n20\n70\n10\n45\n")
+        create_data(path)
+        data = create_data(path, as_array=True)
+        options = {'num_generations': 3, 'population_size': 6, 'seed': 0}
+
+        gga = GGA(dict(data, population_engine='array', **options))
+        self.assertTrue(np.shares_memory(gga.elements, data["weights"]))
+        solution = gga.run()
+        self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(data["weights"].tolist()))
+
+        gga = GGA(dict(data, population_engine='object', **options))
+        self.assertEqual(gga.elements, data["weights"].tolist())
+
+    def test_cache_directory(self):
+        """
+        Testa o cache em um diretório próprio e a leitura sem cache quando ele não pode ser escrito
+        """
+        path = self.write("c.txt", SCHOLL)
+        cache_dir = os.path.join(self.directory, "cache")
+        create_data(path, cache_dir=cache_dir)
+        self.assertFalse(os.path.exists(path + ".npy"))
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        data = create_data(path, as_array=True, cache_dir=cache_dir)
+        self.assertIsInstance(data["weights"], np.memmap)
+
+        # Um "diretório" dentro de um arquivo nunca pode ser criado
+        unwritable = os.path.join(path, "cache")
+        data = create_data(path, as_array=True, cache_dir=unwritable)
+        self.assertEqual(data["weights"].tolist(), [60, 50, 40, 30, 20])
+        self.assertNotIsInstance(data["weights"], np.memmap)
+
+    def test_directories_from_environment(self):
+        """
+        Testa se os diretórios de instâncias e de cache podem ser trocados por variáveis de ambiente
+        """
+        codigo = os.path.join(os.path.dirname(__file__), '..', 'Codigo')
+        env = dict(os.environ, BPP_INSTANCES_DIR=self.directory, BPP_CACHE_DIR='/tmp/cache')
+        output = subprocess.run(
+            [sys.executable, '-c', 'import config; print(config.INSTANCES_DIR, config.INSTANCE_CACHE_DIR)'],
+            cwd=codigo, env=env, capture_output=True, text=True, check=True).stdout.split()
+        self.assertEqual(output, [self.directory, '/tmp/cache'])
+
+if __name__ == '__main__':
+    unittest.main()
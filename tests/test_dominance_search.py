@@ -0,0 +1,79 @@
+import sys
+import os
+import random
+import unittest
+from collections import Counter
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from algorithms.dominance_search import DominanceLocalSearch
+from models.container import Container
+
+class TestDominanceLocalSearch(unittest.TestCase):
+    """
+    Testes unitários para a busca local por dominância
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        self.weights = [random.randint(20, 100) for _ in range(120)]
+        self.gga = GGA({'weights': self.weights, 'bin_capacity': 150, 'decoder': 'order',
+                        'packing_heuristic': 'ffd'})
+
+    def make_solution(self, *bins):
+        solution = []
+        for items in bins:
+            container = Container(10)
+            for item in items:
+                container.add_element(item)
+            solution.append(container)
+        return solution
+
+    def test_replaces_items_with_larger_free_items(self):
+        """
+        Testa a troca de um item do contêiner por um item livre maior
+        """
+        gga = GGA({'weights': [3, 3, 6, 4], 'bin_capacity': 10})
+        solution = self.make_solution([3, 3], [6], [4])
+        search = DominanceLocalSearch(gga, removed_bins=1)
+        result = search.replacement_round(solution)
+        self.assertEqual(sorted(sorted(c.elements) for c in result), [[3, 3, 4], [6]])
+        self.assertEqual(search.exchanges, 1)
+        # O contêiner sem trocas é compartilhado e os originais não são alterados
+        self.assertTrue(any(c is solution[1] for c in result))
+        self.assertEqual([c.elements for c in solution], [[3, 3], [6], [4]])
+
+    def test_search_does_not_worsen(self):
+        """
+        Testa se a busca preserva os itens e nunca usa mais contêineres que a solução inicial
+        """
+        for seed in range(10):
+            order = random.Random(seed).sample(self.weights, len(self.weights))
+            initial = self.gga.generate_initial_solution(order, presorted=True)
+            result = DominanceLocalSearch(self.gga, removed_bins=3, max_rounds=20).search(initial)
+            self.assertEqual(Counter(e for c in result for e in c.elements), Counter(self.weights))
+            self.assertTrue(all(c.used <= c.capacity for c in result))
+            self.assertLessEqual(len(result), len(initial))
+
+    def test_elite_search_modes(self):
+        """
+        Testa o GGA com cada modo de melhoria da elite
+        """
+        for mode in ('dominance', 'dominance_tabu'):
+            gga = GGA({'weights': self.weights, 'bin_capacity': 150, 'num_generations': 3,
+                       'population_size': 6, 'tabu_max_iterations': 5, 'elite_search': mode,
+                       'stop_at_lower_bound': False})
+            solution = gga.run()
+            self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+            if mode == 'dominance':
+                self.assertEqual(gga.tabu_neighbors_evaluated, 0)
+        with self.assertRaises(ValueError):
+            GGA({'weights': self.weights, 'bin_capacity': 150, 'elite_search': 'sa'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from algorithms.fitness import batch_fitness, solutions_to_loads
+from models.container import Container
+
+class TestBatchFitness(unittest.TestCase):
+    """
+    Testes unitários para a avaliação vetorizada de fitness
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        self.gga = GGA({'weights': [50, 40, 30, 30, 20, 20, 10, 70, 60, 45], 'bin_capacity': 100})
+        solution = self.gga.generate_initial_solution()
+        self.population = [solution, solution[:-1], self.gga._bitflip_Mutation(solution)]
+
+    def test_solutions_to_loads(self):
+        """
+        Testa a conversão de soluções em matriz de cargas
+        """
+        loads, num_bins = solutions_to_loads(self.population)
+        self.assertEqual(num_bins.tolist(), [len(s) for s in self.population])
+        self.assertEqual(loads.shape, (3, max(len(s) for s in self.population)))
+        self.assertEqual(loads[1].sum(), sum(c.used for c in self.population[1]))
+
+    def test_evaluate_population_matches_fitness(self):
+        """
+        Testa se a avaliação em lote é igual à avaliação individual
+        """
+        expected = [self.gga.fitness(s) for s in self.population]
+        np.testing.assert_allclose(self.gga.evaluate_population(self.population), expected)
+
+    def test_empty_container_counts_as_bin(self):
+        """
+        Testa se contêineres vazios são contados como no fitness individual
+        """
+        solution = self.population[0] + [Container(100)]
+        self.assertAlmostEqual(self.gga.evaluate_population([solution])[0],
+                               self.gga.fitness(solution))
+
+    def test_batch_fitness_counts_nonzero_bins(self):
+        """
+        Testa o cálculo direto sobre uma matriz de cargas
+        """
+        loads = np.array([[100, 50, 0], [80, 0, 0]])
+        np.testing.assert_allclose(batch_fitness(loads, 100), [2.5, 1.2])
+
+if __name__ == '__main__':
+    unittest.main()
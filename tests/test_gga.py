@@ -0,0 +1,233 @@
+import sys
+import os
+import random
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from models.container import Container
+from algorithms.gga import GGA
+from algorithms.cache import canonical_key
+
+class TestGGA(unittest.TestCase):
+    """
+    Testes unitários para o algoritmo genético de agrupamento
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        self.weights = [random.randint(20, 60) for _ in range(40)]
+        self.data = {'weights': self.weights, 'bin_capacity': 100,
+                     'num_generations': 5, 'population_size': 8, 'tabu_max_iterations': 5}
+
+    def assertSameItems(self, solution):
+        self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+
+    def test_order_decoder_preserves_permutation(self):
+        """
+        Testa se o decodificador 'order' empacota os elementos na ordem recebida
+        """
+        gga = GGA(dict(self.data, decoder='order', packing_heuristic='nfd'))
+        solution = gga.pack_elements([60, 50, 50, 40])
+        self.assertEqual([c.elements for c in solution], [[60], [50, 50], [40]])
+
+    def test_sorted_decoder_ignores_permutation(self):
+        """
+        Testa se o decodificador 'sorted' descarta a ordem recebida
+        """
+        gga = GGA(dict(self.data, decoder='sorted'))
+        shuffled = random.sample(self.weights, len(self.weights))
+        self.assertEqual([sorted(c.elements) for c in gga.pack_elements(shuffled)],
+                         [sorted(c.elements) for c in gga.generate_initial_solution()])
+
+    def test_partial_decoder(self):
+        """
+        Testa se o decodificador 'partial' ordena apenas por classes de tamanho
+        """
+        gga = GGA(dict(self.data, decoder='partial', decoder_size_classes=2,
+                       packing_heuristic='nfd'))
+        solution = gga.pack_elements([10, 20, 60, 30, 70])
+        self.assertEqual([c.elements for c in solution], [[60], [70, 10, 20], [30]])
+
+    def test_diversity_history(self):
+        """
+        Testa se a diversidade da população é registrada no histórico
+        """
+        for decoder in ('sorted', 'order', 'partial'):
+            gga = GGA(dict(self.data, decoder=decoder))
+            self.assertSameItems(gga.run())
+            self.assertEqual(len(gga.history['diversity']), len(gga.history['generation']))
+            self.assertTrue(all(0 < d <= 1 for d in gga.history['diversity']))
+
+        gga = GGA(dict(self.data, decoder='order'))
+        gga.initialize_population()
+        self.assertGreater(gga.population_diversity(gga.population), 0.5)
+
+    def test_seed_is_reproducible(self):
+        """
+        Testa se execuções com a mesma semente produzem a mesma solução e o mesmo histórico
+        """
+        for engine in ('object', 'array'):
+            runs = []
+            for _ in range(2):
+                random.seed()
+                gga = GGA(dict(self.data, decoder='order', population_engine=engine, seed=123))
+                solution = gga.run()
+                # O tempo por geração é medido no relógio e varia entre execuções
+                history = {key: value for key, value in gga.history.items() if key != 'generation_time'}
+                runs.append((sorted(sorted(c.elements) for c in solution), history))
+            self.assertEqual(runs[0], runs[1])
+
+    def test_crossovers_preserve_items(self):
+        """
+        Testa se todos os cruzamentos preservam os itens dos pais, mesmo com tamanhos repetidos
+        """
+        gga = GGA(dict(self.data, decoder='order', seed=1))
+        for _ in range(20):
+            parent1 = gga.pack_elements(gga.random.sample(self.weights, len(self.weights)))
+            parent2 = gga.pack_elements(gga.random.sample(self.weights, len(self.weights)))
+            for operator in GGA.CROSSOVER_OPERATORS.values():
+                for child in getattr(gga, operator)(parent1, parent2):
+                    self.assertSameItems(child)
+
+    def test_bpcx_inherits_bins(self):
+        """
+        Testa se o BPCX herda bins inteiros dos pais sem alterá-los
+        """
+        gga = GGA(dict(self.data, decoder='order', seed=3))
+        parent1 = gga.pack_elements(gga.random.sample(self.weights, len(self.weights)))
+        parent2 = gga.pack_elements(gga.random.sample(self.weights, len(self.weights)))
+        snapshot = [dict(c.counts) for c in parent1 + parent2]
+        for child in gga.bpcx_crossover(parent1, parent2):
+            self.assertSameItems(child)
+            self.assertTrue(all(c.used <= c.capacity for c in child))
+            # Bins compartilhados com os pais são os próprios objetos (não foram reempacotados)
+            shared = [c for c in child if any(c is p for p in parent1 + parent2)]
+            self.assertTrue(shared)
+        self.assertEqual([dict(c.counts) for c in parent1 + parent2], snapshot)
+
+    def test_reinsert_items_skips_bins_without_space(self):
+        """
+        Testa se a reinserção usa First-Fit apenas nos bins com espaço para o menor item
+        """
+        gga = GGA(self.data)
+        solution = []
+        for used in (95, 60, 98, 70):
+            container = Container(100)
+            container.add_element(used)
+            solution.append(container)
+        full = list(solution)
+        gga.reinsert_items(solution, np.array([40, 30, 20, 10], dtype=np.int64))
+        # First-Fit Decreasing: 40 -> 2º bin, 30 -> 4º bin, 20 e 10 -> novo bin
+        self.assertEqual([c.used for c in solution], [95, 100, 98, 100, 30])
+        self.assertIs(solution[0], full[0])
+        self.assertIs(solution[2], full[2])
+
+    def test_adaptive_operator_history(self):
+        """
+        Testa se o uso e a taxa de sucesso dos operadores são registrados no histórico
+        """
+        gga = GGA(dict(self.data, seed=7, stop_at_lower_bound=False, mutation_rate=0.5,
+                       adaptive_operators=True))
+        self.assertSameItems(gga.run())
+        usage = gga.history['operator_usage']
+        self.assertTrue(usage)
+        self.assertEqual(len(usage), len(gga.history['operator_success_rate']))
+        # Cada geração gera população menos elite filhos, dois por cruzamento
+        crossovers = sum(usage[0][name] for name in gga.crossover_selector.operators)
+        self.assertEqual(crossovers, (gga.population_size - int(gga.elite_rating * gga.population_size) + 1) // 2)
+        for rates in gga.history['operator_success_rate']:
+            self.assertTrue(all(rate is None or 0 <= rate <= 1 for rate in rates.values()))
+
+        # A seleção adaptativa é o padrão; sem ela, o GGA usa multi-pontos + bit-flip
+        self.assertTrue(GGA(self.data).adaptive_operators)
+        gga = GGA(dict(self.data, adaptive_operators=False))
+        gga.run()
+        self.assertEqual(gga.history['operator_usage'], [])
+
+        with self.assertRaises(ValueError):
+            GGA(dict(self.data, crossover_operators=['uniform']))
+
+    def test_adaptive_offspring_are_cached(self):
+        """
+        Testa se os filhos dos operadores adaptativos ficam no cache de fitness com o seu hash
+        """
+        gga = GGA(dict(self.data, seed=3, mutation_rate=0.5, adaptive_operators=True))
+        gga.initialize_population()
+        keys = [canonical_key(individual) for individual in gga.population]
+        fitnesses = gga.evaluate_population_cached(gga.population, keys)
+        population = gga.create_new_population(fitnesses, keys)
+
+        self.assertEqual(len(gga.population_keys), len(population))
+        children = [(child, key) for child, key in zip(population, gga.population_keys) if key is not None]
+        self.assertTrue(children)
+        misses = gga.fitness_cache.misses
+        for child, key in children:
+            self.assertEqual(key, canonical_key(child))
+            self.assertAlmostEqual(gga.fitness_cache.get(key), gga.fitness(child))
+        self.assertEqual(gga.fitness_cache.misses, misses)
+
+    def test_time_limit_returns_best_so_far(self):
+        """
+        Testa se o orçamento de tempo encerra a execução com a melhor solução encontrada
+        """
+        for engine in ('object', 'array'):
+            gga = GGA(dict(self.data, population_engine=engine, num_generations=1000,
+                           stagnation_limit=1000, stop_at_lower_bound=False, time_limit=0.0))
+            self.assertSameItems(gga.run())
+            self.assertEqual(len(gga.history['generation']), 1)
+            self.assertEqual(len(gga.history['generation_time']), 1)
+
+    def test_progress_snapshots(self):
+        """
+        Testa se `run` envia snapshots ao callback e se `iterate` pode ser interrompido
+        """
+        for engine in ('object', 'array'):
+            snapshots = []
+            gga = GGA(dict(self.data, population_engine=engine, stop_at_lower_bound=False))
+            solution = gga.run(callback=snapshots.append)
+            self.assertSameItems(solution)
+            self.assertEqual([s['generation'] for s in snapshots], gga.history['generation'])
+            self.assertEqual([s['best_fitness'] for s in snapshots], gga.history['best_fitness'])
+            self.assertEqual(len(gga.history['generation_time']), len(snapshots))
+            self.assertTrue(all(t >= 0 for t in gga.history['generation_time']))
+            self.assertEqual([s['elapsed'] for s in snapshots], sorted(s['elapsed'] for s in snapshots))
+
+            gga = GGA(dict(self.data, population_engine=engine, stop_at_lower_bound=False))
+            for snapshot in gga.iterate():
+                best = gga.current_best()
+                self.assertSameItems(best)
+                self.assertEqual(len(best), snapshot['bins'])
+                if snapshot['generation'] == 2:
+                    break
+            self.assertEqual(len(gga.history['generation']), 2)
+
+    def test_phase_instrumentation(self):
+        """
+        Testa se a instrumentação registra tempos e contadores por fase e se fica desligada por padrão
+        """
+        for engine in ('object', 'array'):
+            gga = GGA(dict(self.data, population_engine=engine, stop_at_lower_bound=False,
+                           instrumentation=True))
+            self.assertSameItems(gga.run())
+            self.assertEqual(len(gga.history['phase_times']), len(gga.history['generation']))
+            times, counts = gga.history['phase_times'][-1], gga.history['phase_counts'][-1]
+            self.assertTrue({'selection', 'crossover', 'tabu', 'fitness', 'other'} <= set(times))
+            self.assertTrue(all(seconds >= 0 for seconds in times.values()))
+            self.assertGreater(counts['repacks'], 0)
+            # As fases não se sobrepõem: a soma não passa do tempo da geração
+            for times, elapsed in zip(gga.history['phase_times'], gga.history['generation_time']):
+                self.assertAlmostEqual(sum(times.values()), elapsed, delta=1e-3 + 0.05 * elapsed)
+
+        gga = GGA(self.data)
+        self.assertNotIn('pack_elements', vars(gga))
+        gga.run()
+        self.assertEqual(gga.history['phase_times'], [])
+
+if __name__ == '__main__':
+    unittest.main()
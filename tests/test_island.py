@@ -0,0 +1,84 @@
+import sys
+import os
+import random
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+import numpy as np
+from algorithms.gga import GGA
+from algorithms.island import IslandModel, island_targets
+
+class TestIslandModel(unittest.TestCase):
+    """
+    Testes unitários para o modelo de ilhas
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        self.weights = [random.randint(20, 60) for _ in range(30)]
+        self.data = {'weights': self.weights, 'bin_capacity': 100, 'num_generations': 6,
+                     'population_size': 6, 'tabu_max_iterations': 5, 'decoder': 'order'}
+
+    def test_topologies(self):
+        """
+        Testa os destinos de migração de cada topologia
+        """
+        self.assertEqual(island_targets(3, 4, 'ring'), [0])
+        self.assertEqual(island_targets(1, 3, 'full'), [0, 2])
+        self.assertEqual(island_targets(0, 1, 'ring'), [])
+        with self.assertRaises(ValueError):
+            island_targets(0, 2, 'star')
+
+    def test_run(self):
+        """
+        Testa a execução do modelo de ilhas com migração
+        """
+        for topology in ('ring', 'full'):
+            model = IslandModel(self.data, 3, migration_interval=2, topology=topology, migrants=1)
+            solution = model.run()
+            self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+            self.assertEqual(len(model.history['island_best_fitness']), 3)
+            self.assertEqual(min(model.history['island_best_fitness']),
+                             model.history['island_best_fitness'][model.history['best_island']])
+            self.assertTrue(model.history['generation'])
+
+    def test_array_engine_migrates(self):
+        """
+        Testa a migração com a população vetorizada (usada no modo de instâncias grandes)
+        """
+        class FakeMigration:
+            migrants = 2
+
+            def __init__(self, immigrants):
+                self.immigrants = immigrants
+                self.emigrants = None
+
+            def due(self, generation):
+                return True
+
+            def exchange(self, emigrants):
+                self.emigrants = emigrants
+                return self.immigrants
+
+        gga = GGA(dict(self.data, large_instance_threshold=10, seed=1, stop_at_lower_bound=False))
+        self.assertEqual(gga.population_engine, 'array')
+        immigrant = gga.generate_initial_solution()
+        gga.migration = FakeMigration([immigrant])
+        gga.run()
+        self.assertEqual(len(gga.migration.emigrants), 2)
+        for emigrant in gga.migration.emigrants:
+            self.assertEqual(sorted(e for c in emigrant for e in c.elements), sorted(self.weights))
+
+        for topology in ('ring', 'full'):
+            model = IslandModel(dict(self.data, large_instance_threshold=10), 2,
+                                migration_interval=2, topology=topology, migrants=1)
+            solution = model.run()
+            self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import random
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from models.container import Container
+from algorithms.item_types import (solution_runs, type_counts, runs_length, slice_runs, take_runs,
+                                   replace_surplus, expand_runs)
+
+
+def expand(runs):
+    return [size for size, count in runs for _ in range(count)]
+
+
+class TestItemTypes(unittest.TestCase):
+    """
+    Testes unitários para as sequências de itens representadas por tipos
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        self.rng = random.Random(0)
+
+    def random_runs(self):
+        return [(self.rng.choice([10, 20, 30]), self.rng.randint(1, 4)) for _ in range(self.rng.randint(0, 8))]
+
+    def test_solution_runs(self):
+        """
+        Testa se os blocos de uma solução expandem para os elementos dos contêineres
+        """
+        containers = [Container(100) for _ in range(2)]
+        containers[0].add_elements(20, 3)
+        containers[0].add_element(30)
+        containers[1].add_element(50)
+        runs = solution_runs(containers)
+        self.assertEqual(expand(runs), [e for c in containers for e in c.elements])
+        self.assertEqual(type_counts(runs), {20: 3, 30: 1, 50: 1})
+        self.assertEqual(runs_length(runs), 5)
+        self.assertEqual(expand_runs(runs).tolist(), expand(runs))
+
+    def test_slice_and_take_match_items(self):
+        """
+        Testa se o recorte e a seleção por tipo equivalem às operações sobre a lista de itens
+        """
+        for _ in range(200):
+            runs = self.random_runs()
+            items = expand(runs)
+            start = self.rng.randint(0, len(items))
+            stop = self.rng.randint(start, len(items))
+            self.assertEqual(expand(slice_runs(runs, start, stop)), items[start:stop])
+
+            remaining = {size: self.rng.randint(0, 5) for size in (10, 20, 30)}
+            expected = []
+            wanted = dict(remaining)
+            for item in items:
+                if wanted[item] > 0:
+                    wanted[item] -= 1
+                    expected.append(item)
+            self.assertEqual(expand(take_runs(runs, remaining)), expected)
+            self.assertEqual(remaining, wanted)
+
+    def test_replace_surplus(self):
+        """
+        Testa se as cópias excedentes são substituídas da esquerda para a direita
+        """
+        runs = [(10, 3), (20, 1), (10, 2)]
+        fixed = replace_surplus(runs, {10: 4}, [(30, 1), (40, 3)])
+        self.assertEqual(expand(fixed), [30, 40, 40, 20, 40, 10])
+
+if __name__ == '__main__':
+    unittest.main()
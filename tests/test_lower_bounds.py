@@ -0,0 +1,83 @@
+import sys
+import os
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.lower_bounds import l1_bound, l2_bound
+from algorithms.gga import GGA
+from algorithms.tabu_search import Tabu_Search
+from models.container import Container
+from utils.instance_generator import uniform_instance, triplet_instance
+
+class TestLowerBounds(unittest.TestCase):
+    """
+    Testes unitários para os limitantes inferiores e o gerador de instâncias
+    """
+
+    def test_l1(self):
+        """
+        Testa o limitante contínuo
+        """
+        self.assertEqual(l1_bound([50, 50, 30], 100), 2)
+        self.assertEqual(l1_bound([50, 50], 100), 1)
+        self.assertEqual(l1_bound([], 100), 0)
+
+    def test_l2_dominates_l1(self):
+        """
+        Testa se L2 enxerga itens grandes que não podem compartilhar um bin
+        """
+        weights = [60, 60, 60, 45, 45]
+        self.assertEqual(l1_bound(weights, 100), 3)
+        self.assertEqual(l2_bound(weights, 100), 4)
+        self.assertEqual(l2_bound([51] * 5, 100), 5)
+        self.assertEqual(l2_bound([], 100), 0)
+
+    def test_instance_generator(self):
+        """
+        Testa as instâncias sintéticas (reprodutíveis e com o ótimo conhecido para trincas)
+        """
+        data = uniform_instance(50, capacity=150, min_size=20, max_size=100, seed=1)
+        self.assertEqual(data, uniform_instance(50, capacity=150, min_size=20, max_size=100, seed=1))
+        self.assertEqual(len(data['weights']), 50)
+        self.assertTrue(all(20 <= w <= 100 for w in data['weights']))
+
+        data = triplet_instance(10, capacity=1000, seed=2)
+        self.assertEqual(len(data['weights']), 30)
+        self.assertEqual(sum(data['weights']), 10 * 1000)
+        self.assertTrue(all(250 < w < 500 for w in data['weights']))
+        self.assertEqual(l2_bound(data['weights'], 1000), 10)
+
+    def test_early_termination(self):
+        """
+        Testa se o GGA e a Busca Tabu param assim que a solução atinge o limitante
+        """
+        data = {'weights': [50] * 8, 'bin_capacity': 100, 'num_generations': 20,
+                'population_size': 6, 'tabu_max_iterations': 5}
+
+        gga = GGA(data)
+        self.assertEqual(gga.lower_bound, 4)
+        self.assertEqual(len(gga.run()), 4)
+        # A solução inicial (BFD) já é ótima: o GGA para na primeira geração
+        self.assertEqual(len(gga.history['generation']), 1)
+
+        TS = Tabu_Search(gga, max_iterations=100, seed=0)
+        TS.search(gga.generate_initial_solution())
+        self.assertEqual(TS.neighbors_evaluated, 0)
+
+        disabled = GGA(dict(data, stop_at_lower_bound=False, stagnation_limit=100))
+        disabled.run()
+        self.assertEqual(len(disabled.history['generation']), 20)
+
+        # Os mesmos itens em 5 bins não atingem o limitante
+        solution = []
+        for elements in ([50, 50], [50, 50], [50, 50], [50], [50]):
+            container = Container(100)
+            for element in elements:
+                container.add_element(element)
+            solution.append(container)
+        self.assertFalse(gga.reached_lower_bound(gga.fitness(solution)))
+
+if __name__ == '__main__':
+    unittest.main()
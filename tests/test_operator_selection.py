@@ -0,0 +1,70 @@
+import sys
+import os
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.operator_selection import AdaptiveOperatorSelector
+
+class TestAdaptiveOperatorSelector(unittest.TestCase):
+    """
+    Testes unitários para a seleção adaptativa de operadores
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        self.selector = AdaptiveOperatorSelector(['a', 'b', 'c'], window=20, exploration=0.1)
+
+    def test_untried_operators_first(self):
+        """
+        Testa se cada operador é experimentado antes de o crédito ser usado
+        """
+        chosen = []
+        for _ in range(3):
+            operator = self.selector.select()
+            chosen.append(operator)
+            self.selector.update(operator, 0.0, 1.0)
+        self.assertEqual(chosen, ['a', 'b', 'c'])
+
+    def test_prefers_improvement_per_cost(self):
+        """
+        Testa se o operador com mais melhoria por unidade de custo é o mais escolhido
+        """
+        # 'b' melhora tanto quanto 'c', mas custa dez vezes menos
+        rewards = {'a': (0.0, 1.0), 'b': (1.0, 0.1), 'c': (1.0, 1.0)}
+        for _ in range(200):
+            operator = self.selector.select()
+            self.selector.update(operator, *rewards[operator])
+        usage, success_rate = self.selector.generation_stats()
+        self.assertEqual(max(usage, key=usage.get), 'b')
+        self.assertEqual(sum(usage.values()), 200)
+        self.assertEqual(success_rate['a'], 0.0)
+        self.assertEqual(success_rate['b'], 1.0)
+        # A contagem é reiniciada a cada chamada
+        self.assertEqual(self.selector.generation_stats()[0], {'a': 0, 'b': 0, 'c': 0})
+
+    def test_stagnation_increases_exploration(self):
+        """
+        Testa se a estagnação dá nova chance aos operadores pouco usados
+        """
+        selector = AdaptiveOperatorSelector(['a', 'b', 'c'], window=20, exploration=0.3)
+        for operator, improvement in (('a', 1.0), ('b', 0.0), ('c', 0.0)):
+            selector.update(operator, improvement, 1.0)
+        for _ in range(30):
+            selector.update('a', 1.0, 1.0)
+        self.assertEqual(selector.select(), 'a')
+        selector.set_stagnation(1.0)
+        self.assertEqual(selector.select(), 'b')
+
+    def test_requires_operators(self):
+        """
+        Testa a exceção para uma lista de operadores vazia
+        """
+        with self.assertRaises(ValueError):
+            AdaptiveOperatorSelector([])
+
+if __name__ == '__main__':
+    unittest.main()
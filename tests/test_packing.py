@@ -0,0 +1,118 @@
+import sys
+import os
+import random
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.packing import pack, item_runs, HEURISTICS
+from algorithms.gga import GGA
+
+class TestPacking(unittest.TestCase):
+    """
+    Testes unitários para o núcleo de empacotamento
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        self.capacity = 1000
+        self.weights = [random.randint(1, self.capacity) for _ in range(500)]
+
+    def assertValidPacking(self, weights, assignment, loads):
+        self.assertEqual(len(assignment), len(weights))
+        np.testing.assert_array_equal(
+            np.bincount(assignment, weights=weights, minlength=len(loads)), loads)
+        self.assertTrue((loads <= self.capacity).all())
+        self.assertTrue((loads > 0).all())
+
+    def test_all_heuristics_are_feasible(self):
+        """
+        Testa se todas as heurísticas geram empacotamentos viáveis
+        """
+        for heuristic in HEURISTICS:
+            assignment, loads = pack(self.weights, self.capacity, heuristic)
+            self.assertValidPacking(self.weights, assignment, loads)
+
+    def test_first_fit_decreasing(self):
+        """
+        Testa o First-Fit Decreasing em um exemplo conhecido
+        """
+        assignment, loads = pack([4, 8, 1, 4, 2, 1], 10, 'ffd')
+        self.assertEqual(loads.tolist(), [10, 10])
+        self.assertEqual(assignment.tolist(), [1, 0, 1, 1, 0, 1])
+
+    def test_best_fit_matches_reference(self):
+        """
+        Testa o Best-Fit Decreasing contra uma implementação direta O(n·bins)
+        """
+        residuals = []
+        for weight in sorted(self.weights, reverse=True):
+            fits = [r for r in residuals if r >= weight]
+            if fits:
+                residuals.remove(min(fits))
+                residuals.append(min(fits) - weight)
+            else:
+                residuals.append(self.capacity - weight)
+        _, loads = pack(self.weights, self.capacity, 'bfd')
+        self.assertEqual(sorted((self.capacity - loads).tolist()), sorted(residuals))
+
+    def test_next_fit_presorted(self):
+        """
+        Testa o Next-Fit preservando a ordem dos itens
+        """
+        assignment, loads = pack([6, 5, 4, 6], 10, 'nfd', presorted=True)
+        self.assertEqual(assignment.tolist(), [0, 1, 1, 2])
+        self.assertEqual(loads.tolist(), [6, 9, 6])
+
+    def test_repeated_items_packed_by_type(self):
+        """
+        Testa se blocos de itens iguais são empacotados como se fossem colocados um a um
+        """
+        weights = [30] * 7 + [20] * 3 + [70] * 2
+        self.assertEqual(item_runs(np.asarray(sorted(weights, reverse=True))), ([70, 30, 20], [2, 7, 3]))
+        # Resultados da colocação item a item
+        for heuristic, expected in (('ffd', [0, 1, 2, 2, 2, 3, 3, 3, 3, 4, 0, 1]),
+                                    ('bfd', [0, 1, 2, 2, 2, 3, 3, 3, 3, 4, 0, 1]),
+                                    ('wfd', [1, 0, 2, 2, 2, 3, 3, 3, 3, 4, 0, 1]),
+                                    ('nfd', [0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 3, 4])):
+            assignment, loads = pack(weights, 100, heuristic, presorted=(heuristic == 'nfd'))
+            self.assertEqual(assignment.tolist(), expected, heuristic)
+            self.assertEqual(loads.sum(), sum(weights))
+
+    def test_pack_into_open_bins(self):
+        """
+        Testa o empacotamento a partir de bins já abertos (cargas iniciais)
+        """
+        for heuristic, expected, expected_loads in (('ffd', [2, 0, 2], [90, 90, 70]),
+                                                    ('bfd', [2, 0, 2], [90, 90, 70]),
+                                                    ('nfd', [2, 2, 2], [60, 90, 100])):
+            assignment, loads = pack([50, 30, 20], 100, heuristic, presorted=True, loads=[60, 90])
+            self.assertEqual(assignment.tolist(), expected, heuristic)
+            self.assertEqual(loads.tolist(), expected_loads, heuristic)
+
+    def test_oversized_item(self):
+        """
+        Testa a exceção para itens maiores que a capacidade
+        """
+        with self.assertRaises(ValueError):
+            pack([5, 11], 10)
+
+    def test_gga_uses_configured_heuristic(self):
+        """
+        Testa se o GGA usa a heurística configurada para a solução inicial
+        """
+        for heuristic in HEURISTICS:
+            gga = GGA({'weights': self.weights, 'bin_capacity': self.capacity,
+                       'packing_heuristic': heuristic})
+            solution = gga.generate_initial_solution()
+            _, loads = pack(self.weights, self.capacity, heuristic)
+            self.assertEqual(len(solution), len(loads))
+            self.assertEqual(sorted(e for c in solution for e in c.elements), sorted(self.weights))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import os
+import pstats
+import random
+import tempfile
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from utils.profiling import profile_call, profile_name
+
+def _solve(weights):
+    gga = GGA({'weights': weights, 'bin_capacity': 100, 'num_generations': 3,
+               'population_size': 6, 'tabu_max_iterations': 5, 'seed': 0})
+    return len(gga.run())
+
+class TestProfiling(unittest.TestCase):
+    """
+    Testes unitários para o perfilamento com cProfile
+    """
+
+    def test_profile_name(self):
+        """
+        Testa se o nome dos arquivos de perfil não contém separadores nem extensão
+        """
+        self.assertEqual(profile_name('Scholl/Scholl_3/HARD0.txt'), 'Scholl_Scholl_3_HARD0')
+        self.assertEqual(profile_name('/tmp/u 100.txt'), 'tmp_u_100')
+
+    def test_profile_call_writes_outputs(self):
+        """
+        Testa se o perfil grava .pstats e pilhas colapsadas que somam o tempo perfilado
+        """
+        random.seed(0)
+        weights = [random.randint(20, 60) for _ in range(40)]
+        with tempfile.TemporaryDirectory() as directory:
+            bins = profile_call(directory, 'inst', _solve, weights)
+            self.assertEqual(bins, _solve(weights))
+
+            stats = pstats.Stats(os.path.join(directory, 'inst.pstats'))
+            with open(os.path.join(directory, 'inst.collapsed'), encoding='utf-8') as file:
+                lines = file.read().splitlines()
+        self.assertTrue(lines)
+        stacks = dict(line.rsplit(' ', 1) for line in lines)
+        self.assertTrue(any(stack.startswith('_solve (') and ';run (gga.py:' in stack for stack in stacks))
+        total = sum(int(value) for value in stacks.values()) / 1e6
+        self.assertAlmostEqual(total, stats.total_tt, delta=0.05 * stats.total_tt + 1e-3)
+
+if __name__ == '__main__':
+    unittest.main()
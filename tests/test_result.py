@@ -0,0 +1,67 @@
+import sys
+import os
+import pickle
+import random
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from models.result import RunResult, RESULT_VERSION
+
+class TestRunResult(unittest.TestCase):
+    """
+    Testes unitários para o registro compacto de resultados
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        weights = [random.randint(10, 60) for _ in range(60)]
+        self.gga = GGA({'weights': weights, 'bin_capacity': 100, 'num_generations': 5,
+                        'population_size': 10, 'seed': 5, 'stop_at_lower_bound': False})
+        self.solution = self.gga.run()
+        self.result = RunResult.from_solution('inst.txt', self.solution, 100,
+                                              {'load': 0.1, 'run': 0.2, 'total': 0.3}, self.gga.history)
+
+    def test_solution_round_trip(self):
+        """
+        Testa se a solução reconstruída é igual à original e se o fitness é o do GGA
+        """
+        decoded = self.result.solution()
+        self.assertEqual([c.counts for c in decoded], [c.counts for c in self.solution])
+        self.assertEqual(self.result.num_bins, len(self.solution))
+        self.assertAlmostEqual(self.result.fitness, self.gga.fitness(self.solution))
+        self.assertEqual(self.result.execution_time, 0.3)
+
+    def test_history_is_compact(self):
+        """
+        Testa se as séries numéricas do histórico viram arrays e as demais são mantidas
+        """
+        history = self.result.history
+        self.assertIsInstance(history['best_fitness'], np.ndarray)
+        self.assertEqual(history['best_fitness'].tolist(), self.gga.history['best_fitness'])
+        self.assertIsInstance(history['operator_usage'], list)
+        self.assertEqual(history['operator_usage'], self.gga.history['operator_usage'])
+
+    def test_pickle(self):
+        """
+        Testa se o registro sobrevive ao pickle, é menor que o GGA e recusa outra versão
+        """
+        payload = pickle.dumps(self.result)
+        restored = pickle.loads(payload)
+        self.assertEqual(restored.version, RESULT_VERSION)
+        self.assertEqual(restored.assignment.tolist(), self.result.assignment.tolist())
+        self.assertLess(len(payload), len(pickle.dumps(self.gga)))
+
+        state = self.result.__getstate__()
+        state['version'] = RESULT_VERSION + 1
+        with self.assertRaises(ValueError):
+            RunResult.__new__(RunResult).__setstate__(state)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import sys
+import os
+import random
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from models.container import Container
+from models.solution import Solution
+from algorithms.gga import GGA
+
+class TestSolution(unittest.TestCase):
+    """
+    Testes unitários para a solução persistente
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        self.containers = []
+        for element in [10, 20, 30, 40]:
+            container = Container(100)
+            container.add_element(element)
+            self.containers.append(container)
+        self.solution = Solution(self.containers)
+
+    def test_replace_shares_untouched_containers(self):
+        """
+        Testa se a substituição compartilha os contêineres não alterados
+        """
+        new_container = Container(100)
+        new_solution = self.solution.replace(1, new_container)
+
+        self.assertIs(new_solution[1], new_container)
+        self.assertIs(self.solution[1], self.containers[1])
+        for index in (0, 2, 3):
+            self.assertIs(new_solution[index], self.containers[index])
+
+    def test_append_and_remove(self):
+        """
+        Testa a adição e a remoção de contêineres
+        """
+        new_container = Container(100)
+        appended = self.solution.append(new_container)
+        self.assertEqual(len(appended), 5)
+        self.assertIs(appended[-1], new_container)
+
+        removed = appended.remove(0)
+        self.assertEqual(len(removed), 4)
+        self.assertIs(removed[0], new_container)
+        self.assertEqual(list(self.solution), self.containers)
+
+    def test_long_chain_matches_list(self):
+        """
+        Testa se uma longa cadeia de modificações é equivalente a uma lista comum
+        """
+        random.seed(0)
+        expected = list(self.containers)
+        solution = self.solution
+        for _ in range(200):
+            container = Container(100)
+            operation = random.random()
+            if operation < 0.4 or len(expected) < 2:
+                expected.append(container)
+                solution = solution.append(container)
+            elif operation < 0.7:
+                index = random.randrange(len(expected))
+                expected[index] = container
+                solution = solution.replace(index, container)
+            else:
+                index = random.randrange(len(expected))
+                expected[index] = expected[-1]
+                expected.pop()
+                solution = solution.remove(index)
+            self.assertEqual(len(solution), len(expected))
+        self.assertEqual(list(solution), expected)
+        self.assertEqual([solution[i] for i in range(len(solution))], expected)
+
+    def test_versions_share_base(self):
+        """
+        Testa se as versões compartilham a base, guardam apenas as alterações e são lidas sem cópia
+        """
+        new_container = Container(100)
+        derived = self.solution.replace(2, new_container).remove(0)
+
+        self.assertIs(derived[0], self.containers[3])
+        self.assertEqual(list(derived), [self.containers[3], self.containers[1], new_container])
+        self.assertIs(derived[-1], new_container)
+        self.assertEqual(derived[1:], [self.containers[1], new_container])
+        with self.assertRaises(IndexError):
+            derived[3]
+        self.assertIs(derived._base, self.solution._base)
+        self.assertEqual(len(derived._changes), 2)
+        self.assertEqual(list(self.solution), self.containers)
+
+    def test_many_changes_materialize_base(self):
+        """
+        Testa se o acúmulo de mais de MAX_CHANGES alterações materializa uma nova base
+        """
+        solution = self.solution
+        for _ in range(Solution.MAX_CHANGES + 1):
+            solution = solution.append(Container(100))
+        self.assertIsNot(solution._base, self.solution._base)
+        self.assertFalse(solution._changes)
+        self.assertEqual(len(solution), len(self.containers) + Solution.MAX_CHANGES + 1)
+        self.assertEqual(list(solution)[:4], self.containers)
+
+    def test_mutations_do_not_modify_parent(self):
+        """
+        Testa se as mutações do GGA não alteram a solução original
+        """
+        random.seed(1)
+        gga = GGA({'weights': [50, 40, 30, 30, 20, 20, 10, 70, 60, 45], 'bin_capacity': 100})
+        solution = Solution(gga.generate_initial_solution())
+        before = [list(c.elements) for c in solution]
+        for _ in range(50):
+            for mutation in (gga._swap_Mutation, gga._bitflip_Mutation, gga._gausian_Mutation,
+                             gga._insertion_Mutation):
+                mutated = mutation(solution)
+                self.assertEqual(sorted(e for c in mutated for e in c.elements),
+                                 sorted(gga.elements))
+                self.assertTrue(all(len(c) for c in mutated))
+        self.assertEqual([list(c.elements) for c in solution], before)
+
+if __name__ == '__main__':
+    unittest.main()
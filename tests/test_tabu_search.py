@@ -0,0 +1,114 @@
+import sys
+import os
+import random
+import unittest
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from algorithms.tabu_search import Tabu_Search
+from algorithms.parallel_tabu import encode_solution, decode_solution
+
+class TestTabuSearch(unittest.TestCase):
+    """
+    Testes unitários para a Busca Tabu
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        self.weights = [50, 40, 30, 30, 20, 20, 10, 70, 60, 45, 5, 15]
+        self.gga = GGA({'weights': self.weights, 'bin_capacity': 100})
+        self.solution = self.gga._bitflip_Mutation(self.gga.generate_initial_solution())
+        self.ts = Tabu_Search(self.gga, max_iterations=20, tabu_tenure=5, max_neighbors=10)
+
+    def test_delta_matches_full_fitness(self):
+        """
+        Testa se a aptidão incremental de cada vizinho é igual à aptidão recalculada
+        """
+        current_fitness = self.gga.fitness(self.solution)
+        neighbors = self.ts.generate_neighborhood(self.solution, current_fitness)
+        self.assertTrue(neighbors)
+        for move, fitness in neighbors:
+            neighbor = self.ts.apply_move(self.solution, move)
+            self.assertAlmostEqual(fitness, self.gga.fitness(neighbor))
+
+    def test_apply_move_keeps_original(self):
+        """
+        Testa se materializar um movimento não modifica a solução original
+        """
+        before = [list(c.elements) for c in self.solution]
+        move, _ = self.ts.generate_neighborhood(self.solution, self.gga.fitness(self.solution))[0]
+        self.ts.apply_move(self.solution, move)
+        self.assertEqual([list(c.elements) for c in self.solution], before)
+
+    def test_search_does_not_worsen(self):
+        """
+        Testa se a busca retorna uma solução completa e nunca pior que a inicial
+        """
+        best = self.ts.search(self.solution)
+        self.assertLessEqual(self.gga.fitness(best), self.gga.fitness(self.solution))
+        self.assertEqual(sorted(e for c in best for e in c.elements), sorted(self.weights))
+
+    def test_seeded_search_is_reproducible(self):
+        """
+        Testa se buscas com a mesma semente produzem o mesmo resultado
+        """
+        results = []
+        for _ in range(2):
+            ts = Tabu_Search(self.gga, max_iterations=20, tabu_tenure=5, max_neighbors=10, seed=42)
+            results.append(sorted(sorted(c.elements) for c in ts.search(self.solution)))
+        self.assertEqual(results[0], results[1])
+
+    def test_time_limit(self):
+        """
+        Testa se a busca com tempo esgotado retorna a solução inicial sem avaliar vizinhos
+        """
+        ts = Tabu_Search(self.gga, max_iterations=1000, tabu_tenure=5, max_neighbors=10, time_limit=0)
+        self.assertIs(ts.search(self.solution), self.solution)
+        self.assertEqual(ts.neighbors_evaluated, 0)
+
+class TestParallelTabu(unittest.TestCase):
+    """
+    Testes unitários para a Busca Tabu paralela da elite
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        self.data = {'weights': [random.randint(20, 60) for _ in range(30)], 'bin_capacity': 100,
+                     'tabu_max_iterations': 20, 'tabu_max_neighbors': 5}
+
+    def test_encode_decode(self):
+        """
+        Testa a representação compacta usada entre processos
+        """
+        gga = GGA(self.data)
+        solution = gga.generate_initial_solution()
+        decoded = decode_solution(encode_solution(solution), 100)
+        self.assertEqual([c.elements for c in decoded], [c.elements for c in solution])
+        self.assertEqual([c.used for c in decoded], [c.used for c in solution])
+
+    def test_parallel_matches_sequential(self):
+        """
+        Testa se o pool de processos produz o mesmo resultado da execução sequencial
+        """
+        results = []
+        for workers in (0, 2):
+            random.seed(7)
+            gga = GGA(dict(self.data, tabu_workers=workers, cache_size=0))
+            elite = [gga._bitflip_Mutation(gga.generate_initial_solution()) for _ in range(3)]
+            try:
+                improved = gga.improve_elite(elite)
+            finally:
+                gga.close()
+            results.append([sorted(sorted(c.elements) for c in s) for s in improved])
+        self.assertEqual(results[0], results[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+
+# Adicionar diretório Codigo ao path (os módulos usam imports relativos a ele)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Codigo')))
+
+from algorithms.gga import GGA
+from config import VISUALIZATION_CONFIG
+from utils.visualization import bin_packing_arrays, _select_bins, _draw_bins, _plotting
+import result_display
+
+class TestVisualization(unittest.TestCase):
+    """
+    Testes unitários para o gráfico de ocupação vetorizado
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para cada teste
+        """
+        random.seed(0)
+        weights = [random.randint(10, 60) for _ in range(300)]
+        self.solution = GGA({'weights': weights, 'bin_capacity': 100}).generate_initial_solution()
+        self.config = dict(VISUALIZATION_CONFIG)
+        VISUALIZATION_CONFIG.update(show_plots=False)
+
+    def tearDown(self):
+        VISUALIZATION_CONFIG.clear()
+        VISUALIZATION_CONFIG.update(self.config)
+
+    def test_stacked_bars(self):
+        """
+        Testa se as barras empilhadas reproduzem a carga de cada bin com poucas chamadas a `bar`
+        """
+        plt, _ = _plotting()
+        bins, sizes, counts = bin_packing_arrays(self.solution)
+        positions, sizes, counts, labels = _select_bins(bins, sizes, counts, len(self.solution))
+        _, ax = plt.subplots()
+        _draw_bins(ax, plt, positions, sizes, counts, labels, 100)
+        self.assertLessEqual(len(ax.containers), 10)
+
+        tops = np.zeros(len(self.solution))
+        for container in ax.containers:
+            for bar in container:
+                position = int(round(bar.get_x() + bar.get_width() / 2))
+                tops[position] = max(tops[position], bar.get_y() + bar.get_height())
+        plt.close()
+        self.assertEqual(tops.tolist(), [container.used for container in self.solution])
+
+    def test_sampled_bins(self):
+        """
+        Testa se, com muitos bins, apenas uma amostra é desenhada
+        """
+        VISUALIZATION_CONFIG.update(max_plotted_bins=10)
+        bins, sizes, counts = bin_packing_arrays(self.solution)
+        positions, sizes, counts, labels = _select_bins(bins, sizes, counts, len(self.solution))
+        self.assertEqual(len(labels), 10)
+        self.assertEqual((labels[0], labels[-1]), (1, len(self.solution)))
+        self.assertEqual(set(positions.tolist()), set(range(10)))
+
+    def test_background_rendering(self):
+        """
+        Testa se os gráficos gravados em segundo plano são concluídos por `wait_for_plots`
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            VISUALIZATION_CONFIG.update(save_plots=True, background_plots=True, plots_directory=directory)
+            result_display.display_solution('inst.txt', self.solution, 0.1)
+            result_display.wait_for_plots()
+            self.assertTrue(os.path.exists(os.path.join(directory, 'inst_bin_packing.png')))
+
+if __name__ == '__main__':
+    unittest.main()